@@ -0,0 +1,299 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Queue benchmarks
+
+    Throughput of ``FIFOQueue``, ``LIFOQueue`` and ``DEQueue`` compared
+    with ``collections.deque``, ``queue.Queue`` and ``list``.
+
+    Standard library only. Results are reported in nanoseconds per
+    element, can be saved as a JSON baseline, and later runs compared
+    against it, failing when slower than a regression threshold.
+
+    .. code:: console
+
+        $ python benchmarks/bench_queues.py --save baseline.json
+        $ python benchmarks/bench_queues.py --compare baseline.json
+
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import deque
+from collections.abc import Callable
+from functools import reduce
+from operator import add
+from queue import Queue
+from typing import Any
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+
+type Bench = Callable[[int], Callable[[], object] | None]
+
+QUEUES = ('FIFOQueue', 'LIFOQueue', 'DEQueue')
+BASELINES = ('deque', 'Queue', 'list')
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _make(kind: str, n: int) -> Any:
+    data = range(n)
+    match kind:
+        case 'FIFOQueue':
+            return FIFOQueue(data)
+        case 'LIFOQueue':
+            return LIFOQueue(data)
+        case 'DEQueue':
+            return DEQueue(data)
+        case 'deque':
+            return deque(data)
+        case 'Queue':
+            q: Queue[int] = Queue()
+            for d in data:
+                q.put(d)
+            return q
+        case 'list':
+            return list(data)
+    raise ValueError(f'unknown container {kind}')
+
+
+def _push_pop_fns(kind: str, q: Any) -> tuple[Callable[[int], None], Callable[[], int]]:
+    # list and LIFOQueue used as stacks, everything else FIFO
+    match kind:
+        case 'FIFOQueue' | 'LIFOQueue':
+            return q.push, q.try_pop
+        case 'DEQueue':
+            return q.pushr, q.try_popl
+        case 'deque':
+            return q.append, q.popleft
+        case 'Queue':
+            return q.put_nowait, q.get_nowait
+        case 'list':
+            return q.append, q.pop
+    raise ValueError(f'unknown container {kind}')
+
+
+def bench_steady(kind: str) -> Bench:
+    """Push then pop n times on a queue holding n items."""
+
+    def setup(n: int) -> Callable[[], object]:
+        push, pop = _push_pop_fns(kind, _make(kind, n))
+
+        def run() -> None:
+            for ii in range(n):
+                push(ii)
+                pop()
+
+        return run
+
+    return setup
+
+
+def bench_burst(kind: str) -> Bench:
+    """Grow an empty queue to n items, then drain it."""
+
+    def setup(n: int) -> Callable[[], object]:
+        def run() -> None:
+            push, pop = _push_pop_fns(kind, _make(kind, 0))
+            for ii in range(n):
+                push(ii)
+            for _ in range(n):
+                pop()
+
+        return run
+
+    return setup
+
+
+def bench_iter(kind: str) -> Bench:
+    """Iterate over all n items."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        q = _make(kind, n)
+        return lambda: sum(q)
+
+    return setup
+
+
+def bench_fold(kind: str) -> Bench:
+    """Reduce all n items with addition."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        q = _make(kind, n)
+        if kind in QUEUES:
+            if kind == 'DEQueue':
+                return lambda: q.foldl(add)
+            return lambda: q.fold(add)
+        return lambda: reduce(add, q)
+
+    return setup
+
+
+def bench_map(kind: str) -> Bench:
+    """Map a function over all n items into a new container."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        q = _make(kind, n)
+        if kind in QUEUES:
+            return lambda: q.map(_inc)
+        cls = type(q)
+        return lambda: cls(map(_inc, q))
+
+    return setup
+
+
+def bench_copy(kind: str) -> Bench:
+    """Shallow copy a container of n items."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        return _make(kind, n).copy
+
+    return setup
+
+
+def bench_eq(kind: str) -> Bench:
+    """Compare two equal containers of n items."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        q1, q2 = _make(kind, n), _make(kind, n)
+        return lambda: q1 == q2
+
+    return setup
+
+
+def bench_repr(kind: str) -> Bench:
+    """Construct the repr of a container of n items."""
+
+    def setup(n: int) -> Callable[[], object] | None:
+        if kind == 'Queue':
+            return None
+        return _make(kind, n).__repr__
+
+    return setup
+
+
+BENCHMARKS: dict[str, Callable[[str], Bench]] = {
+    'steady': bench_steady,
+    'burst': bench_burst,
+    'iter': bench_iter,
+    'fold': bench_fold,
+    'map': bench_map,
+    'copy': bench_copy,
+    'eq': bench_eq,
+    'repr': bench_repr,
+}
+
+
+def measure(fn: Callable[[], object], n: int, repeat: int) -> float:
+    """Best of ``repeat`` runs, in nanoseconds per element."""
+    number = max(1, 100_000 // n)
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return best / number / n * 1e9
+
+
+def run(
+    names: list[str], kinds: list[str], sizes: list[int], repeat: int
+) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name in names:
+        for n in sizes:
+            row = []
+            for kind in kinds:
+                if (fn := BENCHMARKS[name](kind)(n)) is None:
+                    row.append(f'{kind}=-')
+                    continue
+                ns = measure(fn, n, repeat)
+                results[f'{name}/{kind}/{n}'] = ns
+                row.append(f'{kind}={ns:.1f}')
+            print(f'{name:>6} {n:>9}  ' + '  '.join(row))
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    regressions = []
+    for key, ns in sorted(results.items()):
+        if (base := baseline.get(key)) is None:
+            continue
+        if (ratio := ns / base) > 1.0 + threshold:
+            regressions.append(f'{key}: {base:.1f} -> {ns:.1f} ns/elem ({ratio:.2f}x)')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Queue throughput benchmarks')
+    parser.add_argument(
+        '--sizes',
+        type=lambda s: [int(float(x)) for x in s.split(',')],
+        default=[1_000, 10_000, 100_000],
+        help='comma separated element counts, e.g. 1e3,1e5,1e7',
+    )
+    parser.add_argument(
+        '--bench', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument(
+        '--queues-only', action='store_true', help='skip stdlib baselines'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', metavar='JSON', help='save results as a baseline')
+    parser.add_argument(
+        '--compare', metavar='JSON', help='compare against a saved baseline'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='fractional slowdown counted as a regression, default 0.10',
+    )
+    args = parser.parse_args(argv)
+
+    kinds = list(QUEUES) if args.queues_only else list(QUEUES + BASELINES)
+    print(f'Python {platform.python_version()}, ns per element, best of {args.repeat}')
+    results = run(args.bench, kinds, args.sizes, args.repeat)
+
+    if args.save:
+        meta = {'python': platform.python_version(), 'machine': platform.machine()}
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if regressions := compare(results, baseline, args.threshold):
+            print(f'\n{len(regressions)} regressions over {args.threshold:.0%}:')
+            print('\n'.join(regressions))
+            return 1
+        print(f'\nno regressions over {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Thread scaling benchmarks
+
+    Total push/pop throughput as threads are added, 1 to N. Meant to
+    be run on both standard and free-threaded interpreters.
+
+    Standard library only. Results are reported in millions of
+    operations per second, a push and a pop counting as one.
+
+    .. code:: console
+
+        $ python3.14t benchmarks/bench_scaling.py --threads 1,2,4,8
+        $ python3.14t benchmarks/bench_scaling.py --save scaling.json
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pythonic_fp.queues.concurrent import ConcurrentFIFOQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.sharded import ShardedFIFOQueue
+
+type Worker = Callable[[int], None]
+type Mode = Callable[[int], list[Worker]]
+type Queue = FIFOQueue[int] | ConcurrentFIFOQueue[int] | ShardedFIFOQueue[int]
+
+
+def _worker(q: Queue) -> Worker:
+    def work(ops: int) -> None:
+        push, pop = q.push, q.pop
+        for ii in range(ops):
+            push(ii)
+            pop()
+
+    return work
+
+
+def mode_shared(threads: int) -> list[Worker]:
+    """All threads push and pop on one ConcurrentFIFOQueue."""
+    cq: ConcurrentFIFOQueue[int] = ConcurrentFIFOQueue()
+    return [_worker(cq) for _ in range(threads)]
+
+
+def mode_sharded(threads: int) -> list[Worker]:
+    """All threads push and pop on one ShardedFIFOQueue, a lane per thread."""
+    sq: ShardedFIFOQueue[int] = ShardedFIFOQueue(threads)
+    return [_worker(sq) for _ in range(threads)]
+
+
+def mode_per_thread(threads: int) -> list[Worker]:
+    """Each thread has its own ConcurrentFIFOQueue, locks never contended."""
+    return [_worker(ConcurrentFIFOQueue[int]()) for _ in range(threads)]
+
+
+def mode_owned(threads: int) -> list[Worker]:
+    """Each thread has its own unsynchronized FIFOQueue."""
+    return [_worker(FIFOQueue[int]()) for _ in range(threads)]
+
+
+MODES: dict[str, Mode] = {
+    'shared': mode_shared,
+    'sharded': mode_sharded,
+    'per-thread': mode_per_thread,
+    'owned': mode_owned,
+}
+
+
+def measure(mode: Mode, threads: int, ops: int, repeat: int) -> float:
+    """Best of ``repeat`` runs, in millions of operations per second."""
+    best = float('inf')
+    for _ in range(repeat):
+        workers = mode(threads)
+        barrier = threading.Barrier(threads + 1)
+
+        def run(work: Worker) -> None:
+            barrier.wait()
+            work(ops)
+
+        pool = [threading.Thread(target=run, args=(w,)) for w in workers]
+        for thread in pool:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in pool:
+            thread.join()
+        best = min(best, time.perf_counter() - start)
+    return threads * ops / best / 1e6
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is enabled, always true before Python 3.13."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def main(argv: list[str] | None = None) -> int:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Thread scaling benchmarks')
+    parser.add_argument(
+        '--threads',
+        type=lambda s: [int(x) for x in s.split(',')],
+        default=sorted({1, 2, 4, cpus}),
+        help='comma separated thread counts, default 1,2,4 and the CPU count',
+    )
+    parser.add_argument('--mode', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument(
+        '--ops', type=int, default=100_000, help='operations per thread'
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', metavar='JSON', help='save results')
+    args = parser.parse_args(argv)
+
+    gil = 'enabled' if gil_enabled() else 'disabled'
+    print(
+        f'Python {platform.python_version()}, GIL {gil}, {cpus} CPUs,'
+        f' Mops/s total, best of {args.repeat}'
+    )
+    results: dict[str, float] = {}
+    for name in args.mode:
+        row, base = [], 0.0
+        for threads in args.threads:
+            mops = measure(MODES[name], threads, args.ops, args.repeat)
+            base = base or mops
+            results[f'{name}/{threads}'] = mops
+            row.append(f'{threads}={mops:.2f} ({mops / base:.1f}x)')
+        print(f'{name:>10}  ' + '  '.join(row))
+
+    if args.save:
+        meta = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'gil': gil,
+            'cpus': cpus,
+        }
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
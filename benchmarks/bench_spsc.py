@@ -0,0 +1,191 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Thread hand-off benchmarks
+
+    Throughput of handing items from one producer thread to one
+    consumer thread through ``SPSCFIFOQueue``, ``queue.SimpleQueue``
+    and a lock protected ``FIFOQueue``, that is ``ConcurrentFIFOQueue``.
+
+    Standard library only. Results are reported in nanoseconds per
+    item handed off, and share the JSON baselines of ``bench_queues``.
+
+    .. code:: console
+
+        $ python benchmarks/bench_spsc.py --save spsc.json
+        $ python benchmarks/bench_spsc.py --compare spsc.json
+
+"""
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from collections.abc import Callable
+from queue import SimpleQueue
+from bench_queues import compare
+from pythonic_fp.queues.concurrent import ConcurrentFIFOQueue
+from pythonic_fp.queues.spsc import SPSCFIFOQueue
+
+type Handoff = Callable[[int, int, int], None]
+
+_DONE = -1
+
+
+def handoff_spsc(n: int, capacity: int, batch: int) -> None:
+    """One item per push and pop."""
+    sq: SPSCFIFOQueue[int] = SPSCFIFOQueue(capacity)
+
+    def produce() -> None:
+        push = sq.push
+        for ii in range(n):
+            push(ii)
+        push(_DONE)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    pop_or = sq.pop_or
+    while pop_or(None, True) != _DONE:
+        pass
+    producer.join()
+
+
+def handoff_spsc_batched(n: int, capacity: int, batch: int) -> None:
+    """Batches published with one push and consumed with one pop_many."""
+    sq: SPSCFIFOQueue[int] = SPSCFIFOQueue(capacity)
+
+    def produce() -> None:
+        push = sq.push
+        for lo in range(0, n, batch):
+            push(*range(lo, min(lo + batch, n)))
+        push(_DONE)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    pop_many = sq.pop_many
+    while (items := pop_many(batch, True)) == () or items[-1] != _DONE:
+        pass
+    producer.join()
+
+
+def handoff_simple(n: int, capacity: int, batch: int) -> None:
+    """Unbounded queue.SimpleQueue, one item per put and get."""
+    sq: SimpleQueue[int] = SimpleQueue()
+
+    def produce() -> None:
+        put = sq.put
+        for ii in range(n):
+            put(ii)
+        put(_DONE)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    get = sq.get
+    while get() != _DONE:
+        pass
+    producer.join()
+
+
+def handoff_locked(n: int, capacity: int, batch: int) -> None:
+    """ConcurrentFIFOQueue bounded by capacity, one item per push and pop."""
+    cq: ConcurrentFIFOQueue[int] = ConcurrentFIFOQueue(maxsize=capacity)
+
+    def produce() -> None:
+        push = cq.push
+        for ii in range(n):
+            push(ii)
+        push(_DONE)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    pop = cq.pop
+    while pop(True).get() != _DONE:
+        pass
+    producer.join()
+
+
+HANDOFFS: dict[str, Handoff] = {
+    'SPSCFIFOQueue': handoff_spsc,
+    'SPSCFIFOQueue/batched': handoff_spsc_batched,
+    'SimpleQueue': handoff_simple,
+    'ConcurrentFIFOQueue': handoff_locked,
+}
+
+
+def measure(fn: Handoff, n: int, capacity: int, batch: int, repeat: int) -> float:
+    """Best of ``repeat`` runs, in nanoseconds per item."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(n, capacity, batch)
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1e9
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Thread hand-off benchmarks')
+    parser.add_argument(
+        '--sizes',
+        type=lambda s: [int(float(x)) for x in s.split(',')],
+        default=[10_000, 100_000],
+        help='comma separated item counts, e.g. 1e4,1e6',
+    )
+    parser.add_argument('--capacity', type=int, default=1024)
+    parser.add_argument('--batch', type=int, default=64)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', metavar='JSON', help='save results as a baseline')
+    parser.add_argument(
+        '--compare', metavar='JSON', help='compare against a saved baseline'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='fractional slowdown counted as a regression, default 0.10',
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f'Python {platform.python_version()}, ns per item, best of {args.repeat},'
+        f' capacity {args.capacity}, batch {args.batch}'
+    )
+    results: dict[str, float] = {}
+    for n in args.sizes:
+        row = []
+        for kind, fn in HANDOFFS.items():
+            ns = measure(fn, n, args.capacity, args.batch, args.repeat)
+            results[f'handoff/{kind}/{n}'] = ns
+            row.append(f'{kind}={ns:.1f}')
+        print(f'handoff {n:>9}  ' + '  '.join(row))
+
+    if args.save:
+        meta = {'python': platform.python_version(), 'machine': platform.machine()}
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if regressions := compare(results, baseline, args.threshold):
+            print(f'\n{len(regressions)} regressions over {args.threshold:.0%}:')
+            print('\n'.join(regressions))
+            return 1
+        print(f'\nno regressions over {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Back off helper
+
+    Polling wait for the lock free queues, which have no condition
+    variable to sleep on. Private to the queues.
+
+"""
+
+import time
+from collections.abc import Callable
+
+__all__: list[str] = []
+
+
+def _poll(ready: Callable[[], bool], block: bool, timeout: float | None) -> bool:
+    # Poll until ready, sleeping from 1 microsecond doubling up to 1 millisecond.
+    if ready():
+        return True
+    if not block:
+        return False
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 1e-6
+    while not ready():
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(2 * delay, 1e-3)
+    return True
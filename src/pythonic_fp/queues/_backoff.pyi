@@ -0,0 +1,5 @@
+from collections.abc import Callable
+
+__all__: list[str] = []
+
+def _poll(ready: Callable[[], bool], block: bool, timeout: float | None) -> bool: ...
@@ -0,0 +1,87 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: NumPy interop helpers
+
+    Block conversions between queue storage and NumPy arrays. NumPy is
+    an optional extra, imported only when one of these is first used.
+    Private to the queues.
+
+"""
+
+from array import array
+from collections.abc import Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+__all__: list[str] = []
+
+
+def _numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as exc:
+        msg = 'NumPy interop needs numpy, install pythonic-fp-queues[numpy]'
+        raise ImportError(msg) from exc
+    return numpy
+
+
+def _check_1d(name: str, arr: 'NDArray[Any]') -> None:
+    if arr.ndim != 1:
+        msg = f'{name} expects a one dimensional array, got {arr.ndim} dimensions'
+        raise ValueError(msg)
+
+
+def _ndarray_items(name: str, arr: 'NDArray[Any]') -> list[Any]:
+    # Python scalars in one C level pass, not NumPy scalars one at a time.
+    arr = _numpy().asarray(arr)
+    _check_1d(name, arr)
+    return list(arr.tolist())
+
+
+def _ndarray_to_array(name: str, arr: 'NDArray[Any]', typecode: str) -> 'array[Any]':
+    # Block copy into an array.array, casting with NumPy's same_kind rule.
+    np = _numpy()
+    arr = np.asarray(arr)
+    _check_1d(name, arr)
+    arr = arr.astype(np.dtype(typecode), casting='same_kind', copy=False)
+    arr = np.ascontiguousarray(arr)
+    items = array(typecode)
+    items.frombytes(memoryview(arr).cast('B'))
+    return items
+
+
+def _items_to_ndarray(
+    items: Sequence[Any], dtype: 'DTypeLike | None', reverse: bool = False
+) -> 'NDArray[Any]':
+    # Boxed items, converted by NumPy in one pass.
+    np = _numpy()
+    out = np.array(items, dtype=dtype)
+    return cast('NDArray[Any]', out[::-1].copy() if reverse else out)
+
+
+def _array_to_ndarray(
+    items: 'array[Any]', dtype: 'DTypeLike | None', reverse: bool = False
+) -> 'NDArray[Any]':
+    # Wraps an array.array already copied out of a ring, copied again
+    # only to reverse or convert it.
+    np = _numpy()
+    out = np.frombuffer(items, dtype=np.dtype(items.typecode))
+    if reverse:
+        out = out[::-1]
+    return cast('NDArray[Any]', np.ascontiguousarray(out, dtype=dtype))
@@ -0,0 +1,17 @@
+from array import array
+from collections.abc import Sequence
+from numpy.typing import DTypeLike, NDArray
+from types import ModuleType
+from typing import Any
+
+__all__: list[str] = []
+
+def _numpy() -> ModuleType: ...
+def _ndarray_items(name: str, arr: NDArray[Any]) -> list[Any]: ...
+def _ndarray_to_array(name: str, arr: NDArray[Any], typecode: str) -> array[Any]: ...
+def _items_to_ndarray(
+    items: Sequence[Any], dtype: DTypeLike | None, reverse: bool = False
+) -> NDArray[Any]: ...
+def _array_to_ndarray(
+    items: array[Any], dtype: DTypeLike | None, reverse: bool = False
+) -> NDArray[Any]: ...
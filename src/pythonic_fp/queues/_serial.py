@@ -0,0 +1,97 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Queue serialization helpers
+
+    Framing for the queues' ``to_bytes`` and ``from_bytes`` checkpoints.
+    Private to the queues.
+
+    Each checkpoint starts with a 5 byte header,
+
+    - the magic bytes ``b'PFQ'``
+    - a format version, currently 1
+    - a byte identifying the kind of queue
+
+    followed by the kind specific payload.
+
+"""
+
+import pickle
+from collections.abc import Buffer
+from typing import Any, Final
+from pythonic_fp.queues.overflow import Overflow
+
+__all__: list[str] = []
+
+_MAGIC: Final = b'PFQ'
+_VERSION: Final = 1
+_HEADER: Final = len(_MAGIC) + 2
+
+# Queue kinds, lower case for typed queues.
+_KIND_FIFO: Final = b'F'
+_KIND_LIFO: Final = b'L'
+_KIND_DE: Final = b'D'
+_KIND_TYPED_FIFO: Final = b'f'
+_KIND_TYPED_LIFO: Final = b'l'
+_KIND_TYPED_DE: Final = b'd'
+
+# Pickled state of the core queues: items in storage order, maxlen,
+# overflow policy, growth factor and shrink fraction.
+type _QueueState[D] = tuple[list[D], int | None, Overflow, float, float | None]
+
+# Releases up to 5.1.4 pickled the core queues' __slots__ by default,
+# as (None, {'_ca': storage}).
+type _LegacyState = tuple[None, dict[str, Any]]
+
+
+def _upgrade_state[D](state: _QueueState[D] | _LegacyState) -> _QueueState[D]:
+    # Legacy storage holds the items in the same order as the current
+    # state, with the default configuration of an unbounded queue.
+    if state[0] is None:
+        return list(state[1]['_ca']), None, Overflow.DROP_OLDEST, 2.0, None
+    return state
+
+
+def _encode(kind: bytes, payload: bytes) -> bytes:
+    return _MAGIC + bytes((_VERSION,)) + kind + payload
+
+
+def _decode(name: str, kind: bytes, data: Buffer) -> memoryview:
+    # Validate the header, returning a view of the payload.
+    view = memoryview(data).cast('B')
+    if len(view) < _HEADER or view[: len(_MAGIC)] != _MAGIC:
+        msg = f'{name}.from_bytes given data not produced by to_bytes'
+        raise ValueError(msg)
+    if (version := view[len(_MAGIC)]) > _VERSION:
+        msg = f'{name}.from_bytes given format version {version}, newer than {_VERSION}'
+        raise ValueError(msg)
+    if (found := bytes(view[len(_MAGIC) + 1 : _HEADER])) != kind:
+        msg = f'{name}.from_bytes given data for another kind of queue, {found!r}'
+        raise ValueError(msg)
+    return view[_HEADER:]
+
+
+def _dump_state(kind: bytes, state: tuple[Any, ...]) -> bytes:
+    return _encode(kind, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _load_state(name: str, kind: bytes, data: Buffer) -> tuple[Any, ...]:
+    state = pickle.loads(_decode(name, kind, data))
+    if not isinstance(state, tuple):
+        # Bad checkpoint data, not a bad argument type, so this stays the
+        # ValueError documented by every from_bytes.
+        msg = f'{name}.from_bytes given a malformed payload'
+        raise ValueError(msg)  # noqa: TRY004
+    return state
@@ -0,0 +1,21 @@
+from collections.abc import Buffer
+from pythonic_fp.queues.overflow import Overflow
+from typing import Any, Final
+
+__all__: list[str] = []
+
+_KIND_FIFO: Final[bytes]
+_KIND_LIFO: Final[bytes]
+_KIND_DE: Final[bytes]
+_KIND_TYPED_FIFO: Final[bytes]
+_KIND_TYPED_LIFO: Final[bytes]
+_KIND_TYPED_DE: Final[bytes]
+
+type _QueueState[D] = tuple[list[D], int | None, Overflow, float, float | None]
+type _LegacyState = tuple[None, dict[str, Any]]
+
+def _encode(kind: bytes, payload: bytes) -> bytes: ...
+def _decode(name: str, kind: bytes, data: Buffer) -> memoryview: ...
+def _dump_state(kind: bytes, state: tuple[Any, ...]) -> bytes: ...
+def _load_state(name: str, kind: bytes, data: Buffer) -> tuple[Any, ...]: ...
+def _upgrade_state[D](state: _QueueState[D] | _LegacyState) -> _QueueState[D]: ...
@@ -0,0 +1,107 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Queue storage helpers
+
+    Bulk access to, and in place transforms of, the storage of a ``CA``,
+    working on its buffer directly instead of going through the ``CA``
+    one item at a time. Private to the queues.
+
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any, cast
+from pythonic_fp.circulararray.auto import CA
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+__all__: list[str] = []
+
+_empty = NoValue()  # the CA's empty slot sentinel, NoValue is a singleton
+
+
+def _ca_items[D](ca: CA[D]) -> list[D]:
+    # Contents of ca front to rear, copied with at most two slices.
+    c = cast(Any, ca)
+    if (cnt := c._cnt) == 0:
+        return []
+    xs, front, cap = c._xs, c._front, c._cap
+    if (end := front + cnt) <= cap:
+        return cast(list[D], xs[front:end])
+    return cast(list[D], xs[front:] + xs[: end - cap])
+
+
+def _ca_iter[D](ca: CA[D], reverse: bool = False) -> Iterator[D]:
+    # Items of ca read straight from its buffer, front to rear unless
+    # reversed. Callers must not resume it after mutating ca.
+    c = cast(Any, ca)
+    xs, cap, cnt = c._xs, c._cap, len(ca)
+    base, step = (c._front + cnt - 1, -1) if reverse else (c._front, 1)
+    for ii in range(cnt):
+        yield xs[(base + step * ii) % cap]
+
+
+def _ca_clone[D](ca: CA[D]) -> CA[D]:
+    # Clone ca's storage buffer as is, capacity included.
+    c, new = cast(Any, ca), cast(Any, CA())
+    new._xs, new._cnt, new._cap = c._xs.copy(), c._cnt, c._cap
+    new._front, new._rear = c._front, c._rear
+    return cast(CA[D], new)
+
+
+def _ca_adopt[D](items: list[D], capacity: int = 0) -> CA[D]:
+    # CA taking ownership of the items list, front to rear, instead of
+    # copying it. Padded with empty slots to capacity, at least 2 of them.
+    cnt, ca = len(items), cast(Any, CA())
+    xs = cast(list[Any], items)
+    xs += [_empty] * max(2, capacity - cnt)
+    ca._xs, ca._cnt, ca._cap = xs, cnt, len(xs)
+    ca._front, ca._rear = 0, (cnt - 1) % len(xs)
+    return cast(CA[D], ca)
+
+
+def _ca_map_inplace[D](ca: CA[D], f: Callable[[D], D], reverse: bool = False) -> None:
+    # Replace each item d of ca with f(d), front to rear unless reversed.
+    c = cast(Any, ca)
+    xs, cap, cnt = c._xs, c._cap, len(ca)
+    base, step = (c._front + cnt - 1, -1) if reverse else (c._front, 1)
+    for ii in range(cnt):
+        jj = (base + step * ii) % cap
+        xs[jj] = f(xs[jj])
+
+
+def _ca_retain[D](ca: CA[D], pred: Callable[[D], bool], reverse: bool = False) -> int:
+    # Keep items satisfying pred, in order, compacting towards the front,
+    # or the rear if reversed. Returns the number of items removed. If
+    # pred raises, the items not yet examined are kept.
+    c = cast(Any, ca)
+    xs, cap, cnt = c._xs, c._cap, len(ca)
+    base, step = (c._front + cnt - 1, -1) if reverse else (c._front, 1)
+    read = write = 0
+    try:
+        while read < cnt:
+            d = xs[(base + step * read) % cap]
+            if pred(d):
+                xs[(base + step * write) % cap] = d
+                write += 1
+            read += 1
+    finally:
+        while read < cnt:
+            xs[(base + step * write) % cap] = xs[(base + step * read) % cap]
+            write += 1
+            read += 1
+        trim = ca.popl if reverse else ca.popr
+        for _ in range(cnt - write):
+            trim()
+    return cnt - write
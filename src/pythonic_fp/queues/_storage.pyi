@@ -0,0 +1,15 @@
+from collections.abc import Callable, Iterator
+from pythonic_fp.circulararray.auto import CA
+
+__all__: list[str] = []
+
+def _ca_items[D](ca: CA[D]) -> list[D]: ...
+def _ca_iter[D](ca: CA[D], reverse: bool = False) -> Iterator[D]: ...
+def _ca_clone[D](ca: CA[D]) -> CA[D]: ...
+def _ca_adopt[D](items: list[D], capacity: int = 0) -> CA[D]: ...
+def _ca_map_inplace[D](
+    ca: CA[D], f: Callable[[D], D], reverse: bool = False
+) -> None: ...
+def _ca_retain[D](
+    ca: CA[D], pred: Callable[[D], bool], reverse: bool = False
+) -> int: ...
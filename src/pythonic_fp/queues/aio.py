@@ -0,0 +1,927 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Asyncio queues
+
+    FIFO, LIFO and double-ended queues for use within a single
+    ``asyncio`` event loop, stored in the same auto-resizing
+    circular arrays as ``FIFOQueue``, ``LIFOQueue`` and ``DEQueue``.
+
+    - pops are awaitable and return a ``MayBe``
+    - optional ``maxsize``, pushes are then awaitable
+    - waiting coroutines woken directly through futures
+    - ``async for`` consumes the queue until it is shut down
+
+    .. warning::
+
+        Not thread safe, use only from coroutines and callbacks
+        running on the event loop.
+
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import cast, overload
+from pythonic_fp.circulararray.auto import CA
+from pythonic_fp.fptools.function import swap
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['AsyncFIFOQueue', 'AsyncLIFOQueue', 'AsyncDEQueue']
+
+
+def _wake_next(waiters: deque[asyncio.Future[None]]) -> None:
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+class _AsyncQueue[D]:
+    """Waiter bookkeeping shared by the asyncio queues."""
+
+    __slots__ = ('_ca', '_maxsize', '_getters', '_putters', '_shut_down')
+
+    def __init__(
+        self, ds: tuple[Iterable[D], ...], maxsize: int | None, name: str
+    ) -> None:
+        if (size := len(ds)) > 1:
+            msg = f'{name} expects at most 1 iterable argument, got {size}'
+            raise ValueError(msg)
+        if maxsize is not None and maxsize < 1:
+            msg = f'maxsize must be a positive integer, got {maxsize}'
+            raise ValueError(msg)
+        self._ca: CA[D] = CA(ds[0]) if size == 1 else CA()
+        self._maxsize = maxsize
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        self._shut_down = False
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            Truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._ca) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the queue.
+
+        """
+        return len(self._ca)
+
+    @property
+    def maxsize(self) -> int | None:
+        """
+        .. admonition:: Maximum size
+
+            Maximum number of items the queue holds, ``None`` if unbounded.
+
+        """
+        return self._maxsize
+
+    @property
+    def shut_down(self) -> bool:
+        """
+        .. admonition:: Shut down
+
+            ``True`` once ``shutdown`` has been called.
+
+        """
+        return self._shut_down
+
+    def shutdown(self) -> None:
+        """
+        .. admonition:: Shut down
+
+            Stop accepting pushes. Waiting pops return an empty
+            ``MayBe`` once the queue drains, waiting pushes raise
+            ``asyncio.QueueShutDown``.
+
+        """
+        self._shut_down = True
+        for waiters in self._getters, self._putters:
+            while waiters:
+                _wake_next(waiters)
+
+    def _room_for(self, n: int) -> bool:
+        if self._shut_down:
+            raise asyncio.QueueShutDown
+        if (maxsize := self._maxsize) is None:
+            return True
+        if n > maxsize:
+            msg = f'cannot push {n} items onto a queue with maxsize {maxsize}'
+            raise ValueError(msg)
+        return len(self._ca) + n <= maxsize
+
+    def _pushed(self, n: int) -> None:
+        for _ in range(n):
+            if not self._getters:
+                break
+            _wake_next(self._getters)
+
+    def _popped(self) -> None:
+        # Putters may wait on different amounts of room, wake them all
+        # and let each re-check whether its items now fit.
+        while self._putters:
+            _wake_next(self._putters)
+
+    async def _wait(
+        self,
+        waiters: deque[asyncio.Future[None]],
+        front: bool,
+        ready: Callable[[], bool],
+    ) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        if front:
+            waiters.appendleft(waiter)
+        else:
+            waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiter.cancelled() and ready():
+                _wake_next(waiters)
+            raise
+
+    async def _wait_for_items(self, timeout: float | None) -> bool:
+        if self._ca:
+            return True
+
+        def ready() -> bool:
+            return len(self._ca) > 0
+
+        try:
+            async with asyncio.timeout(timeout):
+                front = False
+                while not self._ca:
+                    if self._shut_down:
+                        return False
+                    await self._wait(self._getters, front, ready)
+                    front = True
+        except TimeoutError:
+            return False
+        return True
+
+    async def _wait_for_room(self, n: int, timeout: float | None) -> bool:
+        if self._room_for(n):
+            return True
+
+        def ready() -> bool:
+            return self._maxsize is None or len(self._ca) + n <= self._maxsize
+
+        try:
+            async with asyncio.timeout(timeout):
+                while not self._room_for(n):
+                    await self._wait(self._putters, False, ready)
+        except TimeoutError:
+            return False
+        return True
+
+
+class AsyncFIFOQueue[D](_AsyncQueue[D]):
+    """
+    .. admonition:: AsyncFIFOQueue
+
+        Asyncio First-In-First-Out (FIFO) Queue data structure.
+
+        - awaitable ``pop``, non-blocking ``pop_nowait``
+        - awaitable ``push`` when bounded, non-blocking ``push_nowait``
+        - ``async for`` pops items until shut down and drained
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``AsyncFIFOQueue`` with 0 or 1 iterables
+            to populate the queue in natural FIFO order.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided
+                            or ``maxsize`` is not positive.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(ds, maxsize, 'AsyncFIFOQueue')
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is an ``AsyncFIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, AsyncFIFOQueue):
+            return False
+        return self._ca == other._ca
+
+    def __aiter__(self) -> 'AsyncFIFOQueue[D]':
+        """
+        .. admonition:: Asynchronous iteration
+
+            Consume the ``AsyncFIFOQueue`` in natural FIFO order,
+            waiting for more items until the queue is shut down.
+
+        """
+        return self
+
+    async def __anext__(self) -> D:
+        """
+        .. admonition:: Asynchronous next
+
+            Wait for and pop the oldest data item.
+
+        :raises StopAsyncIteration: When shut down and drained.
+
+        """
+        if mb := await self.pop():
+            return mb.get()
+        raise StopAsyncIteration
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'AsyncFIFOQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``AsyncFIFOQueue``.
+
+        """
+        return 'AsyncFIFOQueue(' + ', '.join(map(repr, self._ca)) + ')'
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``AsyncFIFOQueue`` in natural FIFO order.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        return tuple(self._ca)
+
+    def push_nowait(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push without waiting
+
+            Push data items onto ``AsyncFIFOQueue`` if there is
+            room for all of them.
+
+        :param ds: Items to be pushed onto ``AsyncFIFOQueue``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not self._room_for(len(ds)):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    async def push(self, *ds: D, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``AsyncFIFOQueue``, when bounded
+            first waiting for room for all of them.
+
+        :param ds: Items to be pushed onto ``AsyncFIFOQueue``.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` on timeout.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not await self._wait_for_room(len(ds), timeout):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    def pop_nowait(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop without waiting
+
+            Pop oldest data item off of ``AsyncFIFOQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``AsyncFIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            d = self._ca.popl()
+            self._popped()
+            return MayBe(d)
+        return MayBe()
+
+    async def pop(self, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Wait for and pop oldest data item off of ``AsyncFIFOQueue``.
+
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item, empty ``MayBe`` on timeout
+                  or if queue was shut down and is empty.
+
+        """
+        if await self._wait_for_items(timeout):
+            return self.pop_nowait()
+        return MayBe()
+
+    def peak_last_in(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last
+
+            Peak at newest item on ``AsyncFIFOQueue``.
+
+        :returns: ``MayBe`` of newest item on ``AsyncFIFOQueue``,
+                  empty ``MayBe`` if ``AsyncFIFOQueue`` empty.
+
+        """
+        if self._ca:
+            return MayBe(self._ca[-1])
+        return MayBe()
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at oldest data item on ``AsyncFIFOQueue``.
+
+        :returns: ``MayBe`` of oldest item on ``AsyncFIFOQueue``,
+                  empty ``MayBe`` if ``AsyncFIFOQueue`` empty.
+
+        """
+        if self._ca:
+            return MayBe(self._ca[0])
+        return MayBe()
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``AsyncFIFOQueue`` in natural FIFO Order, oldest to newest.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``AsyncFIFOQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self._ca:
+                return MayBe()
+            return MayBe(cast(T, self._ca.foldl(cast(Callable[[D, D], D], f))))  # T = D
+        return MayBe(self._ca.foldl(f, start))
+
+
+class AsyncLIFOQueue[D](_AsyncQueue[D]):
+    """
+    .. admonition:: AsyncLIFOQueue
+
+        Asyncio Last-In-First-Out (LIFO) Queue data structure.
+
+        - awaitable ``pop``, non-blocking ``pop_nowait``
+        - awaitable ``push`` when bounded, non-blocking ``push_nowait``
+        - ``async for`` pops items until shut down and drained
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``AsyncLIFOQueue`` with 0 or 1 iterables
+            to populate the queue in natural LIFO order.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided
+                            or ``maxsize`` is not positive.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(ds, maxsize, 'AsyncLIFOQueue')
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is an ``AsyncLIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, AsyncLIFOQueue):
+            return False
+        return self._ca == other._ca
+
+    def __aiter__(self) -> 'AsyncLIFOQueue[D]':
+        """
+        .. admonition:: Asynchronous iteration
+
+            Consume the ``AsyncLIFOQueue`` in natural LIFO order,
+            waiting for more items until the queue is shut down.
+
+        """
+        return self
+
+    async def __anext__(self) -> D:
+        """
+        .. admonition:: Asynchronous next
+
+            Wait for and pop the newest data item.
+
+        :raises StopAsyncIteration: When shut down and drained.
+
+        """
+        if mb := await self.pop():
+            return mb.get()
+        raise StopAsyncIteration
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'AsyncLIFOQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``AsyncLIFOQueue``.
+
+        """
+        return 'AsyncLIFOQueue(' + ', '.join(map(repr, self._ca)) + ')'
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``AsyncLIFOQueue`` in natural LIFO order.
+
+        :returns: A tuple of the data, newest to oldest.
+
+        """
+        return tuple(reversed(self._ca))
+
+    def push_nowait(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push without waiting
+
+            Push data items onto ``AsyncLIFOQueue`` if there is
+            room for all of them.
+
+        :param ds: Items to be pushed onto ``AsyncLIFOQueue``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not self._room_for(len(ds)):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    async def push(self, *ds: D, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``AsyncLIFOQueue``, when bounded
+            first waiting for room for all of them.
+
+        :param ds: Items to be pushed onto ``AsyncLIFOQueue``.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` on timeout.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not await self._wait_for_room(len(ds), timeout):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    def pop_nowait(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop without waiting
+
+            Pop newest data item off of ``AsyncLIFOQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``AsyncLIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            d = self._ca.popr()
+            self._popped()
+            return MayBe(d)
+        return MayBe()
+
+    async def pop(self, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Wait for and pop newest data item off of ``AsyncLIFOQueue``.
+
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item, empty ``MayBe`` on timeout
+                  or if queue was shut down and is empty.
+
+        """
+        if await self._wait_for_items(timeout):
+            return self.pop_nowait()
+        return MayBe()
+
+    def peak(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last
+
+            Peak at newest item on ``AsyncLIFOQueue``.
+
+        :returns: ``MayBe`` of newest item on queue, empty ``MayBe`` if queue empty.
+
+        """
+        if self._ca:
+            return MayBe(self._ca[-1])
+        return MayBe()
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``AsyncLIFOQueue`` in natural LIFO Order, newest to oldest.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``AsyncLIFOQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self._ca:
+                return MayBe()
+            return MayBe(
+                cast(T, self._ca.foldr(swap(cast(Callable[[D, D], D], f))))
+            )  # T = D
+        return MayBe(self._ca.foldr(swap(f), start))
+
+
+class AsyncDEQueue[D](_AsyncQueue[D]):
+    """
+    .. admonition:: AsyncDEQueue
+
+        Asyncio Double-Ended (DE) Queue data structure.
+
+        - awaitable ``popl`` and ``popr``, non-blocking
+          ``popl_nowait`` and ``popr_nowait``
+        - awaitable ``pushl`` and ``pushr`` when bounded, non-blocking
+          ``pushl_nowait`` and ``pushr_nowait``
+        - ``async for`` pops items from the left until shut down
+          and drained
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``AsyncDEQueue`` with 0 or 1 iterables
+            to populate the queue left (front) to right (rear).
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided
+                            or ``maxsize`` is not positive.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(ds, maxsize, 'AsyncDEQueue')
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is an ``AsyncDEQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, AsyncDEQueue):
+            return False
+        return self._ca == other._ca
+
+    def __aiter__(self) -> 'AsyncDEQueue[D]':
+        """
+        .. admonition:: Asynchronous iteration
+
+            Consume the ``AsyncDEQueue`` left to right, waiting
+            for more items until the queue is shut down.
+
+        """
+        return self
+
+    async def __anext__(self) -> D:
+        """
+        .. admonition:: Asynchronous next
+
+            Wait for and pop the leftmost data item.
+
+        :raises StopAsyncIteration: When shut down and drained.
+
+        """
+        if mb := await self.popl():
+            return mb.get()
+        raise StopAsyncIteration
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'AsyncDEQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``AsyncDEQueue``.
+
+        """
+        return 'AsyncDEQueue(' + ', '.join(map(repr, self._ca)) + ')'
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``AsyncDEQueue`` left to right.
+
+        :returns: A tuple of the data, left to right.
+
+        """
+        return tuple(self._ca)
+
+    def pushl_nowait(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push left without waiting
+
+            Push data onto left side of ``AsyncDEQueue`` if there
+            is room for all of it.
+
+        :param ds: Data to be pushed onto ``AsyncDEQueue`` from the left.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not self._room_for(len(ds)):
+            return False
+        self._ca.pushl(*ds)
+        self._pushed(len(ds))
+        return True
+
+    def pushr_nowait(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push right without waiting
+
+            Push data onto right side of ``AsyncDEQueue`` if there
+            is room for all of it.
+
+        :param ds: Data to be pushed onto ``AsyncDEQueue`` from the right.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not self._room_for(len(ds)):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    async def pushl(self, *ds: D, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push left
+
+            Push data onto left side of ``AsyncDEQueue``, when bounded
+            first waiting for room for all of it.
+
+        :param ds: Data to be pushed onto ``AsyncDEQueue`` from the left.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` on timeout.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not await self._wait_for_room(len(ds), timeout):
+            return False
+        self._ca.pushl(*ds)
+        self._pushed(len(ds))
+        return True
+
+    async def pushr(self, *ds: D, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push right
+
+            Push data onto right side of ``AsyncDEQueue``, when bounded
+            first waiting for room for all of it.
+
+        :param ds: Data to be pushed onto ``AsyncDEQueue`` from the right.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` on timeout.
+        :raises ValueError: When more items pushed than ``maxsize``.
+        :raises asyncio.QueueShutDown: When queue has been shut down.
+
+        """
+        if not await self._wait_for_room(len(ds), timeout):
+            return False
+        self._ca.pushr(*ds)
+        self._pushed(len(ds))
+        return True
+
+    def popl_nowait(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop left without waiting
+
+            Pop next item from left side ``AsyncDEQueue``, if it exists.
+
+        :returns: ``MayBe`` of popped item if queue was not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            d = self._ca.popl()
+            self._popped()
+            return MayBe(d)
+        return MayBe()
+
+    def popr_nowait(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop right without waiting
+
+            Pop next item off right side ``AsyncDEQueue``, if it exists.
+
+        :returns: ``MayBe`` of popped item if queue was not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            d = self._ca.popr()
+            self._popped()
+            return MayBe(d)
+        return MayBe()
+
+    async def popl(self, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop left
+
+            Wait for and pop next item from left side ``AsyncDEQueue``.
+
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped item, empty ``MayBe`` on timeout
+                  or if queue was shut down and is empty.
+
+        """
+        if await self._wait_for_items(timeout):
+            return self.popl_nowait()
+        return MayBe()
+
+    async def popr(self, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop right
+
+            Wait for and pop next item off right side ``AsyncDEQueue``.
+
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped item, empty ``MayBe`` on timeout
+                  or if queue was shut down and is empty.
+
+        """
+        if await self._wait_for_items(timeout):
+            return self.popr_nowait()
+        return MayBe()
+
+    def peakl(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak left
+
+            Peak left side of ``AsyncDEQueue``. Does not consume item.
+
+        :returns: ``MayBe`` of leftmost item if queue not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            return MayBe(self._ca[0])
+        return MayBe()
+
+    def peakr(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak right
+
+            Peak right side of ``AsyncDEQueue``. Does not consume item.
+
+        :returns: ``MayBe`` of rightmost item if queue not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if self._ca:
+            return MayBe(self._ca[-1])
+        return MayBe()
+
+    @overload
+    def foldl[L](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, D], L], start: L) -> MayBe[L]: ...
+
+    def foldl[L](self, f: Callable[[L, D], L], start: L | None = None) -> MayBe[L]:
+        """
+        .. admonition:: Fold left
+
+            Reduce ``AsyncDEQueue`` left to right.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe`` if
+                  queue empty and no starting value given.
+
+        """
+        if start is None:
+            if not self._ca:
+                return MayBe()
+            return MayBe(cast(L, self._ca.foldl(cast(Callable[[D, D], D], f))))  # L = D
+        return MayBe(self._ca.foldl(f, start))
+
+    @overload
+    def foldr[R](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, R], R], start: R) -> MayBe[R]: ...
+
+    def foldr[R](self, f: Callable[[D, R], R], start: R | None = None) -> MayBe[R]:
+        """
+        .. admonition:: Fold right
+
+            Reduce ``AsyncDEQueue`` right to left.
+
+        :param f: Reducing function, second argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if queue empty and no starting value given.
+
+        """
+        if start is None:
+            if not self._ca:
+                return MayBe()
+            return MayBe(cast(R, self._ca.foldr(cast(Callable[[D, D], D], f))))  # R = D
+        return MayBe(self._ca.foldr(f, start))
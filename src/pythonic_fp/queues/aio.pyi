@@ -0,0 +1,84 @@
+from collections.abc import Callable, Iterable
+from pythonic_fp.fptools.maybe import MayBe
+from typing import overload
+
+__all__ = ['AsyncFIFOQueue', 'AsyncLIFOQueue', 'AsyncDEQueue']
+
+class AsyncFIFOQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __aiter__(self) -> AsyncFIFOQueue[D]: ...
+    async def __anext__(self) -> D: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    @property
+    def shut_down(self) -> bool: ...
+    def shutdown(self) -> None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push_nowait(self, *ds: D) -> bool: ...
+    async def push(self, *ds: D, timeout: float | None = None) -> bool: ...
+    def pop_nowait(self) -> MayBe[D]: ...
+    async def pop(self, timeout: float | None = None) -> MayBe[D]: ...
+    def peak_last_in(self) -> MayBe[D]: ...
+    def peak_next_out(self) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+class AsyncLIFOQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __aiter__(self) -> AsyncLIFOQueue[D]: ...
+    async def __anext__(self) -> D: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    @property
+    def shut_down(self) -> bool: ...
+    def shutdown(self) -> None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push_nowait(self, *ds: D) -> bool: ...
+    async def push(self, *ds: D, timeout: float | None = None) -> bool: ...
+    def pop_nowait(self) -> MayBe[D]: ...
+    async def pop(self, timeout: float | None = None) -> MayBe[D]: ...
+    def peak(self) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+class AsyncDEQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __aiter__(self) -> AsyncDEQueue[D]: ...
+    async def __anext__(self) -> D: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    @property
+    def shut_down(self) -> bool: ...
+    def shutdown(self) -> None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def pushl_nowait(self, *ds: D) -> bool: ...
+    def pushr_nowait(self, *ds: D) -> bool: ...
+    async def pushl(self, *ds: D, timeout: float | None = None) -> bool: ...
+    async def pushr(self, *ds: D, timeout: float | None = None) -> bool: ...
+    def popl_nowait(self) -> MayBe[D]: ...
+    def popr_nowait(self) -> MayBe[D]: ...
+    async def popl(self, timeout: float | None = None) -> MayBe[D]: ...
+    async def popr(self, timeout: float | None = None) -> MayBe[D]: ...
+    def peakl(self) -> MayBe[D]: ...
+    def peakr(self) -> MayBe[D]: ...
+    @overload
+    def foldl[L](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, D], L], start: L) -> MayBe[L]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, R], R], start: R) -> MayBe[R]: ...
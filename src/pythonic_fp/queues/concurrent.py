@@ -0,0 +1,1814 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Thread safe queues
+
+    Lock protected versions of ``FIFOQueue``, ``LIFOQueue`` and
+    ``DEQueue`` for multi-threaded producer/consumer pipelines.
+
+    - same ``MayBe`` returning API as the unsynchronized queues
+    - pops optionally block, with an optional timeout
+    - optional ``maxsize``, pushes then block until there is room
+    - bulk operations done under a single lock acquisition
+
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sized
+from typing import cast, overload
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.done import Done
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+
+__all__ = ['ConcurrentDEQueue', 'ConcurrentFIFOQueue', 'ConcurrentLIFOQueue']
+
+
+class _ConcurrentQueue[Q: Sized]:
+    """Lock and condition variable bookkeeping shared by the concurrent queues."""
+
+    __slots__ = ('_lock', '_maxsize', '_not_empty', '_not_full', '_queue')
+
+    def __init__(self, queue: Q, maxsize: int | None) -> None:
+        if maxsize is not None and maxsize < 1:
+            msg = f'maxsize must be a positive integer, got {maxsize}'
+            raise ValueError(msg)
+        if maxsize is not None and len(queue) > maxsize:
+            msg = f'{len(queue)} initial items exceed maxsize {maxsize}'
+            raise ValueError(msg)
+        self._queue = queue
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            Truthy when non-empty, falsy when empty.
+
+        """
+        with self._lock:
+            return len(self._queue) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the queue.
+
+        """
+        with self._lock:
+            return len(self._queue)
+
+    @property
+    def maxsize(self) -> int | None:
+        """
+        .. admonition:: Maximum size
+
+            Maximum number of items the queue holds, ``None`` if unbounded.
+
+        """
+        return self._maxsize
+
+    def _wait_for_items(self, block: bool, timeout: float | None) -> bool:
+        # Call only while holding self._lock.
+        if block:
+            return self._not_empty.wait_for(lambda: len(self._queue) > 0, timeout)
+        return len(self._queue) > 0
+
+    def _wait_for_room(self, n: int, block: bool, timeout: float | None) -> bool:
+        # Call only while holding self._lock.
+        if (maxsize := self._maxsize) is None:
+            return True
+        if n > maxsize:
+            msg = f'cannot push {n} items onto a queue with maxsize {maxsize}'
+            raise ValueError(msg)
+        if block:
+            return self._not_full.wait_for(
+                lambda: len(self._queue) + n <= maxsize, timeout
+            )
+        return len(self._queue) + n <= maxsize
+
+
+class ConcurrentFIFOQueue[D](_ConcurrentQueue[FIFOQueue[D]]):
+    """
+    .. admonition:: ConcurrentFIFOQueue
+
+        Thread safe First-In-First-Out (FIFO) Queue data structure.
+
+        - same push, pop, peak, fold and query API as ``FIFOQueue``
+        - all operations done under a single lock
+        - pops can wait for data, pushes can wait for room
+        - iterates over a snapshot taken under the lock
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``ConcurrentFIFOQueue`` with 0 or 1 iterables
+            to populate the queue in natural FIFO order.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided,
+                            ``maxsize`` is not positive or the initial
+                            items do not fit within ``maxsize``.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(FIFOQueue(*ds), maxsize)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``ConcurrentFIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if self is other:
+            return True
+        if not isinstance(other, ConcurrentFIFOQueue):
+            return False
+        other_items = other.snapshot()
+        with self._lock:
+            return self._queue.snapshot() == other_items
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over a snapshot of the current state in natural
+            FIFO order. Other threads may freely mutate the queue
+            while it is being iterated.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self.snapshot())
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'ConcurrentFIFOQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``ConcurrentFIFOQueue``.
+
+        """
+        return 'ConcurrentFIFOQueue(' + ', '.join(map(repr, self.snapshot())) + ')'
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '<< d₁ < d₂ < … < dₙ <<' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '<< ' + ' < '.join(map(str, self.snapshot())) + ' <<'
+
+    def copy(self) -> 'ConcurrentFIFOQueue[D]':
+        """
+        .. admonition:: Copy
+
+            Shallow copy the ``ConcurrentFIFOQueue``, same ``maxsize``.
+
+        :returns: New ``ConcurrentFIFOQueue`` instance containing the same references.
+
+        """
+        new: ConcurrentFIFOQueue[D] = ConcurrentFIFOQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.copy()
+        return new
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``ConcurrentFIFOQueue`` in natural FIFO order.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        with self._lock:
+            return self._queue.snapshot()
+
+    def push(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``ConcurrentFIFOQueue``. When bounded,
+            either all or none of the items are pushed.
+
+        :param ds: Items to be pushed onto ``ConcurrentFIFOQueue``.
+        :param block: When bounded, wait for room if queue is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+
+        """
+        with self._lock:
+            if not self._wait_for_room(len(ds), block, timeout):
+                return False
+            self._queue.push(*ds)
+            self._not_empty.notify(len(ds))
+        return True
+
+    def extend(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend
+
+            Push data items from an iterable onto ``ConcurrentFIFOQueue``.
+            When bounded, items are pushed one at a time, each
+            waiting for room if necessary.
+
+        :param ds: Iterable of items to be pushed onto ``ConcurrentFIFOQueue``.
+        :returns: ``True`` if all the items were pushed.
+
+        """
+        if self._maxsize is None:
+            with self._lock:
+                before = len(self._queue)
+                pushed = self._queue.extend(ds)
+                self._not_empty.notify(len(self._queue) - before)
+            return pushed
+        for d in ds:
+            if not self.push(d):
+                return False
+        return True
+
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop oldest data item off of ``ConcurrentFIFOQueue``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return MayBe()
+            self._not_full.notify_all()
+            return self._queue.pop()
+
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop oldest data item off of ``ConcurrentFIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentFIFOQueue`` is empty.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``default`` if
+                  ``ConcurrentFIFOQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return default
+            self._not_full.notify_all()
+            return self._queue.pop_or(default)
+
+    def try_pop(self, block: bool = False, timeout: float | None = None) -> D | NoValue:
+        """
+        .. admonition:: Try pop
+
+            Pop oldest data item off of ``ConcurrentFIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``NoValue()`` if
+                  ``ConcurrentFIFOQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return NoValue()
+            self._not_full.notify_all()
+            return self._queue.try_pop()
+
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``ConcurrentFIFOQueue``,
+            all of them if ``k`` not given, under a single lock
+            acquisition.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        with self._lock:
+            if block and (k is None or k > 0):
+                self._wait_for_items(block, timeout)
+            items = self._queue.pop_many(k)
+            if items:
+                self._not_full.notify_all()
+            return items
+
+    def peak_last_in(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last
+
+            Peak at newest item on ``ConcurrentFIFOQueue``.
+
+        :returns: ``MayBe`` of newest item on ``ConcurrentFIFOQueue``,
+                  empty ``MayBe`` if ``ConcurrentFIFOQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peak_last_in()
+
+    def peak_last_in_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak last or default
+
+            Peak at newest item on ``ConcurrentFIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentFIFOQueue`` is empty.
+        :returns: The item, ``default`` if ``ConcurrentFIFOQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peak_last_in_or(default)
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at oldest data item on ``ConcurrentFIFOQueue``.
+
+        :returns: ``MayBe`` of oldest item on ``ConcurrentFIFOQueue``,
+                  empty ``MayBe`` if ``ConcurrentFIFOQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peak_next_out()
+
+    def peak_next_out_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak next out or default
+
+            Peak at oldest item on ``ConcurrentFIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentFIFOQueue`` is empty.
+        :returns: The item, ``default`` if ``ConcurrentFIFOQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peak_next_out_or(default)
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``ConcurrentFIFOQueue`` in natural FIFO Order,
+            oldest to newest, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentFIFOQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[T], self._queue.fold(cast(Callable[[D, D], D], f))
+                )  # T = D
+            return self._queue.fold(f, start)
+
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+
+    def fold_until[T](
+        self, f: Callable[[T, D], T | Done[T]], start: T | None = None
+    ) -> MayBe[T]:
+        """
+        .. admonition:: Fold until done
+
+            Reduce ``ConcurrentFIFOQueue`` oldest to newest,
+            stopping early when ``f`` returns its result wrapped
+            in ``Done``, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentFIFOQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[T],
+                    self._queue.fold_until(cast(Callable[[D, D], D | Done[D]], f)),
+                )  # T = D
+            return self._queue.fold_until(f, start)
+
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]:
+        """
+        .. admonition:: Find
+
+            Find the first item, oldest to newest, satisfying ``pred``
+            while holding the lock. Stops at the first match.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to satisfy.
+        :returns: ``MayBe`` of the item found, empty ``MayBe`` if none found.
+
+        """
+        with self._lock:
+            return self._queue.find(pred)
+
+    def any(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: Any
+
+            Stops at the first item satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if any item satisfies ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.any(pred)
+
+    def all(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: All
+
+            Stops at the first item not satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if all items satisfy ``pred``, even when empty.
+
+        """
+        with self._lock:
+            return self._queue.all(pred)
+
+    def count(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Count
+
+            Count the items satisfying ``pred`` while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: Number of items satisfying ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.count(pred)
+
+    def index_of(self, item: D) -> MayBe[int]:
+        """
+        .. admonition:: Index of
+
+            Position of the first item, oldest to newest, equal to ``item``.
+            Stops at the first match.
+
+        :param item: Item to look for.
+        :returns: ``MayBe`` of its position, 0 being the next out item,
+                  empty ``MayBe`` if not found.
+
+        """
+        with self._lock:
+            return self._queue.index_of(item)
+
+    def map[U](self, f: Callable[[D], U]) -> 'ConcurrentFIFOQueue[U]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``ConcurrentFIFOQueue``, retain original
+            order, while holding the lock.
+
+            .. warning::
+
+                The function ``f`` must not access the queue.
+
+        :param f: Function to map over ``ConcurrentFIFOQueue``.
+        :returns: New ``ConcurrentFIFOQueue`` instance, same ``maxsize``.
+
+        """
+        new: ConcurrentFIFOQueue[U] = ConcurrentFIFOQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.map(f)
+        return new
+
+    def retain(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Retain
+
+            Keep only the items satisfying ``pred``, in their original
+            order, while holding the lock. Wakes pushers waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item oldest to newest.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.retain(pred):
+                self._not_full.notify_all()
+            return removed
+
+    def remove_if(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Remove if
+
+            Remove the items satisfying ``pred``, the rest keeping their
+            original order, while holding the lock. Wakes pushers
+            waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item oldest to newest.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.remove_if(pred):
+                self._not_full.notify_all()
+            return removed
+
+
+class ConcurrentLIFOQueue[D](_ConcurrentQueue[LIFOQueue[D]]):
+    """
+    .. admonition:: ConcurrentLIFOQueue
+
+        Thread safe Last-In-First-Out (LIFO) Queue data structure.
+
+        - same push, pop, peak, fold and query API as ``LIFOQueue``
+        - all operations done under a single lock
+        - pops can wait for data, pushes can wait for room
+        - iterates over a snapshot taken under the lock
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``ConcurrentLIFOQueue`` with 0 or 1 iterables
+            to populate the queue in natural LIFO order.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided,
+                            ``maxsize`` is not positive or the initial
+                            items do not fit within ``maxsize``.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(LIFOQueue(*ds), maxsize)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``ConcurrentLIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if self is other:
+            return True
+        if not isinstance(other, ConcurrentLIFOQueue):
+            return False
+        other_items = other.snapshot()
+        with self._lock:
+            return self._queue.snapshot() == other_items
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over a snapshot of the current state in natural
+            LIFO order. Other threads may freely mutate the queue
+            while it is being iterated.
+
+        :returns: Iterator of the data.
+
+        """
+        return iter(self.snapshot())
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'ConcurrentLIFOQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``ConcurrentLIFOQueue``.
+
+        """
+        items = reversed(self.snapshot())
+        return 'ConcurrentLIFOQueue(' + ', '.join(map(repr, items)) + ')'
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '|| d₁ > d₂ > … > dₙ ><' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '|| ' + ' > '.join(map(str, self.snapshot())) + ' ><'
+
+    def copy(self) -> 'ConcurrentLIFOQueue[D]':
+        """
+        .. admonition:: Copy
+
+            Shallow copy the ``ConcurrentLIFOQueue``, same ``maxsize``.
+
+        :returns: New ``ConcurrentLIFOQueue`` instance containing the same references.
+
+        """
+        new: ConcurrentLIFOQueue[D] = ConcurrentLIFOQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.copy()
+        return new
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``ConcurrentLIFOQueue`` in natural LIFO order.
+
+        :returns: A tuple of the data, newest to oldest.
+
+        """
+        with self._lock:
+            return self._queue.snapshot()
+
+    def push(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``ConcurrentLIFOQueue``. When bounded,
+            either all or none of the items are pushed.
+
+        :param ds: Items to be pushed onto ``ConcurrentLIFOQueue``.
+        :param block: When bounded, wait for room if queue is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+
+        """
+        with self._lock:
+            if not self._wait_for_room(len(ds), block, timeout):
+                return False
+            self._queue.push(*ds)
+            self._not_empty.notify(len(ds))
+        return True
+
+    def extend(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend
+
+            Push data items from an iterable onto ``ConcurrentLIFOQueue``.
+            When bounded, items are pushed one at a time, each
+            waiting for room if necessary.
+
+        :param ds: Iterable of items to be pushed onto ``ConcurrentLIFOQueue``.
+        :returns: ``True`` if all the items were pushed.
+
+        """
+        if self._maxsize is None:
+            with self._lock:
+                before = len(self._queue)
+                pushed = self._queue.extend(ds)
+                self._not_empty.notify(len(self._queue) - before)
+            return pushed
+        for d in ds:
+            if not self.push(d):
+                return False
+        return True
+
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop newest data item off of ``ConcurrentLIFOQueue``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return MayBe()
+            self._not_full.notify_all()
+            return self._queue.pop()
+
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop newest data item off of ``ConcurrentLIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentLIFOQueue`` is empty.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``default`` if
+                  ``ConcurrentLIFOQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return default
+            self._not_full.notify_all()
+            return self._queue.pop_or(default)
+
+    def try_pop(self, block: bool = False, timeout: float | None = None) -> D | NoValue:
+        """
+        .. admonition:: Try pop
+
+            Pop newest data item off of ``ConcurrentLIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``NoValue()`` if
+                  ``ConcurrentLIFOQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return NoValue()
+            self._not_full.notify_all()
+            return self._queue.try_pop()
+
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``ConcurrentLIFOQueue``,
+            all of them if ``k`` not given, under a single lock
+            acquisition.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, newest to oldest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        with self._lock:
+            if block and (k is None or k > 0):
+                self._wait_for_items(block, timeout)
+            items = self._queue.pop_many(k)
+            if items:
+                self._not_full.notify_all()
+            return items
+
+    def peak(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last
+
+            Peak at newest item on ``ConcurrentLIFOQueue``.
+
+        :returns: ``MayBe`` of newest item on queue, empty ``MayBe`` if queue empty.
+
+        """
+        with self._lock:
+            return self._queue.peak()
+
+    def peak_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak or default
+
+            Peak at newest item on ``ConcurrentLIFOQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentLIFOQueue`` is empty.
+        :returns: The item, ``default`` if ``ConcurrentLIFOQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peak_or(default)
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``ConcurrentLIFOQueue`` in natural LIFO Order,
+            newest to oldest, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentLIFOQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[T], self._queue.fold(cast(Callable[[D, D], D], f))
+                )  # T = D
+            return self._queue.fold(f, start)
+
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+
+    def fold_until[T](
+        self, f: Callable[[T, D], T | Done[T]], start: T | None = None
+    ) -> MayBe[T]:
+        """
+        .. admonition:: Fold until done
+
+            Reduce ``ConcurrentLIFOQueue`` newest to oldest,
+            stopping early when ``f`` returns its result wrapped
+            in ``Done``, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentLIFOQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[T],
+                    self._queue.fold_until(cast(Callable[[D, D], D | Done[D]], f)),
+                )  # T = D
+            return self._queue.fold_until(f, start)
+
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]:
+        """
+        .. admonition:: Find
+
+            Find the first item, newest to oldest, satisfying ``pred``
+            while holding the lock. Stops at the first match.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to satisfy.
+        :returns: ``MayBe`` of the item found, empty ``MayBe`` if none found.
+
+        """
+        with self._lock:
+            return self._queue.find(pred)
+
+    def any(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: Any
+
+            Stops at the first item satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if any item satisfies ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.any(pred)
+
+    def all(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: All
+
+            Stops at the first item not satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if all items satisfy ``pred``, even when empty.
+
+        """
+        with self._lock:
+            return self._queue.all(pred)
+
+    def count(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Count
+
+            Count the items satisfying ``pred`` while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: Number of items satisfying ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.count(pred)
+
+    def index_of(self, item: D) -> MayBe[int]:
+        """
+        .. admonition:: Index of
+
+            Position of the first item, newest to oldest, equal to ``item``.
+            Stops at the first match.
+
+        :param item: Item to look for.
+        :returns: ``MayBe`` of its position, 0 being the next out item,
+                  empty ``MayBe`` if not found.
+
+        """
+        with self._lock:
+            return self._queue.index_of(item)
+
+    def map[U](self, f: Callable[[D], U]) -> 'ConcurrentLIFOQueue[U]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``ConcurrentLIFOQueue``, retain original
+            order, while holding the lock.
+
+            .. warning::
+
+                The function ``f`` must not access the queue.
+
+        :param f: Function to map over ``ConcurrentLIFOQueue``.
+        :returns: New ``ConcurrentLIFOQueue`` instance, same ``maxsize``.
+
+        """
+        new: ConcurrentLIFOQueue[U] = ConcurrentLIFOQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.map(f)
+        return new
+
+    def retain(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Retain
+
+            Keep only the items satisfying ``pred``, in their original
+            order, while holding the lock. Wakes pushers waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item newest to oldest.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.retain(pred):
+                self._not_full.notify_all()
+            return removed
+
+    def remove_if(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Remove if
+
+            Remove the items satisfying ``pred``, the rest keeping their
+            original order, while holding the lock. Wakes pushers
+            waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item newest to oldest.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.remove_if(pred):
+                self._not_full.notify_all()
+            return removed
+
+
+class ConcurrentDEQueue[D](_ConcurrentQueue[DEQueue[D]]):
+    """
+    .. admonition:: ConcurrentDEQueue
+
+        Thread safe Double-Ended (DE) Queue data structure.
+
+        - same push, pop, peak, fold and query API as ``DEQueue``
+        - all operations done under a single lock
+        - pops can wait for data, pushes can wait for room
+        - iterates over a snapshot taken under the lock
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``ConcurrentDEQueue`` with 0 or 1 iterables
+            to populate the queue left (front) to right (rear).
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param maxsize: Optional maximum number of items, unbounded if ``None``.
+        :raises ValueError: When more than one iterable is provided,
+                            ``maxsize`` is not positive or the initial
+                            items do not fit within ``maxsize``.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        super().__init__(DEQueue(*ds), maxsize)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``ConcurrentDEQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if self is other:
+            return True
+        if not isinstance(other, ConcurrentDEQueue):
+            return False
+        other_items = other.snapshot()
+        with self._lock:
+            return self._queue.snapshot() == other_items
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over a snapshot of the current state left to right.
+            Other threads may freely mutate the queue while it is
+            being iterated.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self.snapshot())
+
+    def __reversed__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over a snapshot of the current state right to left.
+            Other threads may freely mutate the queue while it is
+            being iterated.
+
+        :returns: An iterator of the data.
+
+        """
+        return reversed(self.snapshot())
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'ConcurrentDEQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents displayed with ``repr()``
+
+        :returns: A string to reproduce the ``ConcurrentDEQueue``.
+
+        """
+        return 'ConcurrentDEQueue(' + ', '.join(map(repr, self.snapshot())) + ')'
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '>< d₁ | d₂ | … | dₙ ><' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '>< ' + ' | '.join(map(str, self.snapshot())) + ' ><'
+
+    def copy(self) -> 'ConcurrentDEQueue[D]':
+        """
+        .. admonition:: Copy
+
+            Shallow copy the ``ConcurrentDEQueue``, same ``maxsize``.
+
+        :returns: New ``ConcurrentDEQueue`` instance containing the same references.
+
+        """
+        new: ConcurrentDEQueue[D] = ConcurrentDEQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.copy()
+        return new
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``ConcurrentDEQueue`` left to right.
+
+        :returns: A tuple of the data, left to right.
+
+        """
+        with self._lock:
+            return self._queue.snapshot()
+
+    def pushl(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push left
+
+            Push data onto left side of ``ConcurrentDEQueue``. When
+            bounded, either all or none of the items are pushed.
+
+        :param ds: Data to be pushed onto ``ConcurrentDEQueue`` from the left.
+        :param block: When bounded, wait for room if queue is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+
+        """
+        with self._lock:
+            if not self._wait_for_room(len(ds), block, timeout):
+                return False
+            self._queue.pushl(*ds)
+            self._not_empty.notify(len(ds))
+        return True
+
+    def pushr(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push right
+
+            Push data onto right side of ``ConcurrentDEQueue``. When
+            bounded, either all or none of the items are pushed.
+
+        :param ds: Data to be pushed onto ``ConcurrentDEQueue`` from the right.
+        :param block: When bounded, wait for room if queue is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When more items pushed than ``maxsize``.
+
+        """
+        with self._lock:
+            if not self._wait_for_room(len(ds), block, timeout):
+                return False
+            self._queue.pushr(*ds)
+            self._not_empty.notify(len(ds))
+        return True
+
+    def extendl(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend left
+
+            Push data items from an iterable onto the left side of
+            ``ConcurrentDEQueue``. When bounded, items are pushed one
+            at a time, each waiting for room if necessary.
+
+        :param ds: Iterable of items to be pushed onto ``ConcurrentDEQueue``.
+        :returns: ``True`` if all the items were pushed.
+
+        """
+        if self._maxsize is None:
+            with self._lock:
+                before = len(self._queue)
+                pushed = self._queue.extendl(ds)
+                self._not_empty.notify(len(self._queue) - before)
+            return pushed
+        for d in ds:
+            if not self.pushl(d):
+                return False
+        return True
+
+    def extendr(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend right
+
+            Push data items from an iterable onto the right side of
+            ``ConcurrentDEQueue``. When bounded, items are pushed one
+            at a time, each waiting for room if necessary.
+
+        :param ds: Iterable of items to be pushed onto ``ConcurrentDEQueue``.
+        :returns: ``True`` if all the items were pushed.
+
+        """
+        if self._maxsize is None:
+            with self._lock:
+                before = len(self._queue)
+                pushed = self._queue.extendr(ds)
+                self._not_empty.notify(len(self._queue) - before)
+            return pushed
+        for d in ds:
+            if not self.pushr(d):
+                return False
+        return True
+
+    def popl(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop left
+
+            Pop next item from left side ``ConcurrentDEQueue``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return MayBe()
+            self._not_full.notify_all()
+            return self._queue.popl()
+
+    def popr(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop right
+
+            Pop next item off right side ``ConcurrentDEQueue``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return MayBe()
+            self._not_full.notify_all()
+            return self._queue.popr()
+
+    def popl_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop left or default
+
+            Pop next item off left side of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentDEQueue`` is empty.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``default`` if
+                  ``ConcurrentDEQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return default
+            self._not_full.notify_all()
+            return self._queue.popl_or(default)
+
+    def try_popl(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue:
+        """
+        .. admonition:: Try pop left
+
+            Pop next item off left side of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``NoValue()`` if
+                  ``ConcurrentDEQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return NoValue()
+            self._not_full.notify_all()
+            return self._queue.try_popl()
+
+    def popr_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop right or default
+
+            Pop next item off right side of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentDEQueue`` is empty.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``default`` if
+                  ``ConcurrentDEQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return default
+            self._not_full.notify_all()
+            return self._queue.popr_or(default)
+
+    def try_popr(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue:
+        """
+        .. admonition:: Try pop right
+
+            Pop next item off right side of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, ``NoValue()`` if
+                  ``ConcurrentDEQueue`` was empty.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return NoValue()
+            self._not_full.notify_all()
+            return self._queue.try_popr()
+
+    def popl_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many left
+
+            Pop up to ``k`` data items off the left side of
+            ``ConcurrentDEQueue``, all of them if ``k`` not given,
+            under a single lock acquisition.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        with self._lock:
+            if block and (k is None or k > 0):
+                self._wait_for_items(block, timeout)
+            items = self._queue.popl_many(k)
+            if items:
+                self._not_full.notify_all()
+            return items
+
+    def popr_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many right
+
+            Pop up to ``k`` data items off the right side of
+            ``ConcurrentDEQueue``, all of them if ``k`` not given,
+            under a single lock acquisition.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, right to left.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        with self._lock:
+            if block and (k is None or k > 0):
+                self._wait_for_items(block, timeout)
+            items = self._queue.popr_many(k)
+            if items:
+                self._not_full.notify_all()
+            return items
+
+    def peakl(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak left
+
+            Peak left side of ``ConcurrentDEQueue``. Does not consume item.
+
+        :returns: ``MayBe`` of leftmost item if queue not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            return self._queue.peakl()
+
+    def peakl_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak left or default
+
+            Peak at leftmost item of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentDEQueue`` is empty.
+        :returns: The item, ``default`` if ``ConcurrentDEQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peakl_or(default)
+
+    def peakr(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak right
+
+            Peak right side of ``ConcurrentDEQueue``. Does not consume item.
+
+        :returns: ``MayBe`` of rightmost item if queue not empty,
+                  empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            return self._queue.peakr()
+
+    def peakr_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak right or default
+
+            Peak at rightmost item of ``ConcurrentDEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``ConcurrentDEQueue`` is empty.
+        :returns: The item, ``default`` if ``ConcurrentDEQueue`` empty.
+
+        """
+        with self._lock:
+            return self._queue.peakr_or(default)
+
+    @overload
+    def foldl[L](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, D], L], start: L) -> MayBe[L]: ...
+
+    def foldl[L](self, f: Callable[[L, D], L], start: L | None = None) -> MayBe[L]:
+        """
+        .. admonition:: Fold left
+
+            Reduce ``ConcurrentDEQueue`` left to right while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe`` if
+                  queue empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[L], self._queue.foldl(cast(Callable[[D, D], D], f))
+                )  # L = D
+            return self._queue.foldl(f, start)
+
+    @overload
+    def foldr[R](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, R], R], start: R) -> MayBe[R]: ...
+
+    def foldr[R](self, f: Callable[[D, R], R], start: R | None = None) -> MayBe[R]:
+        """
+        .. admonition:: Fold right
+
+            Reduce ``ConcurrentDEQueue`` right to left while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, second argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if queue empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[R], self._queue.foldr(cast(Callable[[D, D], D], f))
+                )  # R = D
+            return self._queue.foldr(f, start)
+
+    @overload
+    def foldl_until[L](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldl_until[L](
+        self, f: Callable[[L, D], L | Done[L]], start: L
+    ) -> MayBe[L]: ...
+
+    def foldl_until[L](
+        self, f: Callable[[L, D], L | Done[L]], start: L | None = None
+    ) -> MayBe[L]:
+        """
+        .. admonition:: Fold left until done
+
+            Reduce ``ConcurrentDEQueue`` left to right,
+            stopping early when ``f`` returns its result wrapped
+            in ``Done``, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentDEQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[L],
+                    self._queue.foldl_until(cast(Callable[[D, D], D | Done[D]], f)),
+                )  # L = D
+            return self._queue.foldl_until(f, start)
+
+    @overload
+    def foldr_until[R](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldr_until[R](
+        self, f: Callable[[D, R], R | Done[R]], start: R
+    ) -> MayBe[R]: ...
+
+    def foldr_until[R](
+        self, f: Callable[[D, R], R | Done[R]], start: R | None = None
+    ) -> MayBe[R]:
+        """
+        .. admonition:: Fold right until done
+
+            Reduce ``ConcurrentDEQueue`` right to left,
+            stopping early when ``f`` returns its result wrapped
+            in ``Done``, while holding the lock.
+
+            .. warning::
+
+                The reducing function ``f`` must not access the queue.
+
+        :param f: Reducing function, second argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``ConcurrentDEQueue`` empty and no starting value given.
+
+        """
+        with self._lock:
+            if start is None:
+                return cast(
+                    MayBe[R],
+                    self._queue.foldr_until(cast(Callable[[D, D], D | Done[D]], f)),
+                )  # R = D
+            return self._queue.foldr_until(f, start)
+
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]:
+        """
+        .. admonition:: Find
+
+            Find the first item, left to right, satisfying ``pred``
+            while holding the lock. Stops at the first match.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to satisfy.
+        :returns: ``MayBe`` of the item found, empty ``MayBe`` if none found.
+
+        """
+        with self._lock:
+            return self._queue.find(pred)
+
+    def any(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: Any
+
+            Stops at the first item satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if any item satisfies ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.any(pred)
+
+    def all(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: All
+
+            Stops at the first item not satisfying ``pred``.
+            Tested while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if all items satisfy ``pred``, even when empty.
+
+        """
+        with self._lock:
+            return self._queue.all(pred)
+
+    def count(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Count
+
+            Count the items satisfying ``pred`` while holding the lock.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate to test.
+        :returns: Number of items satisfying ``pred``.
+
+        """
+        with self._lock:
+            return self._queue.count(pred)
+
+    def index_of(self, item: D) -> MayBe[int]:
+        """
+        .. admonition:: Index of
+
+            Position of the first item, left to right, equal to ``item``.
+            Stops at the first match.
+
+        :param item: Item to look for.
+        :returns: ``MayBe`` of its position, 0 being the leftmost item,
+                  empty ``MayBe`` if not found.
+
+        """
+        with self._lock:
+            return self._queue.index_of(item)
+
+    def map[U](self, f: Callable[[D], U]) -> 'ConcurrentDEQueue[U]':
+        """
+        .. admonition:: Map
+
+            Map left to right while holding the lock.
+
+            .. warning::
+
+                The function ``f`` must not access the queue.
+
+        :param f: Function to map over queue.
+        :returns: New ``ConcurrentDEQueue`` instance, retain original
+                  order, same ``maxsize``.
+
+        """
+        new: ConcurrentDEQueue[U] = ConcurrentDEQueue(maxsize=self._maxsize)
+        with self._lock:
+            new._queue = self._queue.map(f)
+        return new
+
+    def retain(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Retain
+
+            Keep only the items satisfying ``pred``, in their original
+            order, while holding the lock. Wakes pushers waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item left to right.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.retain(pred):
+                self._not_full.notify_all()
+            return removed
+
+    def remove_if(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Remove if
+
+            Remove the items satisfying ``pred``, the rest keeping their
+            original order, while holding the lock. Wakes pushers
+            waiting for room.
+
+            .. warning::
+
+                The predicate ``pred`` must not access the queue.
+
+        :param pred: Predicate applied to each item left to right.
+        :returns: Number of items removed.
+
+        """
+        with self._lock:
+            if removed := self._queue.remove_if(pred):
+                self._not_full.notify_all()
+            return removed
@@ -0,0 +1,169 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import overload
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.done import Done
+
+__all__ = ['ConcurrentDEQueue', 'ConcurrentFIFOQueue', 'ConcurrentLIFOQueue']
+
+class ConcurrentFIFOQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def copy(self) -> ConcurrentFIFOQueue[D]: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def extend(self, ds: Iterable[D]) -> bool: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def try_pop(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue: ...
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peak_last_in(self) -> MayBe[D]: ...
+    def peak_last_in_or[T](self, default: T) -> D | T: ...
+    def peak_next_out(self) -> MayBe[D]: ...
+    def peak_next_out_or[T](self, default: T) -> D | T: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]: ...
+    def any(self, pred: Callable[[D], bool]) -> bool: ...
+    def all(self, pred: Callable[[D], bool]) -> bool: ...
+    def count(self, pred: Callable[[D], bool]) -> int: ...
+    def index_of(self, item: D) -> MayBe[int]: ...
+    def map[U](self, f: Callable[[D], U]) -> ConcurrentFIFOQueue[U]: ...
+    def retain(self, pred: Callable[[D], bool]) -> int: ...
+    def remove_if(self, pred: Callable[[D], bool]) -> int: ...
+
+class ConcurrentLIFOQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def copy(self) -> ConcurrentLIFOQueue[D]: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def extend(self, ds: Iterable[D]) -> bool: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def try_pop(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue: ...
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peak(self) -> MayBe[D]: ...
+    def peak_or[T](self, default: T) -> D | T: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]: ...
+    def any(self, pred: Callable[[D], bool]) -> bool: ...
+    def all(self, pred: Callable[[D], bool]) -> bool: ...
+    def count(self, pred: Callable[[D], bool]) -> int: ...
+    def index_of(self, item: D) -> MayBe[int]: ...
+    def map[U](self, f: Callable[[D], U]) -> ConcurrentLIFOQueue[U]: ...
+    def retain(self, pred: Callable[[D], bool]) -> int: ...
+    def remove_if(self, pred: Callable[[D], bool]) -> int: ...
+
+class ConcurrentDEQueue[D]:
+    def __init__(self, *ds: Iterable[D], maxsize: int | None = None) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[D]: ...
+    def __reversed__(self) -> Iterator[D]: ...
+    @property
+    def maxsize(self) -> int | None: ...
+    def copy(self) -> ConcurrentDEQueue[D]: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def pushl(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def pushr(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def extendl(self, ds: Iterable[D]) -> bool: ...
+    def extendr(self, ds: Iterable[D]) -> bool: ...
+    def popl(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def popr(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def popl_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def try_popl(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue: ...
+    def popr_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def try_popr(
+        self, block: bool = False, timeout: float | None = None
+    ) -> D | NoValue: ...
+    def popl_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def popr_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peakl(self) -> MayBe[D]: ...
+    def peakl_or[T](self, default: T) -> D | T: ...
+    def peakr(self) -> MayBe[D]: ...
+    def peakr_or[T](self, default: T) -> D | T: ...
+    @overload
+    def foldl[L](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, D], L], start: L) -> MayBe[L]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def foldr[R](self, f: Callable[[D, R], R], start: R) -> MayBe[R]: ...
+    @overload
+    def foldl_until[L](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldl_until[L](
+        self, f: Callable[[L, D], L | Done[L]], start: L
+    ) -> MayBe[L]: ...
+    @overload
+    def foldr_until[R](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldr_until[R](
+        self, f: Callable[[D, R], R | Done[R]], start: R
+    ) -> MayBe[R]: ...
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]: ...
+    def any(self, pred: Callable[[D], bool]) -> bool: ...
+    def all(self, pred: Callable[[D], bool]) -> bool: ...
+    def count(self, pred: Callable[[D], bool]) -> int: ...
+    def index_of(self, item: D) -> MayBe[int]: ...
+    def map[U](self, f: Callable[[D], U]) -> ConcurrentDEQueue[U]: ...
+    def retain(self, pred: Callable[[D], bool]) -> int: ...
+    def remove_if(self, pred: Callable[[D], bool]) -> int: ...
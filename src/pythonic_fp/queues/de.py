@@ -12,13 +12,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Callable, Iterable, Iterator
-from typing import cast, overload
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from itertools import islice
+from operator import length_hint
+from typing import TYPE_CHECKING, Any, cast, overload
 from pythonic_fp.circulararray.auto import CA
+from pythonic_fp.fptools.function import swap
 from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+from pythonic_fp.queues._numpy import _items_to_ndarray, _ndarray_items
+from pythonic_fp.queues._serial import (
+    _KIND_DE,
+    _LegacyState,
+    _QueueState,
+    _dump_state,
+    _load_state,
+    _upgrade_state,
+)
+from pythonic_fp.queues._storage import (
+    _ca_adopt,
+    _ca_clone,
+    _ca_items,
+    _ca_iter,
+    _ca_map_inplace,
+    _ca_retain,
+)
+from pythonic_fp.queues.done import Done, _fold_until
+from pythonic_fp.queues.lazy import LazyView
+from pythonic_fp.queues.overflow import Overflow, _push_bounded
+from pythonic_fp.queues.typed import TypedDEQueue
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
 
 __all__ = ['DEQueue', 'de_queue']
 
+_novalue = NoValue()
+
 
 class DEQueue[D]:
     """
@@ -32,13 +62,23 @@ class DEQueue[D]:
         - O(1) length determination
         - in a Boolean context, truthy if not empty, falsy if empty
         - will automatically increase storage capacity when needed
+        - unless bounded by ``maxlen``, then storage is allocated once
+        - can optionally give storage back as it drains
         - neither indexable nor sliceable by design
+        - not thread safe, share between threads as ``ConcurrentDEQueue``
 
     """
 
-    __slots__ = ('_ca',)
+    __slots__ = ('_ca', '_mutations', '_maxlen', '_overflow', '_growth', '_shrink')
 
-    def __init__(self, *ds: Iterable[D]) -> None:
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        maxlen: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        growth: float = 2.0,
+        shrink: float | None = None,
+    ) -> None:
         """
         .. admonition:: Initializer
 
@@ -46,14 +86,44 @@ class DEQueue[D]:
             the queue left (front) to right (rear).
 
         :param ds: Takes 0 or 1 iterable parameters.
+        :param maxlen: Optional bound on the number of items held.
+        :param overflow: What a push does when a bounded queue is full.
+        :param growth: Factor storage grows by when an unbounded queue fills.
+        :param shrink: Optional fill fraction below which pops release
+                       storage, ignored when bounded.
         :raises ValueError: When more than one parameter is provided.
+        :raises ValueError: When ``maxlen`` is not positive.
+        :raises ValueError: When ``growth`` is not greater than 1.
+        :raises ValueError: When ``shrink`` is not between 0 and ``1/growth``.
         :raises TypeError: When passed a non-iterable parameter.
 
         """
         if (size := len(ds)) > 1:
             msg = f'DEQueue expects at most 1 argument, got {size}'
             raise ValueError(msg)
-        self._ca = CA(ds[0]) if size == 1 else CA()
+        if growth <= 1.0:
+            msg = f'DEQueue expects growth greater than 1, got {growth}'
+            raise ValueError(msg)
+        if shrink is not None and not 0.0 < shrink < 1.0 / growth:
+            msg = f'DEQueue expects shrink between 0 and 1/growth, got {shrink}'
+            raise ValueError(msg)
+        self._maxlen = maxlen
+        self._overflow = overflow
+        self._growth = growth
+        self._shrink = shrink
+        self._mutations = 0
+        if size == 1 and isinstance(ds[0], DEQueue):
+            ds = (cast(tuple[D, ...], ds[0].snapshot()),)
+        if maxlen is None:
+            self._ca = CA(ds[0]) if size == 1 else CA()
+            return
+        if maxlen < 1:
+            msg = f'DEQueue expects a positive maxlen, got {maxlen}'
+            raise ValueError(msg)
+        self._ca = CA()
+        self._ca.resize(maxlen)
+        if size == 1:
+            self.extendr(ds[0])
 
     def __bool__(self) -> bool:
         """
@@ -94,10 +164,21 @@ class DEQueue[D]:
 
             Iterate over current state left to right.
 
+            .. note::
+
+                Iterates in place, no copy of the data is made. Use
+                ``snapshot`` to iterate over a copy instead.
+
         :returns: An iterator of the data.
+        :raises RuntimeError: When ``DEQueue`` mutated during iteration.
 
         """
-        return iter(list(self._ca))
+        mutations = self._mutations
+        for d in _ca_iter(self._ca):
+            yield d
+            if self._mutations != mutations:
+                msg = 'DEQueue mutated during iteration'
+                raise RuntimeError(msg)
 
     def __reversed__(self) -> Iterator[D]:
         """
@@ -105,10 +186,21 @@ class DEQueue[D]:
 
             Iterate over current state right to left.
 
+            .. note::
+
+                Iterates in place, no copy of the data is made. Use
+                ``snapshot`` to iterate over a copy instead.
+
         :returns: An iterator of the data.
+        :raises RuntimeError: When ``DEQueue`` mutated during iteration.
 
         """
-        return reversed(list(self._ca))
+        mutations = self._mutations
+        for d in _ca_iter(self._ca, reverse=True):
+            yield d
+            if self._mutations != mutations:
+                msg = 'DEQueue mutated during iteration'
+                raise RuntimeError(msg)
 
     def __repr__(self) -> str:
         """
@@ -138,6 +230,101 @@ class DEQueue[D]:
         """
         return '>< ' + ' | '.join(map(str, self)) + ' ><'
 
+    @property
+    def maxlen(self) -> int | None:
+        """
+        .. admonition:: Maximum length
+
+            Bound on the number of items held, ``None`` if unbounded.
+
+        """
+        return self._maxlen
+
+    @property
+    def overflow(self) -> Overflow:
+        """
+        .. admonition:: Overflow
+
+            What a push does when the ``DEQueue`` is bounded and full.
+
+        """
+        return self._overflow
+
+    @property
+    def capacity(self) -> int:
+        """
+        .. admonition:: Capacity
+
+            Number of items the ``DEQueue`` can hold before its
+            storage has to be reallocated.
+
+        """
+        return self._ca.capacity()
+
+    def reserve(self, n: int) -> None:
+        """
+        .. admonition:: Reserve
+
+            Make room for at least ``n`` more items up front, so
+            pushing a batch of known size reallocates storage at most
+            once. Bounded queues already have all their storage.
+
+        :param n: Number of items to make room for.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        if n < 0:
+            msg = f'DEQueue.reserve expects a non-negative count, got {n}'
+            raise ValueError(msg)
+        ca = self._ca
+        if self._maxlen is None and (need := len(ca) + n) > ca.capacity():
+            ca.resize(need)
+
+    def shrink_to_fit(self) -> None:
+        """
+        .. admonition:: Shrink to fit
+
+            Release unused storage. Bounded queues keep storage
+            for ``maxlen`` items.
+
+        """
+        if self._maxlen is None:
+            self._ca.resize()
+
+    def _grow(self, need: int) -> None:
+        # Grow storage by the growth factor, at least to need.
+        ca = self._ca
+        ca.resize(max(need, int(ca.capacity() * self._growth)))
+
+    def _maybe_shrink(self) -> None:
+        # Release storage once the fill fraction drops below shrink.
+        # Leaves room to grow by the growth factor, so shrinking and
+        # growing do not alternate while the queue length hovers near
+        # a threshold. Bounded queues keep storage for maxlen items.
+        if (shrink := self._shrink) is None or self._maxlen is not None:
+            return
+        ca = self._ca
+        if len(ca) < shrink * ca.capacity():
+            ca.resize(max(2, int(len(ca) * self._growth)))
+
+    @staticmethod
+    def typed[N: (int, float)](typecode: str, *ds: Iterable[N]) -> TypedDEQueue[N]:
+        """
+        .. admonition:: Typed DEQueue
+
+            Create a queue of numbers stored unboxed in a circular
+            ``array.array``, populated from 0 or 1 iterables
+            left to right.
+
+        :param typecode: Numeric ``array.array`` typecode, e.g. ``'d'`` or ``'q'``.
+        :param ds: Takes 0 or 1 iterable parameters.
+        :returns: New ``TypedDEQueue`` instance.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+        :raises ValueError: When more than one iterable is provided.
+
+        """
+        return TypedDEQueue(typecode, *ds)
+
     def copy(self) -> 'DEQueue[D]':
         """
         .. admonition:: Copy
@@ -147,29 +334,202 @@ class DEQueue[D]:
         :returns: New ``DEQueue`` instance containing the same references.
 
         """
-        return DEQueue(self._ca)
+        new: DEQueue[D] = DEQueue(growth=self._growth, shrink=self._shrink)
+        new._maxlen, new._overflow = self._maxlen, self._overflow
+        new._ca = _ca_clone(self._ca)
+        return new
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``DEQueue`` left to right.
+
+        :returns: A tuple of the data, left to right.
+
+        """
+        return tuple(_ca_items(self._ca))
 
-    def pushl(self, *ds: D) -> None:
+    def __getstate__(self) -> _QueueState[D]:
+        """
+        .. admonition:: Pickle state
+
+            The items, in storage order, and the ``DEQueue``'s
+            configuration. Pickles about as compactly as a list.
+
+        """
+        items = _ca_items(self._ca)
+        return items, self._maxlen, self._overflow, self._growth, self._shrink
+
+    def __setstate__(self, state: _QueueState[D] | _LegacyState) -> None:
+        """
+        .. admonition:: Restore pickle state
+
+            Rebuild the ``DEQueue`` from the state returned by
+            ``__getstate__``, adopting its list of items as storage.
+            Pickles made by releases up to 5.1.4 still load.
+
+        """
+        items, self._maxlen, self._overflow, self._growth, self._shrink = (
+            _upgrade_state(state)
+        )
+        self._mutations = 0
+        self._ca = _ca_adopt(items, self._maxlen or 0)
+
+    def to_bytes(self) -> bytes:
+        """
+        .. admonition:: To bytes
+
+            Checkpoint the ``DEQueue`` in a versioned binary format,
+            read back with ``DEQueue.from_bytes``. The items are pickled.
+
+        :returns: The checkpoint.
+
+        """
+        return _dump_state(_KIND_DE, self.__getstate__())
+
+    @staticmethod
+    def from_bytes(data: Buffer) -> 'DEQueue[Any]':
+        """
+        .. admonition:: From bytes
+
+            Restore a ``DEQueue`` checkpointed with ``to_bytes``.
+
+            .. warning::
+
+                Items are unpickled, only load checkpoints from
+                trusted sources.
+
+        :param data: The checkpoint.
+        :returns: New ``DEQueue`` instance.
+        :raises ValueError: When ``data`` is not a ``DEQueue`` checkpoint
+                            or its format version is not supported.
+
+        """
+        queue: DEQueue[Any] = DEQueue.__new__(DEQueue)
+        state = _load_state('DEQueue', _KIND_DE, data)
+        queue.__setstate__(cast(_QueueState[Any], state))
+        return queue
+
+    def pushl(self, *ds: D) -> bool:
         """
         .. admonition:: Push left
 
-            Push data onto left side of ``DEQueue``.
+            Push data onto left side of ``DEQueue``. When bounded
+            and full, items are evicted from the right side or the
+            push is refused according to the queue's overflow policy.
 
         :param ds: Data to be pushed onto ``DEQueue`` from the left.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
 
         """
-        self._ca.pushl(*ds)
-
-    def pushr(self, *ds: D) -> None:
+        ca = self._ca
+        self._mutations += 1
+        if self._maxlen is None:
+            if (need := len(ca) + len(ds)) > ca.capacity():
+                self._grow(need)
+            ca.pushl(*ds)
+            return True
+        return _push_bounded(ca, ds, self._maxlen, self._overflow, ca.pushl, ca.popr)
+
+    def pushr(self, *ds: D) -> bool:
         """
         .. admonition:: Push right
 
-            Push data onto right side of ``DEQueue``.
+            Push data onto right side of ``DEQueue``. When bounded
+            and full, items are evicted from the left side or the
+            push is refused according to the queue's overflow policy.
 
         :param ds: Data to be pushed onto ``DEQueue`` from the right.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        ca = self._ca
+        self._mutations += 1
+        if self._maxlen is None:
+            if (need := len(ca) + len(ds)) > ca.capacity():
+                self._grow(need)
+            ca.pushr(*ds)
+            return True
+        return _push_bounded(ca, ds, self._maxlen, self._overflow, ca.pushr, ca.popl)
+
+    def extendl(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend left
+
+            Push data items from an iterable onto the left side of
+            ``DEQueue``, like ``pushl``, without first collecting them
+            into a tuple. Storage is sized once up front when the
+            iterable knows its length. When bounded, the overflow
+            policy is applied item by item.
 
+        :param ds: Iterable of items to be pushed onto ``DEQueue``.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        ca = self._ca
+        if ds is self:
+            ds = self.snapshot()
+        pushl = ca.pushl
+        if (maxlen := self._maxlen) is None:
+            if (need := len(ca) + length_hint(ds)) > (cap := ca.capacity()):
+                self._grow(need)
+                cap = ca.capacity()
+            for d in ds:
+                if len(ca) == cap:
+                    self._grow(cap + 1)
+                    cap = ca.capacity()
+                pushl(d)
+                self._mutations += 1
+            return True
+        overflow, popr = self._overflow, ca.popr
+        stored, count = True, 0
+        for d in ds:
+            self._mutations += 1
+            count += 1
+            stored = _push_bounded(ca, (d,), maxlen, overflow, pushl, popr) and stored
+        return stored and count <= maxlen
+
+    def extendr(self, ds: Iterable[D]) -> bool:
         """
-        self._ca.pushr(*ds)
+        .. admonition:: Extend right
+
+            Push data items from an iterable onto the right side of
+            ``DEQueue``, like ``pushr``, without first collecting them
+            into a tuple. Storage is sized once up front when the
+            iterable knows its length. When bounded, the overflow
+            policy is applied item by item.
+
+        :param ds: Iterable of items to be pushed onto ``DEQueue``.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        ca = self._ca
+        if ds is self:
+            ds = self.snapshot()
+        pushr = ca.pushr
+        if (maxlen := self._maxlen) is None:
+            if (need := len(ca) + length_hint(ds)) > (cap := ca.capacity()):
+                self._grow(need)
+                cap = ca.capacity()
+            for d in ds:
+                if len(ca) == cap:
+                    self._grow(cap + 1)
+                    cap = ca.capacity()
+                pushr(d)
+                self._mutations += 1
+            return True
+        overflow, popl = self._overflow, ca.popl
+        stored, count = True, 0
+        for d in ds:
+            self._mutations += 1
+            count += 1
+            stored = _push_bounded(ca, (d,), maxlen, overflow, pushr, popl) and stored
+        return stored and count <= maxlen
 
     def popl(self) -> MayBe[D]:
         """
@@ -181,8 +541,13 @@ class DEQueue[D]:
                   empty ``MayBe`` otherwise.
 
         """
-        if self._ca:
-            return MayBe(self._ca.popl())
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popl()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return MayBe(d)
         return MayBe()
 
     def popr(self) -> MayBe[D]:
@@ -195,10 +560,153 @@ class DEQueue[D]:
                   empty ``MayBe`` otherwise.
 
         """
-        if self._ca:
-            return MayBe(self._ca.popr())
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popr()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return MayBe(d)
         return MayBe()
 
+    def popl_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop left or default
+
+            Pop next item off left side of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``DEQueue`` is empty.
+        :returns: Popped data item, ``default`` if ``DEQueue`` was empty.
+
+        """
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popl()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return d
+        return default
+
+    def try_popl(self) -> D | NoValue:
+        """
+        .. admonition:: Try pop left
+
+            Pop next item off left side of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :returns: Popped data item, ``NoValue()`` if ``DEQueue`` was empty.
+
+        """
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popl()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return d
+        return _novalue
+
+    def popr_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop right or default
+
+            Pop next item off right side of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``DEQueue`` is empty.
+        :returns: Popped data item, ``default`` if ``DEQueue`` was empty.
+
+        """
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popr()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return d
+        return default
+
+    def try_popr(self) -> D | NoValue:
+        """
+        .. admonition:: Try pop right
+
+            Pop next item off right side of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :returns: Popped data item, ``NoValue()`` if ``DEQueue`` was empty.
+
+        """
+        ca = self._ca
+        if ca:
+            self._mutations += 1
+            d = ca.popr()
+            if self._shrink is not None:
+                self._maybe_shrink()
+            return d
+        return _novalue
+
+    def popl_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many left
+
+            Pop up to ``k`` data items off of ``DEQueue``, all of
+            them if ``k`` not given. No ``MayBe`` is constructed
+            per item.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        if k is not None and k < 0:
+            msg = f'DEQueue.popl_many expects a non-negative count, got {k}'
+            raise ValueError(msg)
+        ca = self._ca
+        if not ca or k == 0:
+            return ()
+        if k is None or k >= len(ca):
+            items = tuple(ca)
+            ca.empty()
+        else:
+            popl = ca.popl
+            items = tuple([popl() for _ in range(k)])
+        self._mutations += 1
+        if self._shrink is not None:
+            self._maybe_shrink()
+        return items
+
+    def popr_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many right
+
+            Pop up to ``k`` data items off of ``DEQueue``, all of
+            them if ``k`` not given. No ``MayBe`` is constructed
+            per item.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, right to left.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        if k is not None and k < 0:
+            msg = f'DEQueue.popr_many expects a non-negative count, got {k}'
+            raise ValueError(msg)
+        ca = self._ca
+        if not ca or k == 0:
+            return ()
+        if k is None or k >= len(ca):
+            items = tuple(reversed(ca))
+            ca.empty()
+        else:
+            popr = ca.popr
+            items = tuple([popr() for _ in range(k)])
+        self._mutations += 1
+        if self._shrink is not None:
+            self._maybe_shrink()
+        return items
+
     def peakl(self) -> MayBe[D]:
         """
         .. admonition:: Peak left
@@ -213,6 +721,21 @@ class DEQueue[D]:
             return MayBe(self._ca[0])
         return MayBe()
 
+    def peakl_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak left or default
+
+            Peak at leftmost item of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``DEQueue`` is empty.
+        :returns: The item, ``default`` if ``DEQueue`` empty.
+
+        """
+        if self._ca:
+            return self._ca[0]
+        return default
+
     def peakr(self) -> MayBe[D]:
         """
         .. admonition:: Peak right
@@ -227,6 +750,21 @@ class DEQueue[D]:
             return MayBe(self._ca[-1])
         return MayBe()
 
+    def peakr_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Peak right or default
+
+            Peak at rightmost item of ``DEQueue``,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``DEQueue`` is empty.
+        :returns: The item, ``default`` if ``DEQueue`` empty.
+
+        """
+        if self._ca:
+            return self._ca[-1]
+        return default
+
     @overload
     def foldl[L](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
     @overload
@@ -273,6 +811,125 @@ class DEQueue[D]:
             return MayBe(cast(R, self._ca.foldr(cast(Callable[[D, D], D], f))))  # R = D
         return MayBe(self._ca.foldr(f, start))
 
+    @overload
+    def foldl_until[L](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldl_until[L](
+        self, f: Callable[[L, D], L | Done[L]], start: L
+    ) -> MayBe[L]: ...
+
+    def foldl_until[L](
+        self, f: Callable[[L, D], L | Done[L]], start: L | None = None
+    ) -> MayBe[L]:
+        """
+        .. admonition:: Fold left until done
+
+            Reduce ``DEQueue`` left to right, stopping early
+            when ``f`` returns its result wrapped in ``Done``.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe`` if
+                  queue empty and no starting value given.
+        :raises RuntimeError: When ``f`` mutates the ``DEQueue``.
+
+        """
+        return _fold_until(iter(self), f, start)
+
+    @overload
+    def foldr_until[R](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def foldr_until[R](
+        self, f: Callable[[D, R], R | Done[R]], start: R
+    ) -> MayBe[R]: ...
+
+    def foldr_until[R](
+        self, f: Callable[[D, R], R | Done[R]], start: R | None = None
+    ) -> MayBe[R]:
+        """
+        .. admonition:: Fold right until done
+
+            Reduce ``DEQueue`` right to left, stopping early
+            when ``f`` returns its result wrapped in ``Done``.
+
+        :param f: Reducing function, second argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if queue empty and no starting value given.
+        :raises RuntimeError: When ``f`` mutates the ``DEQueue``.
+
+        """
+        return _fold_until(reversed(self), swap(f), start)
+
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]:
+        """
+        .. admonition:: Find
+
+            Find the first item, left to right, satisfying ``pred``.
+            Stops at the first match.
+
+        :param pred: Predicate to satisfy.
+        :returns: ``MayBe`` of the item found, empty ``MayBe`` if none found.
+
+        """
+        for d in self:
+            if pred(d):
+                return MayBe(d)
+        return MayBe()
+
+    def any(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: Any
+
+            Stops at the first item satisfying ``pred``.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if any item satisfies ``pred``.
+
+        """
+        return any(map(pred, self))
+
+    def all(self, pred: Callable[[D], bool]) -> bool:
+        """
+        .. admonition:: All
+
+            Stops at the first item not satisfying ``pred``.
+
+        :param pred: Predicate to test.
+        :returns: ``True`` if all items satisfy ``pred``, even when empty.
+
+        """
+        return all(map(pred, self))
+
+    def count(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Count
+
+            Count the items satisfying ``pred``, without copying the queue.
+
+        :param pred: Predicate to test.
+        :returns: Number of items satisfying ``pred``.
+
+        """
+        return sum(1 for d in self if pred(d))
+
+    def index_of(self, item: D) -> MayBe[int]:
+        """
+        .. admonition:: Index of
+
+            Position of the first item, left to right, equal to ``item``.
+            Stops at the first match.
+
+        :param item: Item to look for.
+        :returns: ``MayBe`` of its position, 0 being the leftmost item,
+                  empty ``MayBe`` if not found.
+
+        """
+        for idx, d in enumerate(self):
+            if d is item or d == item:
+                return MayBe(idx)
+        return MayBe()
+
     def map[U](self, f: Callable[[D], U]) -> 'DEQueue[U]':
         """
         .. admonition:: Map
@@ -287,7 +944,157 @@ class DEQueue[D]:
         :returns: New ``DEQueue`` instance, retain original order.
 
         """
-        return DEQueue(map(f, self._ca))
+        mapped = list(map(f, _ca_items(self._ca)))
+        new: DEQueue[U] = DEQueue(growth=self._growth, shrink=self._shrink)
+        new._maxlen, new._overflow = self._maxlen, self._overflow
+        new._ca = _ca_adopt(mapped, self._maxlen or 0)
+        return new
+
+    def extend_from_array(self, arr: 'NDArray[Any]') -> bool:
+        """
+        .. admonition:: Extend from array
+
+            Push the items of a one dimensional NumPy array onto
+            right side of ``DEQueue``, converted to Python scalars in one
+            pass instead of one NumPy scalar at a time.
+
+        :param arr: One dimensional array of items, left to right.
+        :returns: ``True`` if all items were kept, as for ``extendr``.
+        :raises ValueError: When ``arr`` is not one dimensional.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        items = _ndarray_items('DEQueue.extend_from_array', arr)
+        return self.extendr(cast(list[D], items))
+
+    def drain_to_array(
+        self, k: int | None = None, dtype: 'DTypeLike | None' = None
+    ) -> 'NDArray[Any]':
+        """
+        .. admonition:: Drain to array
+
+            Pop up to ``k`` data items off left side of ``DEQueue``
+            into a NumPy array, all of them if ``k`` not given. Nothing
+            is popped if the items cannot be converted.
+
+        :param k: Maximum number of items to pop.
+        :param dtype: Optional NumPy dtype of the array, inferred if not given.
+        :returns: A NumPy array of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        if k is not None and k < 0:
+            msg = f'DEQueue.drain_to_array expects a non-negative count, got {k}'
+            raise ValueError(msg)
+        out = _items_to_ndarray(list(islice(_ca_iter(self._ca), k)), dtype)
+        self.popl_many(len(out))
+        return out
+
+    def to_numpy(self, dtype: 'DTypeLike | None' = None) -> 'NDArray[Any]':
+        """
+        .. admonition:: To NumPy
+
+            Copy current state of ``DEQueue`` into a NumPy array
+            in left to right order. Storage is copied with at most two slices
+            then converted by NumPy in one pass.
+
+        :param dtype: Optional NumPy dtype of the array, inferred if not given.
+        :returns: A NumPy array of the data, left to right.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        return _items_to_ndarray(_ca_items(self._ca), dtype)
+
+    def lazy(self) -> LazyView[D]:
+        """
+        .. admonition:: Lazy
+
+            Lazy view of the ``DEQueue`` in left to right. Transformations
+            chained on it are fused into a single pass over the queue.
+
+        :returns: A ``LazyView`` of the ``DEQueue``.
+
+        """
+        return LazyView(self.__iter__)
+
+    def map_inplace(self, f: Callable[[D], D]) -> None:
+        """
+        .. admonition:: Map in place
+
+            Replace each item ``d`` of the ``DEQueue`` with ``f(d)``,
+            applied left to right. Storage is reused, no new queue
+            is made.
+
+        :param f: Function to map over ``DEQueue``.
+
+        """
+        _ca_map_inplace(self._ca, f)
+        self._mutations += 1
+
+    def retain(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Retain
+
+            Keep only the items satisfying ``pred``, in their original
+            order, compacting the existing storage in one pass.
+
+            .. note::
+
+                If ``pred`` raises, items not yet examined are kept.
+
+        :param pred: Predicate applied to each item left to right.
+        :returns: Number of items removed.
+
+        """
+        ca = self._ca
+        self._mutations += 1
+        removed = _ca_retain(ca, pred)
+        if self._shrink is not None:
+            self._maybe_shrink()
+        return removed
+
+    def remove_if(self, pred: Callable[[D], bool]) -> int:
+        """
+        .. admonition:: Remove if
+
+            Remove the items satisfying ``pred``, the rest keeping
+            their original order, compacting the existing storage
+            in one pass.
+
+        :param pred: Predicate applied to each item left to right.
+        :returns: Number of items removed.
+
+        """
+
+        def keep(d: D) -> bool:
+            return not pred(d)
+
+        return self.retain(keep)
+
+    def dedupe(self) -> int:
+        """
+        .. admonition:: Dedupe
+
+            Remove repeated items, keeping the first occurrence of
+            each with items taken left to right.
+
+            .. note::
+
+                Items must be hashable.
+
+        :returns: Number of items removed.
+
+        """
+        seen: set[D] = set()
+
+        def first(d: D) -> bool:
+            if d in seen:
+                return False
+            seen.add(d)
+            return True
+
+        return self.retain(first)
 
 
 def de_queue[D](*ds: D) -> DEQueue[D]:
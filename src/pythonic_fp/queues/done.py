@@ -0,0 +1,99 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Early exit folds
+
+    Reducing functions passed to the ``*_until`` folds stop the fold
+    by returning their final value wrapped in ``Done``.
+
+    .. code:: python
+
+        from pythonic_fp.queues.done import Done
+
+        def bounded_sum(acc: int, d: int) -> int | Done[int]:
+            return Done(acc) if acc + d > 100 else acc + d
+
+        fifo.fold_until(bounded_sum, 0)
+
+"""
+
+from collections.abc import Callable, Iterator
+from typing import cast, final
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['Done']
+
+
+@final
+class Done[T]:
+    """
+    .. admonition:: Done
+
+        Marks the final value of an early exit fold.
+
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: T) -> None:
+        """
+        .. admonition:: Initializer
+
+            Wrap the final value of a fold.
+
+        :param value: The fold's final value.
+
+        """
+        self.value = value
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'Done(value)'.
+
+        """
+        return f'Done({self.value!r})'
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            Equal if ``other`` is a ``Done`` with an equal value.
+
+        """
+        if not isinstance(other, Done):
+            return False
+        return bool(self.value == other.value)
+
+
+def _fold_until[T, D](
+    it: Iterator[D], f: Callable[[T, D], T | Done[T]], start: T | None
+) -> MayBe[T]:
+    # Left fold over it, stopping when f returns a Done. With no start,
+    # the first item is the starting value.
+    acc: T | Done[T]
+    if start is None:
+        for first in it:
+            acc = cast(T, first)  # T = D
+            break
+        else:
+            return MayBe()
+    else:
+        acc = start
+    for d in it:
+        if isinstance(acc := f(acc, d), Done):
+            return MayBe(acc.value)
+    return MayBe(acc)
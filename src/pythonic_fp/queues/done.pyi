@@ -0,0 +1,15 @@
+from collections.abc import Callable, Iterator
+from pythonic_fp.fptools.maybe import MayBe
+from typing import final
+
+__all__ = ['Done']
+
+@final
+class Done[T]:
+    value: T
+    def __init__(self, value: T) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+
+def _fold_until[T, D](
+    it: Iterator[D], f: Callable[[T, D], T | Done[T]], start: T | None
+) -> MayBe[T]: ...
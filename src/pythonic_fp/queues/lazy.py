@@ -0,0 +1,254 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Lazy views
+
+    Chains of transformations over a queue, fused into a single pass
+    over its storage when finally consumed.
+
+    - no intermediate queues are built
+    - nothing is evaluated until the view is folded, iterated or
+      materialized into a new queue
+    - ``take`` stops the pass early, the rest of the queue is not visited
+
+"""
+
+from collections.abc import Callable, Iterator
+from functools import reduce
+from itertools import islice
+from typing import TYPE_CHECKING, cast, overload
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.done import Done, _fold_until
+
+if TYPE_CHECKING:
+    from pythonic_fp.queues.de import DEQueue
+    from pythonic_fp.queues.fifo import FIFOQueue
+    from pythonic_fp.queues.lifo import LIFOQueue
+
+__all__ = ['LazyView']
+
+
+class LazyView[D]:
+    """
+    .. admonition:: LazyView
+
+        Lazy, re-iterable view of a queue's data in the queue's
+        natural order, with transformations applied on the fly.
+
+        .. note::
+
+            The queue is read when the view is consumed, not when
+            the view is created. Mutating the queue while the view
+            is being consumed raises a ``RuntimeError``.
+
+    """
+
+    __slots__ = ('_source',)
+
+    def __init__(self, source: Callable[[], Iterator[D]]) -> None:
+        """
+        .. admonition:: Initializer
+
+            Usually created with a queue's ``lazy`` method.
+
+        :param source: Returns a fresh iterator each time the view is consumed.
+
+        """
+        self._source = source
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Run the fused pipeline, yielding the resulting items.
+
+        :returns: An iterator of the transformed data.
+
+        """
+        return self._source()
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Views are not evaluated to be displayed.
+
+        """
+        return 'LazyView(...)'
+
+    def map[U](self, f: Callable[[D], U]) -> 'LazyView[U]':
+        """
+        .. admonition:: Map
+
+            Lazily apply ``f`` to each item.
+
+        :param f: Function to map over the view.
+        :returns: New ``LazyView`` instance.
+
+        """
+        source = self._source
+        return LazyView(lambda: map(f, source()))
+
+    def filter(self, pred: Callable[[D], bool]) -> 'LazyView[D]':
+        """
+        .. admonition:: Filter
+
+            Lazily keep only the items satisfying ``pred``.
+
+        :param pred: Predicate items must satisfy.
+        :returns: New ``LazyView`` instance.
+
+        """
+        source = self._source
+        return LazyView(lambda: filter(pred, source()))
+
+    def take(self, n: int) -> 'LazyView[D]':
+        """
+        .. admonition:: Take
+
+            Lazily keep only the first ``n`` items. Consuming the view
+            stops once they are produced.
+
+        :param n: Maximum number of items.
+        :returns: New ``LazyView`` instance.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        if n < 0:
+            msg = f'LazyView.take expects a non-negative count, got {n}'
+            raise ValueError(msg)
+        source = self._source
+        return LazyView(lambda: islice(source(), n))
+
+    def drop(self, n: int) -> 'LazyView[D]':
+        """
+        .. admonition:: Drop
+
+            Lazily skip the first ``n`` items.
+
+        :param n: Number of items to skip.
+        :returns: New ``LazyView`` instance.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        if n < 0:
+            msg = f'LazyView.drop expects a non-negative count, got {n}'
+            raise ValueError(msg)
+        source = self._source
+        return LazyView(lambda: islice(source(), n, None))
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Run the fused pipeline, reducing its items in one pass.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if no items are produced and no starting value given.
+
+        """
+        it = self._source()
+        if start is None:
+            for first in it:
+                return MayBe(
+                    cast(T, reduce(cast(Callable[[D, D], D], f), it, first))
+                )  # T = D
+            return MayBe()
+        return MayBe(reduce(f, it, start))
+
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+
+    def fold_until[T](
+        self, f: Callable[[T, D], T | Done[T]], start: T | None = None
+    ) -> MayBe[T]:
+        """
+        .. admonition:: Fold until done
+
+            Run the fused pipeline, stopping it early when ``f``
+            returns its result wrapped in ``Done``.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if no items are produced and no starting value given.
+
+        """
+        return _fold_until(self._source(), f, start)
+
+    def to_fifo(self) -> 'FIFOQueue[D]':
+        """
+        .. admonition:: To FIFOQueue
+
+            Materialize the view, items pushed in view order.
+
+        :returns: New ``FIFOQueue`` instance.
+
+        """
+        from pythonic_fp.queues.fifo import FIFOQueue
+
+        return FIFOQueue(self)
+
+    def to_lifo(self) -> 'LIFOQueue[D]':
+        """
+        .. admonition:: To LIFOQueue
+
+            Materialize the view, items pushed in view order.
+
+            .. note::
+
+                Like ``LIFOQueue(iterable)``, the last item of the view
+                ends up on top. A view of a ``LIFOQueue`` comes out
+                reversed.
+
+        :returns: New ``LIFOQueue`` instance.
+
+        """
+        from pythonic_fp.queues.lifo import LIFOQueue
+
+        return LIFOQueue(self)
+
+    def to_de(self) -> 'DEQueue[D]':
+        """
+        .. admonition:: To DEQueue
+
+            Materialize the view, items left to right in view order.
+
+        :returns: New ``DEQueue`` instance.
+
+        """
+        from pythonic_fp.queues.de import DEQueue
+
+        return DEQueue(self)
+
+    def to_tuple(self) -> tuple[D, ...]:
+        """
+        .. admonition:: To tuple
+
+            Materialize the view into a tuple.
+
+        :returns: A tuple of the transformed data.
+
+        """
+        return tuple(self._source())
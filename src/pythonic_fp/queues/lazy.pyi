@@ -0,0 +1,29 @@
+from collections.abc import Callable, Iterator
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.done import Done
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+from typing import overload
+
+__all__ = ['LazyView']
+
+class LazyView[D]:
+    def __init__(self, source: Callable[[], Iterator[D]]) -> None: ...
+    def __iter__(self) -> Iterator[D]: ...
+    def map[U](self, f: Callable[[D], U]) -> LazyView[U]: ...
+    def filter(self, pred: Callable[[D], bool]) -> LazyView[D]: ...
+    def take(self, n: int) -> LazyView[D]: ...
+    def drop(self, n: int) -> LazyView[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+    def to_fifo(self) -> FIFOQueue[D]: ...
+    def to_lifo(self) -> LIFOQueue[D]: ...
+    def to_de(self) -> DEQueue[D]: ...
+    def to_tuple(self) -> tuple[D, ...]: ...
@@ -1,23 +1,79 @@
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from numpy.typing import DTypeLike, NDArray
 from pythonic_fp.fptools.maybe import MayBe
-from typing import overload
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+from pythonic_fp.queues._serial import _LegacyState, _QueueState
+from pythonic_fp.queues.done import Done
+from pythonic_fp.queues.lazy import LazyView
+from pythonic_fp.queues.overflow import Overflow
+from pythonic_fp.queues.typed import TypedLIFOQueue
+from typing import Any, overload
 
 __all__ = ['LIFOQueue', 'lifo_queue']
 
 class LIFOQueue[D]:
-    def __init__(self, *dss: Iterable[D]) -> None: ...
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        maxlen: int | None = None,
+        overflow: Overflow = Overflow.DROP_OLDEST,
+        growth: float = 2.0,
+        shrink: float | None = None,
+    ) -> None: ...
     def __bool__(self) -> bool: ...
     def __len__(self) -> int: ...
     def __eq__(self, other: object) -> bool: ...
     def __iter__(self) -> Iterator[D]: ...
+    @property
+    def maxlen(self) -> int | None: ...
+    @property
+    def overflow(self) -> Overflow: ...
+    @property
+    def capacity(self) -> int: ...
+    def reserve(self, n: int) -> None: ...
+    def shrink_to_fit(self) -> None: ...
+    @staticmethod
+    def typed[N: (int, float)](
+        typecode: str, *ds: Iterable[N]
+    ) -> TypedLIFOQueue[N]: ...
     def copy(self) -> LIFOQueue[D]: ...
-    def push(self, *ds: D) -> None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def __getstate__(self) -> _QueueState[D]: ...
+    def __setstate__(self, state: _QueueState[D] | _LegacyState) -> None: ...
+    def to_bytes(self) -> bytes: ...
+    @staticmethod
+    def from_bytes(data: Buffer) -> LIFOQueue[Any]: ...
+    def push(self, *ds: D) -> bool: ...
+    def extend(self, ds: Iterable[D]) -> bool: ...
     def pop(self) -> MayBe[D]: ...
+    def pop_or[T](self, default: T) -> D | T: ...
+    def try_pop(self) -> D | NoValue: ...
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]: ...
     def peak(self) -> MayBe[D]: ...
+    def peak_or[T](self, default: T) -> D | T: ...
     @overload
     def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
     @overload
     def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[D, D], D | Done[D]]) -> MayBe[D]: ...
+    @overload
+    def fold_until[T](self, f: Callable[[T, D], T | Done[T]], start: T) -> MayBe[T]: ...
+    def find(self, pred: Callable[[D], bool]) -> MayBe[D]: ...
+    def any(self, pred: Callable[[D], bool]) -> bool: ...
+    def all(self, pred: Callable[[D], bool]) -> bool: ...
+    def count(self, pred: Callable[[D], bool]) -> int: ...
+    def index_of(self, item: D) -> MayBe[int]: ...
     def map[U](self, f: Callable[[D], U]) -> LIFOQueue[U]: ...
+    def extend_from_array(self, arr: NDArray[Any]) -> bool: ...
+    def drain_to_array(
+        self, k: int | None = None, dtype: DTypeLike | None = None
+    ) -> NDArray[Any]: ...
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]: ...
+    def lazy(self) -> LazyView[D]: ...
+    def map_inplace(self, f: Callable[[D], D]) -> None: ...
+    def retain(self, pred: Callable[[D], bool]) -> int: ...
+    def remove_if(self, pred: Callable[[D], bool]) -> int: ...
+    def dedupe(self) -> int: ...
 
 def lifo_queue[D](*ds: D) -> LIFOQueue[D]: ...
@@ -0,0 +1,1010 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Queue metrics
+
+    Opt-in instrumentation for ``FIFOQueue`` and ``DEQueue``. Wrap a
+    queue to count its pushes and pops, track its peak length and the
+    reallocations of its storage, and optionally histogram how long
+    items wait on it.
+
+    - queues not wrapped pay nothing, instrumentation is opt-in
+    - metrics read as a plain ``dict`` snapshot
+    - callbacks hand snapshots to an exporter, e.g. Prometheus gauges
+
+    .. code:: python
+
+        from pythonic_fp.queues.fifo import FIFOQueue
+        from pythonic_fp.queues.metrics import InstrumentedFIFOQueue, LatencyHistogram
+
+        jobs = InstrumentedFIFOQueue(FIFOQueue(), latency=LatencyHistogram())
+        jobs.metrics.add_callback(export)
+        ...
+        jobs.metrics.publish()
+
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from time import perf_counter
+from typing import Any, cast
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+
+__all__ = [
+    'InstrumentedDEQueue',
+    'InstrumentedFIFOQueue',
+    'LatencyHistogram',
+    'QueueMetrics',
+]
+
+_novalue = NoValue()
+
+type _Queue = FIFOQueue[Any] | DEQueue[Any]
+
+# Upper bucket bounds in seconds, 1 microsecond to 10 seconds.
+_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    .. admonition:: LatencyHistogram
+
+        Histogram of how long items waited on a queue, in seconds,
+        with fixed bucket upper bounds as Prometheus histograms have.
+
+        - O(log buckets) per observation
+        - snapshot buckets are cumulative, ending with ``inf``
+
+    """
+
+    __slots__ = ('_bounds', '_counts', '_sum')
+
+    def __init__(self, bounds: Iterable[float] = _BUCKETS) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create an empty ``LatencyHistogram``.
+
+        :param bounds: Bucket upper bounds in seconds, 1µs to 10s
+                       by powers of 10 if not given.
+        :raises ValueError: When ``bounds`` is empty, not positive
+                            or has duplicates.
+
+        """
+        bounds = tuple(sorted(bounds))
+        if not bounds or bounds[0] <= 0 or len(set(bounds)) != len(bounds):
+            msg = f'LatencyHistogram expects distinct positive bounds, got {bounds}'
+            raise ValueError(msg)
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'LatencyHistogram((b₁, b₂, … bₙ))'.
+
+        """
+        return f'LatencyHistogram({self._bounds!r})'
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """
+        .. admonition:: Bounds
+
+            Bucket upper bounds in seconds, not counting ``inf``.
+
+        """
+        return self._bounds
+
+    @property
+    def count(self) -> int:
+        """
+        .. admonition:: Count
+
+            Number of latencies observed.
+
+        """
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """
+        .. admonition:: Sum
+
+            Total of the latencies observed, in seconds.
+
+        """
+        return self._sum
+
+    def observe(self, seconds: float) -> None:
+        """
+        .. admonition:: Observe
+
+            Record a latency.
+
+        :param seconds: Latency in seconds.
+
+        """
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self._sum += seconds
+
+    def reset(self) -> None:
+        """
+        .. admonition:: Reset
+
+            Forget all observed latencies.
+
+        """
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        .. admonition:: Snapshot
+
+            Current state, Prometheus style.
+
+        :returns: A dict with ``buckets``, mapping each upper bound,
+                  then ``inf``, to the number of latencies not above
+                  it, ``count`` and ``sum``.
+
+        """
+        buckets: dict[float, int] = {}
+        total = 0
+        for bound, n in zip((*self._bounds, float('inf')), self._counts):
+            total += n
+            buckets[bound] = total
+        return {'buckets': buckets, 'count': total, 'sum': self._sum}
+
+    def _observe_since(self, times: tuple[float, ...]) -> None:
+        # Record the time waited since each push time.
+        now = perf_counter()
+        counts, bounds = self._counts, self._bounds
+        for t in times:
+            waited = now - t
+            counts[bisect_left(bounds, waited)] += 1
+            self._sum += waited
+
+
+class QueueMetrics:
+    """
+    .. admonition:: QueueMetrics
+
+        Counters kept by an instrumented queue, see its ``metrics``
+        property.
+
+        - ``pushes`` counts items offered, ``dropped`` those the queue
+          discarded or evicted to make room
+        - ``resizes`` counts reallocations of the queue's storage
+        - ``latency`` is ``None`` unless a ``LatencyHistogram`` was given
+
+    """
+
+    __slots__ = (
+        '_callbacks',
+        '_capacity',
+        '_dropped',
+        '_latency',
+        '_peak',
+        '_pops',
+        '_pushes',
+        '_queue',
+        '_resizes',
+    )
+
+    def __init__(self, queue: _Queue, latency: LatencyHistogram | None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Created by the instrumented queues, not directly.
+
+        """
+        self._queue = queue
+        self._pushes = 0
+        self._pops = 0
+        self._dropped = 0
+        self._peak = len(queue)
+        self._resizes = 0
+        self._capacity = queue.capacity
+        self._latency = latency
+        self._callbacks: list[Callable[[dict[str, Any]], None]] = []
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'QueueMetrics(pushes=…, pops=…, …)'.
+
+        """
+        fields = (
+            f'{name}={value!r}'
+            for name, value in self.snapshot().items()
+            if name != 'latency'
+        )
+        return 'QueueMetrics(' + ', '.join(fields) + ')'
+
+    @property
+    def pushes(self) -> int:
+        """
+        .. admonition:: Pushes
+
+            Number of items pushed, or offered to a bounded queue.
+
+        """
+        return self._pushes
+
+    @property
+    def pops(self) -> int:
+        """
+        .. admonition:: Pops
+
+            Number of items popped.
+
+        """
+        return self._pops
+
+    @property
+    def dropped(self) -> int:
+        """
+        .. admonition:: Dropped
+
+            Number of items a bounded queue refused or evicted.
+
+        """
+        return self._dropped
+
+    @property
+    def peak_length(self) -> int:
+        """
+        .. admonition:: Peak length
+
+            High-water mark of the queue's length since created or reset.
+
+        """
+        return self._peak
+
+    @property
+    def resizes(self) -> int:
+        """
+        .. admonition:: Resizes
+
+            Number of times the queue's storage was reallocated.
+
+        """
+        return self._resizes
+
+    @property
+    def latency(self) -> LatencyHistogram | None:
+        """
+        .. admonition:: Latency
+
+            Histogram of push to pop latencies, ``None`` if not kept.
+
+        """
+        return self._latency
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        .. admonition:: Snapshot
+
+            Current counters, plus the queue's length and capacity.
+
+        :returns: A dict with ``pushes``, ``pops``, ``dropped``,
+                  ``length``, ``peak_length``, ``capacity``,
+                  ``resizes`` and, when kept, ``latency``.
+
+        """
+        stats: dict[str, Any] = {
+            'pushes': self._pushes,
+            'pops': self._pops,
+            'dropped': self._dropped,
+            'length': len(self._queue),
+            'peak_length': self._peak,
+            'capacity': self._capacity,
+            'resizes': self._resizes,
+        }
+        if self._latency is not None:
+            stats['latency'] = self._latency.snapshot()
+        return stats
+
+    def reset(self) -> None:
+        """
+        .. admonition:: Reset
+
+            Zero the counters and the latency histogram. The peak
+            length restarts from the current length.
+
+        """
+        self._pushes = self._pops = self._dropped = self._resizes = 0
+        self._peak = len(self._queue)
+        if self._latency is not None:
+            self._latency.reset()
+
+    def add_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """
+        .. admonition:: Add callback
+
+            Have ``publish`` pass snapshots to ``callback``.
+
+        :param callback: Called with each published snapshot.
+
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """
+        .. admonition:: Remove callback
+
+            Stop passing snapshots to ``callback``.
+
+        :param callback: A callback previously added.
+        :raises ValueError: When ``callback`` was not added.
+
+        """
+        self._callbacks.remove(callback)
+
+    def publish(self) -> dict[str, Any]:
+        """
+        .. admonition:: Publish
+
+            Take a snapshot and pass it to every callback, in the
+            order they were added.
+
+        :returns: The snapshot published.
+
+        """
+        stats = self.snapshot()
+        for callback in tuple(self._callbacks):
+            callback(stats)
+        return stats
+
+    def _pushed(self, n: int, before: int) -> None:
+        # Bookkeeping after n items were offered to a queue of length before.
+        length = len(self._queue)
+        self._pushes += n
+        if dropped := before + n - length:
+            self._dropped += dropped
+        self._peak = max(self._peak, length)
+        if (capacity := self._queue.capacity) != self._capacity:
+            self._capacity = capacity
+            self._resizes += 1
+
+    def _popped(self, n: int) -> None:
+        # Bookkeeping after n items were popped.
+        self._pops += n
+        if (capacity := self._queue.capacity) != self._capacity:
+            self._capacity = capacity
+            self._resizes += 1
+
+
+class InstrumentedFIFOQueue[D]:
+    """
+    .. admonition:: InstrumentedFIFOQueue
+
+        ``FIFOQueue`` wrapper keeping ``QueueMetrics``.
+
+        - same push and pop API as ``FIFOQueue``
+        - mutate the queue only through the wrapper, or the metrics,
+          and latencies in particular, go astray
+        - a few attribute updates per call, plus a ``perf_counter``
+          call and a timestamp queue when keeping latencies
+        - not thread safe, no more than the wrapped queue is
+
+    """
+
+    __slots__ = ('_metrics', '_queue', '_times')
+
+    def __init__(
+        self,
+        queue: FIFOQueue[D] | None = None,
+        *,
+        latency: LatencyHistogram | None = None,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Instrument a ``FIFOQueue``. Items already on it are timed
+            from now.
+
+        :param queue: Queue to instrument, a new empty one if not given.
+        :param latency: Histogram to record latencies in, none kept if not given.
+
+        """
+        if queue is None:
+            queue = FIFOQueue()
+        self._queue = queue
+        self._metrics = QueueMetrics(queue, latency)
+        self._times: FIFOQueue[float] | None = None
+        if latency is not None:
+            self._times = FIFOQueue(maxlen=queue.maxlen, overflow=queue.overflow)
+            self._times.push(*(perf_counter(),) * len(queue))
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``InstrumentedFIFOQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._queue) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``InstrumentedFIFOQueue``.
+
+        """
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over the wrapped queue in natural FIFO order.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self._queue)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'InstrumentedFIFOQueue(FIFOQueue(…))'.
+
+        """
+        return f'InstrumentedFIFOQueue({self._queue!r})'
+
+    @property
+    def queue(self) -> FIFOQueue[D]:
+        """
+        .. admonition:: Queue
+
+            The wrapped ``FIFOQueue``, read it but do not mutate it.
+
+        """
+        return self._queue
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        """
+        .. admonition:: Metrics
+
+            The ``QueueMetrics`` kept for the wrapped queue.
+
+        """
+        return self._metrics
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of the wrapped queue in natural FIFO order.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        return self._queue.snapshot()
+
+    def reserve(self, n: int) -> None:
+        """
+        .. admonition:: Reserve
+
+            Make room for at least ``n`` more items up front.
+
+        :param n: Number of items to make room for.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        self._queue.reserve(n)
+        self._metrics._pushed(0, len(self._queue))
+
+    def push(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto the wrapped queue.
+
+        :param ds: Items to be pushed.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        before = len(self._queue)
+        stored = self._queue.push(*ds)
+        if (times := self._times) is not None:
+            times.push(*(perf_counter(),) * len(ds))
+        self._metrics._pushed(len(ds), before)
+        return stored
+
+    def extend(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend
+
+            Push data items from an iterable onto the wrapped queue.
+
+        :param ds: Iterable of items to be pushed.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        items = ds if isinstance(ds, (tuple, list)) else tuple(ds)
+        before = len(self._queue)
+        stored = self._queue.extend(items)
+        if (times := self._times) is not None:
+            times.extend((perf_counter(),) * len(items))
+        self._metrics._pushed(len(items), before)
+        return stored
+
+    def pop(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop oldest data item off of the wrapped queue.
+
+        :returns: ``MayBe`` of popped data item if the queue
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.try_pop()) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop oldest data item off of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if the queue is empty.
+        :returns: Popped data item, ``default`` if the queue was empty.
+
+        """
+        if (d := self.try_pop()) is _novalue:
+            return default
+        return cast(D, d)
+
+    def try_pop(self) -> D | NoValue:
+        """
+        .. admonition:: Try pop
+
+            Pop oldest data item off of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :returns: Popped data item, ``NoValue()`` if the queue was empty.
+
+        """
+        if (d := self._queue.try_pop()) is not _novalue:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                waited = perf_counter() - times.pop_or(0.0)
+                cast(LatencyHistogram, metrics._latency).observe(waited)
+            metrics._popped(1)
+        return d
+
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of the wrapped queue,
+            all of them if ``k`` not given.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.pop_many(k)
+        if items:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                cast(LatencyHistogram, metrics._latency)._observe_since(
+                    times.pop_many(len(items))
+                )
+            metrics._popped(len(items))
+        return items
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at oldest data item on the wrapped queue.
+
+        :returns: ``MayBe`` of oldest item, empty ``MayBe`` if empty.
+
+        """
+        return self._queue.peak_next_out()
+
+    def peak_last_in(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last
+
+            Peak at newest data item on the wrapped queue.
+
+        :returns: ``MayBe`` of newest item, empty ``MayBe`` if empty.
+
+        """
+        return self._queue.peak_last_in()
+
+
+class InstrumentedDEQueue[D]:
+    """
+    .. admonition:: InstrumentedDEQueue
+
+        ``DEQueue`` wrapper keeping ``QueueMetrics``.
+
+        - same push and pop API as ``DEQueue``
+        - mutate the queue only through the wrapper, or the metrics,
+          and latencies in particular, go astray
+        - a few attribute updates per call, plus a ``perf_counter``
+          call and a timestamp queue when keeping latencies
+        - not thread safe, no more than the wrapped queue is
+
+    """
+
+    __slots__ = ('_metrics', '_queue', '_times')
+
+    def __init__(
+        self,
+        queue: DEQueue[D] | None = None,
+        *,
+        latency: LatencyHistogram | None = None,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Instrument a ``DEQueue``. Items already on it are timed
+            from now.
+
+        :param queue: Queue to instrument, a new empty one if not given.
+        :param latency: Histogram to record latencies in, none kept if not given.
+
+        """
+        if queue is None:
+            queue = DEQueue()
+        self._queue = queue
+        self._metrics = QueueMetrics(queue, latency)
+        self._times: DEQueue[float] | None = None
+        if latency is not None:
+            self._times = DEQueue(maxlen=queue.maxlen, overflow=queue.overflow)
+            self._times.pushr(*(perf_counter(),) * len(queue))
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``InstrumentedDEQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._queue) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``InstrumentedDEQueue``.
+
+        """
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over the wrapped queue, left to right.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self._queue)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'InstrumentedDEQueue(DEQueue(…))'.
+
+        """
+        return f'InstrumentedDEQueue({self._queue!r})'
+
+    @property
+    def queue(self) -> DEQueue[D]:
+        """
+        .. admonition:: Queue
+
+            The wrapped ``DEQueue``, read it but do not mutate it.
+
+        """
+        return self._queue
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        """
+        .. admonition:: Metrics
+
+            The ``QueueMetrics`` kept for the wrapped queue.
+
+        """
+        return self._metrics
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of the wrapped queue, left to right.
+
+        :returns: A tuple of the data.
+
+        """
+        return self._queue.snapshot()
+
+    def reserve(self, n: int) -> None:
+        """
+        .. admonition:: Reserve
+
+            Make room for at least ``n`` more items up front.
+
+        :param n: Number of items to make room for.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        self._queue.reserve(n)
+        self._metrics._pushed(0, len(self._queue))
+
+    def pushl(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push left
+
+            Push data onto left side of the wrapped queue.
+
+        :param ds: Data to be pushed from the left.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        before = len(self._queue)
+        stored = self._queue.pushl(*ds)
+        if (times := self._times) is not None:
+            times.pushl(*(perf_counter(),) * len(ds))
+        self._metrics._pushed(len(ds), before)
+        return stored
+
+    def pushr(self, *ds: D) -> bool:
+        """
+        .. admonition:: Push right
+
+            Push data onto right side of the wrapped queue.
+
+        :param ds: Data to be pushed from the right.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        before = len(self._queue)
+        stored = self._queue.pushr(*ds)
+        if (times := self._times) is not None:
+            times.pushr(*(perf_counter(),) * len(ds))
+        self._metrics._pushed(len(ds), before)
+        return stored
+
+    def extendl(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend left
+
+            Push data items from an iterable onto the left side of
+            the wrapped queue.
+
+        :param ds: Iterable of items to be pushed.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        items = ds if isinstance(ds, (tuple, list)) else tuple(ds)
+        before = len(self._queue)
+        stored = self._queue.extendl(items)
+        if (times := self._times) is not None:
+            times.extendl((perf_counter(),) * len(items))
+        self._metrics._pushed(len(items), before)
+        return stored
+
+    def extendr(self, ds: Iterable[D]) -> bool:
+        """
+        .. admonition:: Extend right
+
+            Push data items from an iterable onto the right side of
+            the wrapped queue.
+
+        :param ds: Iterable of items to be pushed.
+        :returns: ``True`` if all the pushed items are now on the queue.
+        :raises QueueFullError: When full and overflow policy is ``RAISE``.
+
+        """
+        items = ds if isinstance(ds, (tuple, list)) else tuple(ds)
+        before = len(self._queue)
+        stored = self._queue.extendr(items)
+        if (times := self._times) is not None:
+            times.extendr((perf_counter(),) * len(items))
+        self._metrics._pushed(len(items), before)
+        return stored
+
+    def popl(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop left
+
+            Pop data off of left side of the wrapped queue.
+
+        :returns: ``MayBe`` of popped data item if the queue
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.try_popl()) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def popr(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop right
+
+            Pop data off of right side of the wrapped queue.
+
+        :returns: ``MayBe`` of popped data item if the queue
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.try_popr()) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def popl_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop left or default
+
+            Pop data off of left side of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if the queue is empty.
+        :returns: Popped data item, ``default`` if the queue was empty.
+
+        """
+        if (d := self.try_popl()) is _novalue:
+            return default
+        return cast(D, d)
+
+    def popr_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop right or default
+
+            Pop data off of right side of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if the queue is empty.
+        :returns: Popped data item, ``default`` if the queue was empty.
+
+        """
+        if (d := self.try_popr()) is _novalue:
+            return default
+        return cast(D, d)
+
+    def try_popl(self) -> D | NoValue:
+        """
+        .. admonition:: Try pop left
+
+            Pop data off of left side of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :returns: Popped data item, ``NoValue()`` if the queue was empty.
+
+        """
+        if (d := self._queue.try_popl()) is not _novalue:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                waited = perf_counter() - times.popl_or(0.0)
+                cast(LatencyHistogram, metrics._latency).observe(waited)
+            metrics._popped(1)
+        return d
+
+    def try_popr(self) -> D | NoValue:
+        """
+        .. admonition:: Try pop right
+
+            Pop data off of right side of the wrapped queue,
+            returning the raw item instead of a ``MayBe``.
+
+        :returns: Popped data item, ``NoValue()`` if the queue was empty.
+
+        """
+        if (d := self._queue.try_popr()) is not _novalue:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                waited = perf_counter() - times.popr_or(0.0)
+                cast(LatencyHistogram, metrics._latency).observe(waited)
+            metrics._popped(1)
+        return d
+
+    def popl_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many left
+
+            Pop up to ``k`` data items off of the left side of the
+            wrapped queue, all of them if ``k`` not given.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.popl_many(k)
+        if items:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                cast(LatencyHistogram, metrics._latency)._observe_since(
+                    times.popl_many(len(items))
+                )
+            metrics._popped(len(items))
+        return items
+
+    def popr_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many right
+
+            Pop up to ``k`` data items off of the right side of the
+            wrapped queue, all of them if ``k`` not given.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, right to left.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.popr_many(k)
+        if items:
+            metrics = self._metrics
+            if (times := self._times) is not None:
+                cast(LatencyHistogram, metrics._latency)._observe_since(
+                    times.popr_many(len(items))
+                )
+            metrics._popped(len(items))
+        return items
+
+    def peakl(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak left
+
+            Peak at left side of the wrapped queue.
+
+        :returns: ``MayBe`` of leftmost item, empty ``MayBe`` if empty.
+
+        """
+        return self._queue.peakl()
+
+    def peakr(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak right
+
+            Peak at right side of the wrapped queue.
+
+        :returns: ``MayBe`` of rightmost item, empty ``MayBe`` if empty.
+
+        """
+        return self._queue.peakr()
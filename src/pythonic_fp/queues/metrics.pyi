@@ -0,0 +1,105 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+
+__all__ = [
+    'InstrumentedDEQueue',
+    'InstrumentedFIFOQueue',
+    'LatencyHistogram',
+    'QueueMetrics',
+]
+
+class LatencyHistogram:
+    def __init__(self, bounds: Iterable[float] = ...) -> None: ...
+    @property
+    def bounds(self) -> tuple[float, ...]: ...
+    @property
+    def count(self) -> int: ...
+    @property
+    def sum(self) -> float: ...
+    def observe(self, seconds: float) -> None: ...
+    def reset(self) -> None: ...
+    def snapshot(self) -> dict[str, Any]: ...
+
+class QueueMetrics:
+    def __init__(
+        self, queue: FIFOQueue[Any] | DEQueue[Any], latency: LatencyHistogram | None
+    ) -> None: ...
+    @property
+    def pushes(self) -> int: ...
+    @property
+    def pops(self) -> int: ...
+    @property
+    def dropped(self) -> int: ...
+    @property
+    def peak_length(self) -> int: ...
+    @property
+    def resizes(self) -> int: ...
+    @property
+    def latency(self) -> LatencyHistogram | None: ...
+    def snapshot(self) -> dict[str, Any]: ...
+    def reset(self) -> None: ...
+    def add_callback(self, callback: Callable[[dict[str, Any]], None]) -> None: ...
+    def remove_callback(self, callback: Callable[[dict[str, Any]], None]) -> None: ...
+    def publish(self) -> dict[str, Any]: ...
+
+class InstrumentedFIFOQueue[D]:
+    def __init__(
+        self,
+        queue: FIFOQueue[D] | None = None,
+        *,
+        latency: LatencyHistogram | None = None,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def queue(self) -> FIFOQueue[D]: ...
+    @property
+    def metrics(self) -> QueueMetrics: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def reserve(self, n: int) -> None: ...
+    def push(self, *ds: D) -> bool: ...
+    def extend(self, ds: Iterable[D]) -> bool: ...
+    def pop(self) -> MayBe[D]: ...
+    def pop_or[T](self, default: T) -> D | T: ...
+    def try_pop(self) -> D | NoValue: ...
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def peak_next_out(self) -> MayBe[D]: ...
+    def peak_last_in(self) -> MayBe[D]: ...
+
+class InstrumentedDEQueue[D]:
+    def __init__(
+        self,
+        queue: DEQueue[D] | None = None,
+        *,
+        latency: LatencyHistogram | None = None,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def queue(self) -> DEQueue[D]: ...
+    @property
+    def metrics(self) -> QueueMetrics: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def reserve(self, n: int) -> None: ...
+    def pushl(self, *ds: D) -> bool: ...
+    def pushr(self, *ds: D) -> bool: ...
+    def extendl(self, ds: Iterable[D]) -> bool: ...
+    def extendr(self, ds: Iterable[D]) -> bool: ...
+    def popl(self) -> MayBe[D]: ...
+    def popr(self) -> MayBe[D]: ...
+    def popl_or[T](self, default: T) -> D | T: ...
+    def popr_or[T](self, default: T) -> D | T: ...
+    def try_popl(self) -> D | NoValue: ...
+    def try_popr(self) -> D | NoValue: ...
+    def popl_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def popr_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def peakl(self) -> MayBe[D]: ...
+    def peakr(self) -> MayBe[D]: ...
@@ -0,0 +1,87 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Overflow policies
+
+    What a queue bounded by ``maxlen`` does when pushed onto while full.
+
+"""
+
+from collections.abc import Callable
+from enum import Enum, auto
+from pythonic_fp.circulararray.auto import CA
+
+__all__ = ['Overflow', 'QueueFullError']
+
+
+class Overflow(Enum):
+    """
+    .. admonition:: Overflow
+
+        Policy for pushing more items onto a bounded queue than it has room for.
+
+        - ``DROP_OLDEST``: evict items from the far end to make room
+        - ``DROP_NEWEST``: push the items which fit, discard the rest
+        - ``REJECT``: push nothing, return ``False``
+        - ``RAISE``: push nothing, raise ``QueueFullError``
+
+    """
+
+    DROP_OLDEST = auto()
+    DROP_NEWEST = auto()
+    REJECT = auto()
+    RAISE = auto()
+
+
+class QueueFullError(Exception):
+    """
+    .. admonition:: QueueFullError
+
+        Raised when pushing onto a full queue with overflow policy ``RAISE``.
+
+    """
+
+
+def _push_bounded[D](
+    ca: CA[D],
+    ds: tuple[D, ...],
+    maxlen: int,
+    overflow: Overflow,
+    push: Callable[..., None],
+    evict: Callable[[], D],
+) -> bool:
+    # Push ds onto ca, never letting it hold more than maxlen items.
+    # Returns True if every item in ds is in ca afterwards.
+    if (n := len(ds)) <= (room := maxlen - len(ca)):
+        push(*ds)
+        return True
+    match overflow:
+        case Overflow.DROP_OLDEST:
+            if n >= maxlen:
+                ca.empty()
+                push(*ds[n - maxlen :])
+                return n == maxlen
+            for _ in range(n - room):
+                evict()
+            push(*ds)
+            return True
+        case Overflow.DROP_NEWEST:
+            push(*ds[:room])
+            return False
+        case Overflow.REJECT:
+            return False
+        case Overflow.RAISE:
+            msg = f'no room to push {n} items, {room} of {maxlen} slots free'
+            raise QueueFullError(msg)
@@ -0,0 +1,22 @@
+from collections.abc import Callable
+from enum import Enum
+from pythonic_fp.circulararray.auto import CA
+
+__all__ = ['Overflow', 'QueueFullError']
+
+class Overflow(Enum):
+    DROP_OLDEST = ...
+    DROP_NEWEST = ...
+    REJECT = ...
+    RAISE = ...
+
+class QueueFullError(Exception): ...
+
+def _push_bounded[D](
+    ca: CA[D],
+    ds: tuple[D, ...],
+    maxlen: int,
+    overflow: Overflow,
+    push: Callable[..., None],
+    evict: Callable[[], D],
+) -> bool: ...
@@ -0,0 +1,605 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Persistent FIFO queue
+
+    Disk backed FIFO queue surviving restarts, able to hold more
+    items than fit in memory.
+
+    - items are pickled into append-only, memory-mapped segment files
+    - each record carries a CRC, a torn write found when reopening ends
+      the queue at the last intact record
+    - the consumer's position, the head offset, is committed according
+      to an ``Fsync`` policy, segments behind it are then deleted
+    - items popped since the last commit are popped again after a
+      crash, delivery is at-least-once
+
+    .. code:: python
+
+        from pythonic_fp.queues.persistent import Fsync, PersistentFIFOQueue
+
+        with PersistentFIFOQueue('backlog', fsync=Fsync.BATCH) as jobs:
+            jobs.push(job)
+
+    .. note::
+
+        A queue directory must be opened by only one
+        ``PersistentFIFOQueue`` at a time.
+
+"""
+
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Callable, Iterator
+from enum import Enum, auto
+from functools import reduce
+from pathlib import Path
+from types import TracebackType
+from typing import Final, Self, cast, overload
+from zlib import crc32
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.fifo import FIFOQueue
+
+__all__ = ['Fsync', 'PersistentFIFOQueue']
+
+_novalue = NoValue()
+
+# Records are the payload's length plus one and its CRC32, then the
+# payload. A zero marks the unwritten rest of a segment, so empty
+# payloads are stored too.
+_RECORD: Final = struct.Struct('<II')
+
+# The head file holds two slots of sequence number, segment and offset
+# plus a CRC32, written alternately so a torn write loses only the newer.
+_SLOT: Final = struct.Struct('<QQQ')
+_SLOT_SIZE: Final = 32
+_HEAD_FILE: Final = 'head'
+_SEGMENT_SUFFIX: Final = '.seg'
+
+
+class Fsync(Enum):
+    """
+    .. admonition:: Fsync
+
+        When a ``PersistentFIFOQueue`` flushes pushed items and
+        commits its head offset to disk.
+
+        - ``ALWAYS``: after every push and pop
+        - ``BATCH``: after every ``batch`` pushes and pops
+        - ``NEVER``: only on ``sync`` and ``close``, the OS still
+          writes dirty pages back on its own schedule
+
+        Each segment is also flushed once it fills up.
+
+    """
+
+    ALWAYS = auto()
+    BATCH = auto()
+    NEVER = auto()
+
+
+class PersistentFIFOQueue[D]:
+    """
+    .. admonition:: PersistentFIFOQueue
+
+        Stateful, disk backed First-In-First-Out (FIFO) Queue.
+
+        - O(1) pops and pushes, plus pickling
+        - O(1) length determination
+        - in a Boolean context, truthy if not empty, falsy if empty
+        - a small in memory cache of decoded items at the head
+        - opening scans the stored records once to validate them
+        - neither indexable nor sliceable by design
+
+    """
+
+    __slots__ = (
+        '_batch',
+        '_cache',
+        '_cache_size',
+        '_cnt',
+        '_dumps',
+        '_first',
+        '_fsync',
+        '_head',
+        '_head_map',
+        '_last',
+        '_loads',
+        '_maps',
+        '_mutations',
+        '_ops',
+        '_path',
+        '_read',
+        '_segment_size',
+        '_seq',
+        '_tail',
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        segment_size: int = 1 << 26,
+        fsync: Fsync = Fsync.BATCH,
+        batch: int = 1000,
+        cache: int = 64,
+        dumps: Callable[[D], bytes] = pickle.dumps,
+        loads: Callable[[bytes], D] = pickle.loads,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Open the queue stored in directory ``path``, creating it if
+            need be, recovering from the last committed head offset.
+
+        :param path: Directory holding the queue's files.
+        :param segment_size: Size in bytes of each segment file, larger
+                             items get a segment of their own.
+        :param fsync: When pushed items and the head offset are flushed.
+        :param batch: Pushes and pops between flushes for ``Fsync.BATCH``.
+        :param cache: Number of items decoded ahead of the head.
+        :param dumps: Serializes an item, ``pickle.dumps`` by default.
+        :param loads: Deserializes an item, ``pickle.loads`` by default.
+        :raises ValueError: When ``segment_size`` is less than 4096 bytes.
+        :raises ValueError: When ``batch`` or ``cache`` is not positive.
+
+        """
+        if segment_size < 4096:
+            size = segment_size
+            msg = f'PersistentFIFOQueue expects segment_size >= 4096, got {size}'
+            raise ValueError(msg)
+        if batch < 1:
+            msg = f'PersistentFIFOQueue expects a positive batch, got {batch}'
+            raise ValueError(msg)
+        if cache < 1:
+            msg = f'PersistentFIFOQueue expects a positive cache, got {cache}'
+            raise ValueError(msg)
+        self._path = Path(path)
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._batch = batch
+        self._cache_size = cache
+        self._dumps = dumps
+        self._loads = loads
+        self._maps: dict[int, mmap.mmap] = {}
+        self._cache: FIFOQueue[tuple[D, int, int]] = FIFOQueue()
+        self._seq, self._first, self._cnt = 0, 0, 0
+        self._head = self._read = self._tail = (0, 0)
+        self._ops = 0
+        self._mutations = 0
+        self._last: D | NoValue = _novalue
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._open_head()
+        self._recover()
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``PersistentFIFOQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return self._cnt > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``PersistentFIFOQueue``.
+
+        """
+        return self._cnt
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over current state in natural FIFO order,
+            reading items from disk without popping them.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``PersistentFIFOQueue`` mutated during iteration.
+
+        """
+        self._check_open()
+        mutations = self._mutations
+        for d, _, _ in self._cache:
+            yield d
+            if self._mutations != mutations:
+                msg = 'PersistentFIFOQueue mutated during iteration'
+                raise RuntimeError(msg)
+        seg, off = self._read
+        while (record := self._next_record(seg, off)) is not None:
+            payload, seg, off = record
+            yield self._loads(payload)
+            if self._mutations != mutations:
+                msg = 'PersistentFIFOQueue mutated during iteration'
+                raise RuntimeError(msg)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'PersistentFIFOQueue(path)'.
+
+        :returns: A string to reopen the ``PersistentFIFOQueue``.
+
+        """
+        return f'PersistentFIFOQueue({str(self._path)!r})'
+
+    def __enter__(self) -> Self:
+        """
+        .. admonition:: Context manager
+
+            The ``PersistentFIFOQueue`` itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """
+        .. admonition:: Exit context
+
+            Close the ``PersistentFIFOQueue``.
+
+        """
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        """
+        .. admonition:: Path
+
+            Directory holding the ``PersistentFIFOQueue``'s files.
+
+        """
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """
+        .. admonition:: Closed
+
+            ``True`` once the ``PersistentFIFOQueue`` has been closed.
+
+        """
+        return self._head_map.closed
+
+    def sync(self) -> None:
+        """
+        .. admonition:: Sync
+
+            Flush pushed items to disk, commit the head offset, then
+            delete segment files wholly behind it.
+
+        """
+        self._check_open()
+        self._commit()
+
+    def close(self) -> None:
+        """
+        .. admonition:: Close
+
+            Sync then release the ``PersistentFIFOQueue``'s files.
+            Closing a closed queue does nothing.
+
+        """
+        if self.closed:
+            return
+        self._commit()
+        for mm in self._maps.values():
+            mm.close()
+        self._maps.clear()
+        self._head_map.close()
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Read current state of ``PersistentFIFOQueue`` into memory.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        return tuple(self)
+
+    def push(self, *ds: D) -> None:
+        """
+        .. admonition:: Push
+
+            Append data items to rear of ``PersistentFIFOQueue``.
+
+        :param ds: Items to be pushed onto ``PersistentFIFOQueue``.
+        :raises ValueError: When an item pickles to 4 GiB or more.
+
+        """
+        self._check_open()
+        for d in ds:
+            self._append(self._dumps(d))
+            self._last = d
+        if ds:
+            self._mutations += 1
+            self._count_op(len(ds))
+
+    def pop(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop data off of front of ``PersistentFIFOQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``PersistentFIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.pop_or(_novalue)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop data off of front of ``PersistentFIFOQueue``.
+
+        :param default: Value returned when ``PersistentFIFOQueue`` empty.
+        :returns: Popped data item, or ``default`` if ``PersistentFIFOQueue``
+                  empty.
+
+        """
+        self._check_open()
+        if not self._cnt:
+            return default
+        if not self._cache:
+            self._fill_cache()
+        d, seg, off = cast(tuple[D, int, int], self._cache.try_pop())
+        if seg != self._head[0]:
+            self._trim_maps()
+        self._head = seg, off
+        self._cnt -= 1
+        self._mutations += 1
+        self._count_op(1)
+        return d
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at next data item to be popped off ``PersistentFIFOQueue``.
+
+        :returns: ``MayBe`` of next item out, empty ``MayBe``
+                  if ``PersistentFIFOQueue`` empty.
+
+        """
+        self._check_open()
+        if not self._cnt:
+            return MayBe()
+        if not self._cache:
+            self._fill_cache()
+        return self._cache.peak_next_out().map(lambda entry: entry[0])
+
+    def peak_last_in(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak last in
+
+            Peak at last data item pushed onto ``PersistentFIFOQueue``.
+
+        :returns: ``MayBe`` of last item pushed, empty ``MayBe``
+                  if ``PersistentFIFOQueue`` empty.
+
+        """
+        self._check_open()
+        if not self._cnt:
+            return MayBe()
+        return MayBe(cast(D, self._last))
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``PersistentFIFOQueue`` in natural FIFO order,
+            reading items from disk without popping them.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``PersistentFIFOQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            return MayBe(cast(T, reduce(cast(Callable[[D, D], D], f), self)))  # T = D
+        return MayBe(reduce(f, self, start))
+
+    def _check_open(self) -> None:
+        if self._head_map.closed:
+            msg = 'I/O operation on closed PersistentFIFOQueue'
+            raise ValueError(msg)
+
+    def _segment_path(self, seg: int) -> Path:
+        return self._path / f'{seg:020d}{_SEGMENT_SUFFIX}'
+
+    def _map(self, seg: int, size: int = 0) -> mmap.mmap:
+        # Map segment seg, creating it with size bytes if size given.
+        if (mm := self._maps.get(seg)) is not None:
+            return mm
+        flags = os.O_RDWR | (os.O_CREAT | os.O_EXCL if size else 0)
+        fd = os.open(self._segment_path(seg), flags | getattr(os, 'O_BINARY', 0))
+        try:
+            if size or os.fstat(fd).st_size == 0:
+                os.ftruncate(fd, size or self._segment_size)
+            mm = self._maps[seg] = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        return mm
+
+    def _unmap(self, seg: int) -> None:
+        if (mm := self._maps.pop(seg, None)) is not None:
+            mm.close()
+
+    def _trim_maps(self) -> None:
+        # Keep only the segments being read and written mapped, each map
+        # holding a file descriptor. Others are mapped again when needed.
+        keep = self._read[0], self._tail[0]
+        for seg in [seg for seg in self._maps if seg not in keep]:
+            self._unmap(seg)
+
+    def _open_head(self) -> None:
+        # Map the head file, reading the newest intact slot.
+        head_path = self._path / _HEAD_FILE
+        fd = os.open(head_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0))
+        try:
+            if os.fstat(fd).st_size < 2 * _SLOT_SIZE:
+                os.ftruncate(fd, 2 * _SLOT_SIZE)
+            self._head_map = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        for slot in (0, _SLOT_SIZE):
+            body = self._head_map[slot : slot + _SLOT.size]
+            crc = self._head_map[slot + _SLOT.size : slot + _SLOT.size + 4]
+            seq, seg, off = _SLOT.unpack(body)
+            if seq > self._seq and crc32(body).to_bytes(4, 'little') == crc:
+                self._seq, self._head = seq, (seg, off)
+
+    def _recover(self) -> None:
+        # Validate records from the committed head on, the first torn or
+        # corrupt one ending the queue. Leftover segments are deleted.
+        paths = self._path.glob('*' + _SEGMENT_SUFFIX)
+        segs = sorted(int(p.stem) for p in paths if p.stem.isdigit())
+        head_seg, head_off = self._head
+        for seg in [seg for seg in segs if seg < head_seg]:
+            self._segment_path(seg).unlink()
+        segs = [seg for seg in segs if seg >= head_seg]
+        if not segs:
+            self._map(head_seg, self._segment_size)
+            segs = [head_seg]
+        elif segs[0] != head_seg:
+            head_seg, head_off = self._head = segs[0], 0
+        cnt, last, tail = 0, None, (head_seg, head_off)
+        intact = True
+        for idx, seg in enumerate(segs):
+            if seg != head_seg + idx:
+                break
+            mm = self._map(seg)
+            pos = head_off if seg == head_seg else 0
+            while pos + _RECORD.size <= len(mm):
+                n, crc = _RECORD.unpack_from(mm, pos)
+                if n == 0:
+                    break
+                end = pos + _RECORD.size + n - 1
+                if end > len(mm) or crc32(mm[pos + _RECORD.size : end]) != crc:
+                    intact = False
+                    break
+                cnt, last, pos = cnt + 1, (seg, pos + _RECORD.size, end), end
+            tail = seg, pos
+            if not intact:
+                mm[pos:] = bytes(len(mm) - pos)
+                break
+            self._unmap(seg)
+        for seg in [seg for seg in segs if seg > tail[0]]:
+            self._unmap(seg)
+            self._segment_path(seg).unlink()
+        self._first, self._read, self._tail, self._cnt = segs[0], self._head, tail, cnt
+        if last is not None:
+            seg, start, end = last
+            self._last = self._loads(self._map(seg)[start:end])
+        self._trim_maps()
+
+    def _next_record(self, seg: int, off: int) -> tuple[bytes, int, int] | None:
+        # Payload of the record at or after seg, off and the position
+        # following it, None when reaching the tail.
+        tail = self._tail
+        while (seg, off) != tail:
+            mm = self._map(seg)
+            if off + _RECORD.size <= len(mm):
+                n = _RECORD.unpack_from(mm, off)[0]
+                if n:
+                    end = off + _RECORD.size + n - 1
+                    return mm[off + _RECORD.size : end], seg, end
+            if seg not in (self._read[0], tail[0]):
+                self._unmap(seg)
+            seg, off = seg + 1, 0
+        return None
+
+    def _fill_cache(self) -> None:
+        seg, off = self._read
+        for _ in range(self._cache_size):
+            if (record := self._next_record(seg, off)) is None:
+                break
+            payload, seg, off = record
+            self._cache.push((self._loads(payload), seg, off))
+        self._read = seg, off
+
+    def _append(self, payload: bytes) -> None:
+        if (n := len(payload)) >= (1 << 32) - 1:
+            msg = f'PersistentFIFOQueue cannot store an item pickled to {n} bytes'
+            raise ValueError(msg)
+        seg, off = self._tail
+        mm = self._map(seg)
+        if (end := off + _RECORD.size + n) > len(mm):
+            # Roll over to a new tail segment, unmapping the full one
+            # unless it is still being read.
+            mm.flush()
+            seg, off = seg + 1, 0
+            end = _RECORD.size + n
+            mm = self._map(seg, max(self._segment_size, end))
+            self._tail = seg, off
+            self._trim_maps()
+        mm[off + _RECORD.size : end] = payload
+        _RECORD.pack_into(mm, off, n + 1, crc32(payload))
+        self._tail = seg, end
+        self._cnt += 1
+
+    def _count_op(self, n: int) -> None:
+        match self._fsync:
+            case Fsync.ALWAYS:
+                self._commit()
+            case Fsync.BATCH:
+                self._ops += n
+                if self._ops >= self._batch:
+                    self._commit()
+
+    def _commit(self) -> None:
+        # Flush pushed items, then the head offset, then drop segments
+        # wholly consumed.
+        self._ops = 0
+        self._map(self._tail[0]).flush()
+        self._seq += 1
+        body = _SLOT.pack(self._seq, *self._head)
+        slot = (self._seq % 2) * _SLOT_SIZE
+        crc = crc32(body).to_bytes(4, 'little')
+        self._head_map[slot : slot + _SLOT.size + 4] = body + crc
+        self._head_map.flush()
+        head_seg = self._head[0]
+        for seg in range(self._first, head_seg):
+            if seg in self._maps:
+                self._maps.pop(seg).close()
+            self._segment_path(seg).unlink(missing_ok=True)
+        self._first = max(self._first, head_seg)
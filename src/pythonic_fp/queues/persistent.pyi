@@ -0,0 +1,54 @@
+import os
+from collections.abc import Callable, Iterator
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import Self, overload
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['Fsync', 'PersistentFIFOQueue']
+
+class Fsync(Enum):
+    ALWAYS = ...
+    BATCH = ...
+    NEVER = ...
+
+class PersistentFIFOQueue[D]:
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        segment_size: int = ...,
+        fsync: Fsync = ...,
+        batch: int = 1000,
+        cache: int = 64,
+        dumps: Callable[[D], bytes] = ...,
+        loads: Callable[[bytes], D] = ...,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None: ...
+    @property
+    def path(self) -> Path: ...
+    @property
+    def closed(self) -> bool: ...
+    def sync(self) -> None: ...
+    def close(self) -> None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(self, *ds: D) -> None: ...
+    def pop(self) -> MayBe[D]: ...
+    def pop_or[T](self, default: T) -> D | T: ...
+    def peak_next_out(self) -> MayBe[D]: ...
+    def peak_last_in(self) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
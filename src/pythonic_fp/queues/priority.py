@@ -0,0 +1,392 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Priority queue
+
+    Binary heap based priority queue, smallest priority out first.
+
+    - items pushed with equal priorities pop out in FIFO order
+    - priorities given by an optional key function, otherwise the items
+    - priorities of pushed items can be changed through handles
+
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import reduce
+from heapq import heapify, heappop, heappush
+from typing import Any, Final, cast, overload
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['PriorityHandle', 'PriorityQueue', 'priority_queue']
+
+# Heap entries are lists [priority, seq, item]. Unique sequence numbers
+# keep the items themselves from ever being compared and make equal
+# priorities pop in FIFO order. Entries superseded by reprioritize are
+# left in the heap, their item replaced by _removed, and skipped over.
+_removed: Final = object()
+
+
+class PriorityHandle:
+    """
+    .. admonition:: PriorityHandle
+
+        Opaque reference to an item pushed onto a ``PriorityQueue``
+        with ``push_with_handle``. Used to change its priority.
+
+    """
+
+    __slots__ = ('_entry', '_queue')
+
+    def __init__(self, queue: 'PriorityQueue[Any]', entry: list[Any]) -> None:
+        self._queue = queue
+        self._entry = entry
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            Truthy while the item is still on its ``PriorityQueue``.
+
+        """
+        return self._entry[2] is not _removed
+
+
+class PriorityQueue[D]:
+    """
+    .. admonition:: PriorityQueue
+
+        Stateful priority queue data structure.
+
+        - O(log n) pushes and pops
+        - O(n) construction from an iterable
+        - O(1) length determination
+        - in a Boolean context, truthy if not empty, falsy if empty
+        - stable, equal priorities are popped in FIFO order
+        - neither indexable nor sliceable by design
+
+    """
+
+    __slots__ = ('_dead', '_heap', '_key', '_seq')
+
+    def __init__(self, *ds: Iterable[D], key: Callable[[D], Any] | None = None) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``PriorityQueue`` with 0 or 1 iterables. The
+            heap is built in one O(n) pass.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param key: Optional function giving each item its priority,
+                    the items themselves are the priorities if not given.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        if (size := len(ds)) > 1:
+            msg = f'PriorityQueue expects at most 1 iterable argument, got {size}'
+            raise ValueError(msg)
+        self._key = key
+        self._dead = 0
+        if size == 0:
+            self._heap: list[list[Any]] = []
+        elif key is None:
+            self._heap = [[d, seq, d] for seq, d in enumerate(ds[0])]
+        else:
+            self._heap = [[key(d), seq, d] for seq, d in enumerate(ds[0])]
+        self._seq = len(self._heap)
+        heapify(self._heap)
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``PriorityQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._heap) > self._dead
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``PriorityQueue``.
+
+        """
+        return len(self._heap) - self._dead
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``PriorityQueue`` and both would pop
+            items comparing as equal in the same order, then return
+            ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, PriorityQueue):
+            return False
+        return self.snapshot() == other.snapshot()
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over current state in priority order.
+
+            .. note::
+
+                A heap is not stored in priority order, iterates over
+                a sorted ``snapshot`` of the data.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self.snapshot())
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'PriorityQueue(d₁, d₂, … dₙ)' where
+
+            - d₁, d₂, … dₙ are the contents in priority order displayed
+              with ``repr()``
+
+        :returns: A string to reproduce the ``PriorityQueue``, less its key.
+
+        """
+        if len(self) == 0:
+            return 'PriorityQueue()'
+        return 'PriorityQueue(' + ', '.join(map(repr, self.snapshot())) + ')'
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '<( d₁ < d₂ < … < dₙ )<' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '<( ' + ' < '.join(map(str, self.snapshot())) + ' )<'
+
+    def _live(self) -> list[list[Any]]:
+        if self._dead:
+            return [entry for entry in self._heap if entry[2] is not _removed]
+        return self._heap
+
+    def _compact(self) -> None:
+        # Drop superseded entries once they make up half the heap.
+        self._heap = [entry for entry in self._heap if entry[2] is not _removed]
+        self._dead = 0
+        heapify(self._heap)
+
+    def copy(self) -> 'PriorityQueue[D]':
+        """
+        .. admonition:: Copy
+
+            Shallow copy the ``PriorityQueue``. Handles refer
+            to the original only.
+
+        :returns: New ``PriorityQueue`` instance containing the same references.
+
+        """
+        new: PriorityQueue[D] = PriorityQueue(key=self._key)
+        new._heap = [entry.copy() for entry in self._live()]
+        new._seq = self._seq
+        if self._dead:
+            heapify(new._heap)
+        return new
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``PriorityQueue`` in priority order.
+
+        :returns: A tuple of the data, in the order it would be popped.
+
+        """
+        return tuple(entry[2] for entry in sorted(self._live()))
+
+    def push(self, *ds: D) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``PriorityQueue``.
+
+        :param ds: Items to be pushed onto ``PriorityQueue``.
+
+        """
+        heap, key, seq = self._heap, self._key, self._seq
+        for d in ds:
+            heappush(heap, [d if key is None else key(d), seq, d])
+            seq += 1
+        self._seq = seq
+
+    def push_with_handle(self, d: D) -> PriorityHandle:
+        """
+        .. admonition:: Push with handle
+
+            Push a data item onto ``PriorityQueue``, returning a handle
+            which can later be used to change the item's priority.
+
+        :param d: Item to be pushed onto ``PriorityQueue``.
+        :returns: A handle to the pushed item.
+
+        """
+        entry = [d if self._key is None else self._key(d), self._seq, d]
+        self._seq += 1
+        heappush(self._heap, entry)
+        return PriorityHandle(self, entry)
+
+    def reprioritize(self, handle: PriorityHandle, priority: Any) -> bool:
+        """
+        .. admonition:: Reprioritize
+
+            Change the priority of an item pushed with ``push_with_handle``,
+            the decrease-key operation. Done in O(log n), the item goes
+            behind items already queued with an equal priority.
+
+        :param handle: Handle returned when the item was pushed.
+        :param priority: New priority for the item.
+        :returns: ``True`` if the item was still on the queue,
+                  ``False`` if it was already popped.
+        :raises ValueError: When ``handle`` is from another ``PriorityQueue``.
+
+        """
+        if handle._queue is not self:
+            msg = 'PriorityQueue.reprioritize given a handle from another queue'
+            raise ValueError(msg)
+        entry = handle._entry
+        if (d := entry[2]) is _removed:
+            return False
+        handle._entry = new_entry = [priority, self._seq, d]
+        self._seq += 1
+        entry[2] = _removed
+        self._dead += 1
+        heappush(self._heap, new_entry)
+        if self._dead > len(self._heap) // 2:
+            self._compact()
+        return True
+
+    def pop(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop item with smallest priority off of ``PriorityQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``PriorityQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        heap = self._heap
+        while heap:
+            entry = heappop(heap)
+            if (d := entry[2]) is _removed:
+                self._dead -= 1
+                continue
+            entry[2] = _removed
+            return MayBe(cast(D, d))
+        return MayBe()
+
+    def peak(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak
+
+            Peak at item with smallest priority on ``PriorityQueue``.
+
+        :returns: ``MayBe`` of next item out, empty ``MayBe``
+                  if ``PriorityQueue`` empty.
+
+        """
+        heap = self._heap
+        while heap and heap[0][2] is _removed:
+            heappop(heap)
+            self._dead -= 1
+        if heap:
+            return MayBe(cast(D, heap[0][2]))
+        return MayBe()
+
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, D], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``PriorityQueue`` in priority order.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``PriorityQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            return MayBe(
+                cast(T, reduce(cast(Callable[[D, D], D], f), self.snapshot()))
+            )  # T = D
+        return MayBe(reduce(f, self.snapshot(), start))
+
+    def map[U](self, f: Callable[[D], U]) -> 'PriorityQueue[U]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``PriorityQueue``, each item keeping
+            its priority.
+
+            .. note::
+
+                The key function applies to the original items, not
+                the mapped ones. Items later pushed onto the new
+                ``PriorityQueue`` are their own priorities.
+
+        :param f: Function to map over ``PriorityQueue``.
+        :returns: New ``PriorityQueue`` instance.
+
+        """
+        new: PriorityQueue[U] = PriorityQueue()
+        new._heap = [[p, seq, f(d)] for p, seq, d in self._live()]
+        new._seq = self._seq
+        if self._dead:
+            heapify(new._heap)
+        return new
+
+
+def priority_queue[D](
+    *ds: D, key: Callable[[D], Any] | None = None
+) -> PriorityQueue[D]:
+    """
+    .. admonition:: Create PriorityQueue
+
+        Factory function to create a ``PriorityQueue``
+        instance from the function's arguments.
+
+    :param ds: Initial data to be pushed onto the queue.
+    :param key: Optional function giving each item its priority.
+    :returns: New ``PriorityQueue`` instance.
+
+    """
+    return PriorityQueue(ds, key=key)
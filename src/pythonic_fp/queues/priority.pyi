@@ -0,0 +1,35 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, overload
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['PriorityHandle', 'PriorityQueue', 'priority_queue']
+
+class PriorityHandle:
+    def __init__(self, queue: PriorityQueue[Any], entry: list[Any]) -> None: ...
+    def __bool__(self) -> bool: ...
+
+class PriorityQueue[D]:
+    def __init__(
+        self, *ds: Iterable[D], key: Callable[[D], Any] | None = None
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[D]: ...
+    def copy(self) -> PriorityQueue[D]: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(self, *ds: D) -> None: ...
+    def push_with_handle(self, d: D) -> PriorityHandle: ...
+    def reprioritize(self, handle: PriorityHandle, priority: Any) -> bool: ...
+    def pop(self) -> MayBe[D]: ...
+    def peak(self) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[D, D], D]) -> MayBe[D]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, D], T], start: T) -> MayBe[T]: ...
+    def map[U](self, f: Callable[[D], U]) -> PriorityQueue[U]: ...
+
+def priority_queue[D](
+    *ds: D, key: Callable[[D], Any] | None = None
+) -> PriorityQueue[D]: ...
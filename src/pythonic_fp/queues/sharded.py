@@ -0,0 +1,363 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Sharded queue
+
+    Thread safe FIFO queue spreading pushes over several lanes, each
+    a ``FIFOQueue`` with a lock of its own, so many producers rarely
+    contend for the same lock.
+
+    - lanes picked per producer thread, or per key when given a key
+      function
+    - items from one thread, or with one key, stay in FIFO order
+    - consumers take from the lanes round-robin, or in global push
+      order when ``ordered``
+
+"""
+
+import os
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from heapq import merge
+from itertools import count
+from typing import Any, cast
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues._backoff import _poll
+from pythonic_fp.queues.fifo import FIFOQueue
+
+__all__ = ['ShardedFIFOQueue']
+
+_novalue = NoValue()
+
+
+class ShardedFIFOQueue[D]:
+    """
+    .. admonition:: ShardedFIFOQueue
+
+        Thread safe, multi-lane First-In-First-Out (FIFO) Queue for
+        many producer threads.
+
+        - each lane has its own lock, pushes lock only their lane
+        - FIFO order per producer thread, or per key
+        - optional global FIFO order, stamping pushes with a sequence
+          number and merging lanes when popping
+        - O(1) length determination from per-lane counters
+        - in a Boolean context, truthy if not empty, falsy if empty
+
+    """
+
+    __slots__ = (
+        '_assign',
+        '_assign_lock',
+        '_cursor',
+        '_key',
+        '_lanes',
+        '_local',
+        '_locks',
+        '_ordered',
+        '_pop_lock',
+        '_popped',
+        '_pushed',
+        '_seq',
+        '_seq_lock',
+    )
+
+    def __init__(
+        self,
+        lanes: int | None = None,
+        *,
+        key: Callable[[D], Hashable] | None = None,
+        ordered: bool = False,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create an empty ``ShardedFIFOQueue``.
+
+        :param lanes: Number of lanes, the CPU count if not given.
+        :param key: Maps an item to its key, items with equal keys
+                    share a lane. Lanes are per thread if not given.
+        :param ordered: Pop in global push order instead of round-robin.
+        :raises ValueError: When ``lanes`` is not positive.
+
+        """
+        if lanes is None:
+            lanes = os.cpu_count() or 1
+        if lanes < 1:
+            msg = f'ShardedFIFOQueue expects a positive lane count, got {lanes}'
+            raise ValueError(msg)
+        self._lanes: tuple[FIFOQueue[Any], ...] = tuple(
+            FIFOQueue() for _ in range(lanes)
+        )
+        self._locks = tuple(threading.Lock() for _ in range(lanes))
+        self._pushed = [0] * lanes
+        self._popped = [0] * lanes
+        self._key = key
+        self._ordered = ordered
+        self._seq = count()
+        self._seq_lock = threading.Lock()
+        self._pop_lock = threading.Lock()
+        self._cursor = 0
+        self._local = threading.local()
+        self._assign = count()
+        self._assign_lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``ShardedFIFOQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``ShardedFIFOQueue``,
+            summing a pushed and a popped counter per lane. Only
+            approximate while other threads push or pop.
+
+        """
+        # Counters only grow and no lane pops more than was pushed onto
+        # it, so reading popped before pushed never undercounts.
+        popped = sum(self._popped)
+        return max(sum(self._pushed) - popped, 0)
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over a snapshot of the ``ShardedFIFOQueue``.
+
+        :returns: An iterator of the data.
+
+        """
+        return iter(self.snapshot())
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'ShardedFIFOQueue(lanes)'.
+
+        """
+        if self._ordered:
+            return f'ShardedFIFOQueue({len(self._lanes)}, ordered=True)'
+        return f'ShardedFIFOQueue({len(self._lanes)})'
+
+    @property
+    def lanes(self) -> int:
+        """
+        .. admonition:: Lanes
+
+            Number of lanes in the ``ShardedFIFOQueue``.
+
+        """
+        return len(self._lanes)
+
+    @property
+    def ordered(self) -> bool:
+        """
+        .. admonition:: Ordered
+
+            ``True`` when pops follow global push order.
+
+        """
+        return self._ordered
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current contents, with every lane locked at once.
+            In global push order when ``ordered``, otherwise lane
+            by lane.
+
+        :returns: A tuple of the data.
+
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            if self._ordered:
+                return tuple(d for _, d in merge(*self._lanes))
+            return tuple(d for lane in self._lanes for d in lane)
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def push(self, *ds: D) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``ShardedFIFOQueue``, locking only
+            the lanes they go to.
+
+        :param ds: Items to be pushed onto ``ShardedFIFOQueue``.
+
+        """
+        if (key := self._key) is None:
+            self._push_lane(self._thread_lane(), ds)
+            return
+        lanes = len(self._lanes)
+        if len(ds) == 1:
+            self._push_lane(hash(key(ds[0])) % lanes, ds)
+            return
+        groups: dict[int, list[D]] = {}
+        for d in ds:
+            groups.setdefault(hash(key(d)) % lanes, []).append(d)
+        for idx, group in groups.items():
+            self._push_lane(idx, group)
+
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop a data item off of ``ShardedFIFOQueue``, the oldest one
+            when ``ordered``, otherwise the oldest of the next non-empty
+            lane round-robin.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.pop_or(_novalue, block, timeout)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop a data item off of ``ShardedFIFOQueue``, as ``pop`` does.
+
+        :param default: Value returned when no item was available.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, or ``default`` if none was available.
+
+        """
+        take = self._take_oldest if self._ordered else self._take_next
+        taken: list[D | NoValue] = [take()]
+        if taken[0] is _novalue:
+
+            def ready() -> bool:
+                taken[0] = take()
+                return taken[0] is not _novalue
+
+            if not _poll(ready, block, timeout):
+                return default
+        return cast(D, taken[0])
+
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``ShardedFIFOQueue``, all
+            of them if ``k`` not given, in the order ``pop`` would.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        if k is not None and k < 0:
+            msg = f'ShardedFIFOQueue.pop_many expects a non-negative k, got {k}'
+            raise ValueError(msg)
+        items: list[D] = []
+        if self._ordered:
+            while k is None or len(items) < k:
+                if (d := self._take_oldest()) is _novalue:
+                    break
+                items.append(cast(D, d))
+            return tuple(items)
+        # Round-robin a batch per lane, each lane locked once per pass.
+        while k is None or len(items) < k:
+            before = len(items)
+            for idx, lane in enumerate(self._lanes):
+                want = None if k is None else k - len(items)
+                if want == 0:
+                    break
+                with self._locks[idx]:
+                    batch = lane.pop_many(want)
+                    self._popped[idx] += len(batch)
+                items.extend(batch)
+            if len(items) == before:
+                break
+        return tuple(items)
+
+    def _thread_lane(self) -> int:
+        # Lane of the calling thread, handed out round-robin on first push.
+        local = self._local
+        if (idx := getattr(local, 'lane', None)) is None:
+            with self._assign_lock:
+                idx = local.lane = next(self._assign) % len(self._lanes)
+        return cast(int, idx)
+
+    def _push_lane(self, idx: int, ds: tuple[D, ...] | list[D]) -> None:
+        lane = self._lanes[idx]
+        with self._locks[idx]:
+            if self._ordered:
+                with self._seq_lock:
+                    seq = self._seq
+                    lane.push(*((next(seq), d) for d in ds))
+            else:
+                lane.push(*ds)
+            self._pushed[idx] += len(ds)
+
+    def _take_next(self) -> D | NoValue:
+        # Oldest item of the next non-empty lane, round-robin.
+        lanes = len(self._lanes)
+        start = self._cursor
+        for step in range(lanes):
+            idx = (start + step) % lanes
+            if self._pushed[idx] == self._popped[idx]:
+                continue
+            with self._locks[idx]:
+                d = self._lanes[idx].try_pop()
+                if d is not _novalue:
+                    self._popped[idx] += 1
+            if d is not _novalue:
+                self._cursor = (idx + 1) % lanes
+                return cast(D, d)
+        return _novalue
+
+    def _take_oldest(self) -> D | NoValue:
+        # Item with the lowest sequence number at the head of any lane.
+        # Consumers are serialized, so heads seen stay heads until popped.
+        with self._pop_lock:
+            best, best_seq = -1, -1
+            for idx, lane in enumerate(self._lanes):
+                if self._pushed[idx] == self._popped[idx]:
+                    continue
+                with self._locks[idx]:
+                    head = lane.peak_next_out_or(None)
+                if head is not None and (best < 0 or head[0] < best_seq):
+                    best, best_seq = idx, head[0]
+            if best < 0:
+                return _novalue
+            with self._locks[best]:
+                _, d = cast(tuple[int, D], self._lanes[best].try_pop())
+                self._popped[best] += 1
+            return d
@@ -0,0 +1,28 @@
+from collections.abc import Callable, Hashable, Iterator
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['ShardedFIFOQueue']
+
+class ShardedFIFOQueue[D]:
+    def __init__(
+        self,
+        lanes: int | None = None,
+        *,
+        key: Callable[[D], Hashable] | None = None,
+        ordered: bool = False,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def lanes(self) -> int: ...
+    @property
+    def ordered(self) -> bool: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(self, *ds: D) -> None: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]: ...
@@ -0,0 +1,620 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Shared memory queues
+
+    FIFO queues handing data between processes through a ring buffer
+    in ``multiprocessing.shared_memory``, no pipe in between.
+
+    - with a ``typecode``, a ring of unboxed numbers copied in and out
+      of shared memory directly, nothing serialized
+    - otherwise a ring of bytes holding length prefixed records,
+      items serialized with ``pickle`` unless told otherwise
+    - head and tail indices live in the shared memory too
+    - handles are passed to worker processes as ``Process`` arguments,
+      the worker's copy attaching to the same shared memory
+
+    .. code:: python
+
+        from multiprocessing import Process
+        from pythonic_fp.queues.shared import SharedFIFOQueue
+
+        with SharedFIFOQueue[float](1 << 16, typecode='d') as sq:
+            workers = [Process(target=work, args=(sq,)) for _ in range(4)]
+
+    .. note::
+
+        ``SharedSPSCFIFOQueue`` takes no locks. It relies on aligned 8 byte
+        stores being atomic and becoming visible to other processes in
+        program order, as on x86-64. On weakly ordered hardware use
+        ``SharedFIFOQueue``.
+
+"""
+
+import os
+import pickle
+from array import array
+from collections.abc import Callable
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Final, Self, cast
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues._backoff import _poll
+from pythonic_fp.queues.typed import _TYPECODES
+
+__all__ = ['SharedFIFOQueue', 'SharedSPSCFIFOQueue']
+
+_novalue = NoValue()
+
+# Header of 8 byte counters, producer and consumer owned ones on
+# separate cache lines. Head and tail count ring units, items when
+# typed, bytes otherwise. Popped and pushed count items.
+_HEADER: Final = 128
+_HEAD: Final = 0
+_POPPED: Final = 1
+_TAIL: Final = 8
+_PUSHED: Final = 9
+
+# Byte ring records are a 4 byte little endian length, then the payload.
+_PREFIX: Final = 4
+
+
+class _SharedRing[D]:
+    """Shared memory ring bookkeeping shared by the shared memory queues."""
+
+    __slots__ = (
+        '_capacity',
+        '_dumps',
+        '_idx',
+        '_loads',
+        '_owner',
+        '_ring',
+        '_shm',
+        '_typecode',
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        typecode: str | None,
+        dumps: Callable[[D], bytes],
+        loads: Callable[[bytes], D],
+    ) -> None:
+        name = type(self).__name__
+        if capacity < 1:
+            msg = f'{name} expects a positive capacity, got {capacity}'
+            raise ValueError(msg)
+        if typecode is not None and typecode not in _TYPECODES:
+            msg = f'{name} expects a numeric array typecode, got {typecode!r}'
+            raise ValueError(msg)
+        itemsize = 1 if typecode is None else array(typecode).itemsize
+        shm = SharedMemory(create=True, size=_HEADER + capacity * itemsize)
+        self._attach(shm, os.getpid(), capacity, typecode, dumps, loads)
+
+    def _attach(
+        self,
+        shm: SharedMemory,
+        owner: int,
+        capacity: int,
+        typecode: str | None,
+        dumps: Callable[[D], bytes],
+        loads: Callable[[bytes], D],
+    ) -> None:
+        self._shm = shm
+        self._owner = owner
+        self._capacity = capacity
+        self._typecode = typecode
+        self._dumps = dumps
+        self._loads = loads
+        buf = cast(memoryview, shm.buf)
+        self._idx = buf[:_HEADER].cast('Q')
+        self._ring: memoryview[Any]
+        if typecode is None:
+            self._ring = buf[_HEADER : _HEADER + capacity]
+        else:
+            size = capacity * array(typecode).itemsize
+            self._ring = buf[_HEADER : _HEADER + size].cast(cast(Any, typecode))
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return self._shm.name, self._capacity, self._typecode, self._dumps, self._loads
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        name, capacity, typecode, dumps, loads = state[:5]
+        shm = SharedMemory(name, track=False)
+        self._attach(shm, 0, capacity, typecode, dumps, loads)
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            Truthy when non-empty, falsy when empty.
+
+        """
+        idx = self._idx
+        return idx[_PUSHED] != idx[_POPPED]
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the queue, a
+            moment's estimate while other processes use it.
+
+        """
+        idx = self._idx
+        return max(idx[_PUSHED] - idx[_POPPED], 0)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string naming the shared memory block.
+
+        """
+        args = f'{self._capacity}'
+        if self._typecode is not None:
+            args += f', typecode={self._typecode!r}'
+        return f'{type(self).__name__}({args}) at {self.name!r}'
+
+    def __enter__(self) -> Self:
+        """
+        .. admonition:: Context manager
+
+            The queue itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """
+        .. admonition:: Exit context
+
+            Close the queue.
+
+        """
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """
+        .. admonition:: Name
+
+            Name of the shared memory block holding the queue.
+
+        """
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """
+        .. admonition:: Capacity
+
+            Size of the ring, in items when typed, in bytes otherwise.
+
+        """
+        return self._capacity
+
+    @property
+    def typecode(self) -> str | None:
+        """
+        .. admonition:: Typecode
+
+            The ``array.array`` typecode of the stored items, ``None``
+            when items are stored as serialized bytes.
+
+        """
+        return self._typecode
+
+    def close(self) -> None:
+        """
+        .. admonition:: Close
+
+            Detach from the shared memory. The process which created
+            the queue also frees the shared memory. Closing a closed
+            queue does nothing.
+
+        """
+        if self._shm.buf is None:
+            return
+        self._idx.release()
+        self._ring.release()
+        self._shm.close()
+        if self._owner == os.getpid():
+            self._shm.unlink()
+
+    def _encode(self, ds: tuple[D, ...]) -> tuple[Any, int]:
+        # Items ready to copy into the ring, and the ring units they take.
+        if self._typecode is not None:
+            items = array(self._typecode, cast(tuple[Any, ...], ds))
+            return items, len(items)
+        name = type(self).__name__
+        records = []
+        for d in ds:
+            payload = self._dumps(d)
+            if (size := _PREFIX + len(payload)) > (capacity := self._capacity):
+                msg = f'{name} cannot push an item of {size} bytes, capacity {capacity}'
+                raise ValueError(msg)
+            records.append(len(payload).to_bytes(_PREFIX, 'little') + payload)
+        data = b''.join(records)
+        return data, len(data)
+
+    def _room(self) -> int:
+        idx = self._idx
+        return self._capacity - (idx[_TAIL] - idx[_HEAD])
+
+    def _write(self, items: Any, size: int, n: int) -> None:
+        # Copy n encoded items of size ring units at the tail, then publish.
+        idx, ring, capacity = self._idx, self._ring, self._capacity
+        tail = idx[_TAIL]
+        start = tail % capacity
+        first = min(size, capacity - start)
+        view = memoryview(items)
+        ring[start : start + first] = view[:first]
+        if first < size:
+            ring[: size - first] = view[first:]
+        idx[_TAIL] = tail + size
+        idx[_PUSHED] += n
+
+    def _read(self, head: int, size: int) -> bytes:
+        ring, capacity = self._ring, self._capacity
+        start = head % capacity
+        first = min(size, capacity - start)
+        data = ring[start : start + first].tobytes()
+        if first < size:
+            data += ring[: size - first].tobytes()
+        return data
+
+    def _take(self, k: int, consume: bool = True) -> list[D]:
+        # Up to k items at the head, consumed unless told otherwise.
+        idx = self._idx
+        head, available = idx[_HEAD], idx[_TAIL] - idx[_HEAD]
+        if self._typecode is not None:
+            k = min(k, available)
+            start = head % self._capacity
+            first = min(k, self._capacity - start)
+            items = cast(list[D], self._ring[start : start + first].tolist())
+            if first < k:
+                items += cast(list[D], self._ring[: k - first].tolist())
+            size = k
+        else:
+            items, size = cast(list[D], []), 0
+            while len(items) < k and size < available:
+                n = int.from_bytes(self._read(head + size, _PREFIX), 'little')
+                items.append(self._loads(self._read(head + size + _PREFIX, n)))
+                size += _PREFIX + n
+        if consume and items:
+            idx[_HEAD] = head + size
+            idx[_POPPED] += len(items)
+        return items
+
+    def _check_k(self, k: int | None) -> int:
+        if k is None:
+            return self._capacity
+        if k < 0:
+            msg = f'{type(self).__name__}.pop_many expects a non-negative k, got {k}'
+            raise ValueError(msg)
+        return k
+
+
+class SharedFIFOQueue[D](_SharedRing[D]):
+    """
+    .. admonition:: SharedFIFOQueue
+
+        Multi-producer, multi-consumer First-In-First-Out (FIFO) Queue
+        shared between processes.
+
+        - ``MayBe`` returning pops like ``FIFOQueue``
+        - all operations done under a single process shared lock
+        - pops can wait for data, pushes can wait for room
+        - either all or none of a multi-item push is made
+
+    """
+
+    __slots__ = ('_lock', '_not_empty', '_not_full')
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        typecode: str | None = None,
+        dumps: Callable[[D], bytes] = pickle.dumps,
+        loads: Callable[[bytes], D] = pickle.loads,
+        ctx: BaseContext | None = None,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create a ``SharedFIFOQueue`` in a new shared memory block.
+
+        :param capacity: Size of the ring, in items when typed, in bytes otherwise.
+        :param typecode: An ``array.array`` typecode for unboxed numbers.
+        :param dumps: Serializes an item, ``pickle.dumps`` by default.
+        :param loads: Deserializes an item, ``pickle.loads`` by default.
+        :param ctx: Multiprocessing context for the lock, the default one if not given.
+        :raises ValueError: When ``capacity`` is not positive.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+
+        """
+        super().__init__(capacity, typecode, dumps, loads)
+        ctx = ctx or get_context()
+        self._lock = ctx.Lock()
+        self._not_empty = ctx.Condition(self._lock)
+        self._not_full = ctx.Condition(self._lock)
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return super().__getstate__() + (self._lock, self._not_empty, self._not_full)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        super().__setstate__(state)
+        self._lock, self._not_empty, self._not_full = state[5:]
+
+    def push(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``SharedFIFOQueue``, either all
+            or none of them.
+
+        :param ds: Items to be pushed onto ``SharedFIFOQueue``.
+        :param block: Wait for room if the ring is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When the items cannot fit in an empty ring.
+
+        """
+        items, size = self._encode(ds)
+        if size > self._capacity:
+            msg = f'cannot push {size} units onto a ring of capacity {self._capacity}'
+            raise ValueError(msg)
+        with self._lock:
+            if block:
+                if not self._not_full.wait_for(lambda: self._room() >= size, timeout):
+                    return False
+            elif self._room() < size:
+                return False
+            self._write(items, size, len(ds))
+            self._not_empty.notify(len(ds))
+        return True
+
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop oldest data item off of ``SharedFIFOQueue``.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.pop_or(_novalue, block, timeout)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop oldest data item off of ``SharedFIFOQueue``.
+
+        :param default: Value returned when no item was available.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, or ``default`` if none was available.
+
+        """
+        with self._lock:
+            if not self._wait_for_items(block, timeout):
+                return default
+            items = self._take(1)
+            self._not_full.notify_all()
+        return items[0]
+
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``SharedFIFOQueue``,
+            all of them if ``k`` not given, under a single lock
+            acquisition.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        k = self._check_k(k)
+        with self._lock:
+            if block and k > 0:
+                self._wait_for_items(block, timeout)
+            items = self._take(k)
+            if items:
+                self._not_full.notify_all()
+        return tuple(items)
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at next data item to be popped off ``SharedFIFOQueue``.
+
+        :returns: ``MayBe`` of next item out, empty ``MayBe`` if queue empty.
+
+        """
+        with self._lock:
+            items = self._take(1, consume=False)
+        return MayBe(items[0]) if items else MayBe()
+
+    def _wait_for_items(self, block: bool, timeout: float | None) -> bool:
+        # Call only while holding self._lock.
+        if block:
+            return self._not_empty.wait_for(self.__bool__, timeout)
+        return bool(self)
+
+
+class SharedSPSCFIFOQueue[D](_SharedRing[D]):
+    """
+    .. admonition:: SharedSPSCFIFOQueue
+
+        Single-producer, single-consumer First-In-First-Out (FIFO)
+        Queue shared between two processes.
+
+        - ``MayBe`` returning pops like ``FIFOQueue``
+        - no locks, the producer alone moves the tail and the consumer
+          alone moves the head
+        - pops and pushes wait by polling with a capped back off
+        - either all or none of a multi-item push is made
+
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        typecode: str | None = None,
+        dumps: Callable[[D], bytes] = pickle.dumps,
+        loads: Callable[[bytes], D] = pickle.loads,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create a ``SharedSPSCFIFOQueue`` in a new shared memory block.
+
+        :param capacity: Size of the ring, in items when typed, in bytes otherwise.
+        :param typecode: An ``array.array`` typecode for unboxed numbers.
+        :param dumps: Serializes an item, ``pickle.dumps`` by default.
+        :param loads: Deserializes an item, ``pickle.loads`` by default.
+        :raises ValueError: When ``capacity`` is not positive.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+
+        """
+        super().__init__(capacity, typecode, dumps, loads)
+
+    def push(self, *ds: D, block: bool = True, timeout: float | None = None) -> bool:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``SharedSPSCFIFOQueue``, either all
+            or none of them. Only the producer may push.
+
+        :param ds: Items to be pushed onto ``SharedSPSCFIFOQueue``.
+        :param block: Wait for room if the ring is full.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``True`` if items were pushed, ``False`` if no room.
+        :raises ValueError: When the items cannot fit in an empty ring.
+
+        """
+        items, size = self._encode(ds)
+        if size > self._capacity:
+            msg = f'cannot push {size} units onto a ring of capacity {self._capacity}'
+            raise ValueError(msg)
+        if not _poll(lambda: self._room() >= size, block, timeout):
+            return False
+        self._write(items, size, len(ds))
+        return True
+
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop oldest data item off of ``SharedSPSCFIFOQueue``.
+            Only the consumer may pop.
+
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: ``MayBe`` of popped data item if one was available,
+                  empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.pop_or(_novalue, block, timeout)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop oldest data item off of ``SharedSPSCFIFOQueue``.
+            Only the consumer may pop.
+
+        :param default: Value returned when no item was available.
+        :param block: Wait for an item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: Popped data item, or ``default`` if none was available.
+
+        """
+        if not _poll(self._readable, block, timeout):
+            return default
+        return self._take(1)[0]
+
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``SharedSPSCFIFOQueue``,
+            all of them if ``k`` not given. Only the consumer may pop.
+
+        :param k: Maximum number of items to pop.
+        :param block: Wait for at least one item if queue is empty.
+        :param timeout: Maximum number of seconds to wait, forever if ``None``.
+        :returns: A tuple of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        k = self._check_k(k)
+        if block and k > 0:
+            _poll(self._readable, block, timeout)
+        return tuple(self._take(k))
+
+    def peak_next_out(self) -> MayBe[D]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at next data item to be popped off ``SharedSPSCFIFOQueue``.
+            Only the consumer may peak.
+
+        :returns: ``MayBe`` of next item out, empty ``MayBe`` if queue empty.
+
+        """
+        items = self._take(1, consume=False)
+        return MayBe(items[0]) if items else MayBe()
+
+    def _readable(self) -> bool:
+        # The tail, not the pushed count, tells the consumer data is there.
+        idx = self._idx
+        return idx[_TAIL] != idx[_HEAD]
@@ -0,0 +1,87 @@
+from collections.abc import Callable
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any, Self
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['SharedFIFOQueue', 'SharedSPSCFIFOQueue']
+
+class SharedFIFOQueue[D]:
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        typecode: str | None = None,
+        dumps: Callable[[D], bytes] = ...,
+        loads: Callable[[bytes], D] = ...,
+        ctx: BaseContext | None = None,
+    ) -> None: ...
+    def __getstate__(self) -> tuple[Any, ...]: ...
+    def __setstate__(self, state: tuple[Any, ...]) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def typecode(self) -> str | None: ...
+    def close(self) -> None: ...
+    def push(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peak_next_out(self) -> MayBe[D]: ...
+
+class SharedSPSCFIFOQueue[D]:
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        typecode: str | None = None,
+        dumps: Callable[[D], bytes] = ...,
+        loads: Callable[[bytes], D] = ...,
+    ) -> None: ...
+    def __getstate__(self) -> tuple[Any, ...]: ...
+    def __setstate__(self, state: tuple[Any, ...]) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def typecode(self) -> str | None: ...
+    def close(self) -> None: ...
+    def push(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peak_next_out(self) -> MayBe[D]: ...
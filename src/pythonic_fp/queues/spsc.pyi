@@ -0,0 +1,21 @@
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['SPSCFIFOQueue']
+
+class SPSCFIFOQueue[D]:
+    def __init__(self, capacity: int) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    def push(
+        self, *ds: D, block: bool = True, timeout: float | None = None
+    ) -> bool: ...
+    def pop(self, block: bool = False, timeout: float | None = None) -> MayBe[D]: ...
+    def pop_or[T](
+        self, default: T, block: bool = False, timeout: float | None = None
+    ) -> D | T: ...
+    def pop_many(
+        self, k: int | None = None, block: bool = False, timeout: float | None = None
+    ) -> tuple[D, ...]: ...
+    def peak_next_out(self) -> MayBe[D]: ...
@@ -0,0 +1,839 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Timed queues
+
+    ``FIFOQueue`` and ``DEQueue`` remembering when each item was
+    pushed, in a parallel ``TypedFIFOQueue`` or ``TypedDEQueue`` of
+    unboxed floats rather than a tuple per item.
+
+    - ages of the items at the ends in O(1)
+    - expired items trimmed off an end in bulk
+    - optional CoDel policy, dropping items on pop while they keep
+      waiting longer than a target
+
+    .. code:: python
+
+        from pythonic_fp.queues.timed import CoDel, TimedFIFOQueue
+
+        jobs: TimedFIFOQueue[Job] = TimedFIFOQueue(codel=CoDel(0.005, 0.1))
+        jobs.push(job)
+        stale = jobs.pop_expired(jobs.clock(), 30.0)
+
+"""
+
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from math import sqrt
+from time import monotonic
+from typing import cast
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.typed import TypedDEQueue, TypedFIFOQueue
+
+__all__ = ['CoDel', 'TimedDEQueue', 'TimedFIFOQueue']
+
+_novalue = NoValue()
+
+
+class CoDel:
+    """
+    .. admonition:: CoDel
+
+        Controlled Delay (CoDel) drop policy, RFC 8289, for a timed queue.
+
+        - once items have waited longer than ``target`` for a whole
+          ``interval``, pops start dropping items
+        - drops come closer together, ``interval / sqrt(count)``
+          apart, until an item waited less than ``target``
+        - the last item on the queue is never dropped
+        - keeps state, give each queue its own ``CoDel``
+
+    """
+
+    __slots__ = (
+        '_count',
+        '_drop_next',
+        '_dropped',
+        '_dropping',
+        '_first_above',
+        '_interval',
+        '_last_count',
+        '_target',
+    )
+
+    def __init__(self, target: float = 0.005, interval: float = 0.1) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create a ``CoDel`` policy.
+
+        :param target: Acceptable time waited, in seconds.
+        :param interval: Time in seconds waits must stay above ``target``
+                         before dropping starts, about a round trip.
+        :raises ValueError: When ``target`` or ``interval`` is not positive.
+
+        """
+        if target <= 0 or interval <= 0:
+            got = f'{target}, {interval}'
+            msg = f'CoDel expects positive target and interval, got {got}'
+            raise ValueError(msg)
+        self._target = target
+        self._interval = interval
+        self._dropped = 0
+        self._first_above = 0.0
+        self._dropping = False
+        self._drop_next = 0.0
+        self._count = 0
+        self._last_count = 0
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'CoDel(target, interval)'.
+
+        """
+        return f'CoDel({self._target!r}, {self._interval!r})'
+
+    @property
+    def target(self) -> float:
+        """
+        .. admonition:: Target
+
+            Acceptable time waited, in seconds.
+
+        """
+        return self._target
+
+    @property
+    def interval(self) -> float:
+        """
+        .. admonition:: Interval
+
+            Time in seconds waits must stay above ``target`` before
+            dropping starts.
+
+        """
+        return self._interval
+
+    @property
+    def dropped(self) -> int:
+        """
+        .. admonition:: Dropped
+
+            Number of items dropped so far.
+
+        """
+        return self._dropped
+
+    @property
+    def dropping(self) -> bool:
+        """
+        .. admonition:: Dropping
+
+            ``True`` while in the dropping state.
+
+        """
+        return self._dropping
+
+    def _ok_to_drop(self, now: float, waited: float, left: int) -> bool:
+        # Whether the item just taken has been over target long enough.
+        if waited < self._target or left == 0:
+            self._first_above = 0.0
+            return False
+        if self._first_above == 0.0:
+            self._first_above = now + self._interval
+            return False
+        return now >= self._first_above
+
+    def _pop[D](
+        self, take: Callable[[], tuple[D, float, int] | None], now: float
+    ) -> D | NoValue:
+        # Pop through take, returning (item, push time, items left),
+        # dropping items as RFC 8289's dequeue does.
+        if (taken := take()) is None:
+            self._first_above = 0.0
+            self._dropping = False
+            return _novalue
+        d, pushed, left = taken
+        ok = self._ok_to_drop(now, now - pushed, left)
+        interval = self._interval
+        if self._dropping:
+            if not ok:
+                self._dropping = False
+            while self._dropping and now >= self._drop_next:
+                self._dropped += 1
+                self._count += 1
+                # Never None, the last item is never dropped.
+                d, pushed, left = cast(tuple[D, float, int], take())
+                if self._ok_to_drop(now, now - pushed, left):
+                    self._drop_next += interval / sqrt(self._count)
+                else:
+                    self._dropping = False
+        elif ok:
+            self._dropped += 1
+            d, pushed, left = cast(tuple[D, float, int], take())
+            self._ok_to_drop(now, now - pushed, left)
+            self._dropping = True
+            delta = self._count - self._last_count
+            if delta > 1 and now - self._drop_next < 16 * interval:
+                self._count = delta
+            else:
+                self._count = 1
+            self._drop_next = now + interval / sqrt(self._count)
+            self._last_count = self._count
+        return d
+
+
+def _expired_count(times: TypedFIFOQueue[float], cutoff: float) -> int:
+    # Number of leading push times not after cutoff. Push times are
+    # nondecreasing, so binary search each storage segment.
+    first, second = times.segments()
+    try:
+        if (k := bisect_right(first, cutoff)) < len(first):
+            return k
+        return k + bisect_right(second, cutoff)
+    finally:
+        first.release()
+        second.release()
+
+
+class TimedFIFOQueue[D]:
+    """
+    .. admonition:: TimedFIFOQueue
+
+        ``FIFOQueue`` recording the time each item was pushed.
+
+        - push times kept unboxed, 8 bytes per item
+        - O(1) age of the oldest item
+        - O(log n + k) trim of the k expired items at the front
+        - optional ``CoDel`` drop policy applied by ``pop`` and ``pop_or``
+        - times come from ``clock``, ``time.monotonic`` by default
+        - not thread safe
+
+    """
+
+    __slots__ = ('_clock', '_codel', '_queue', '_times')
+
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        clock: Callable[[], float] = monotonic,
+        codel: CoDel | None = None,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``TimedFIFOQueue`` with 0 or 1 iterables to
+            populate the queue in natural FIFO order, all pushed now.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param clock: Nondecreasing source of the time in seconds.
+        :param codel: Optional CoDel policy for ``pop`` and ``pop_or``.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        self._queue: FIFOQueue[D] = FIFOQueue(*ds)
+        self._times: TypedFIFOQueue[float] = TypedFIFOQueue('d')
+        self._clock = clock
+        self._codel = codel
+        self._times.push(*(clock(),) * len(self._queue))
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``TimedFIFOQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._queue) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``TimedFIFOQueue``.
+
+        """
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over current state in natural FIFO order.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``TimedFIFOQueue`` mutated during iteration.
+
+        """
+        return iter(self._queue)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'TimedFIFOQueue(d₁, d₂, … dₙ)', push
+            times not shown.
+
+        """
+        return 'Timed' + repr(self._queue)
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        """
+        .. admonition:: Clock
+
+            Source of the push times, and of ``now`` when not given.
+
+        """
+        return self._clock
+
+    @property
+    def codel(self) -> CoDel | None:
+        """
+        .. admonition:: CoDel
+
+            The CoDel policy applied by ``pop``, ``None`` if none.
+
+        """
+        return self._codel
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``TimedFIFOQueue`` in natural FIFO order.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        return self._queue.snapshot()
+
+    def push_times(self) -> tuple[float, ...]:
+        """
+        .. admonition:: Push times
+
+            Copy the push times, oldest to newest.
+
+        :returns: A tuple of the times the items were pushed.
+
+        """
+        return self._times.snapshot()
+
+    def push(self, *ds: D) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto ``TimedFIFOQueue``, stamped with
+            the current time.
+
+        :param ds: Items to be pushed onto ``TimedFIFOQueue``.
+
+        """
+        self._queue.push(*ds)
+        self._times.push(*(self._clock(),) * len(ds))
+
+    def extend(self, ds: Iterable[D]) -> None:
+        """
+        .. admonition:: Extend
+
+            Push data items from an iterable onto ``TimedFIFOQueue``,
+            all stamped with the current time.
+
+        :param ds: Iterable of items to be pushed.
+
+        """
+        before = len(self._queue)
+        self._queue.extend(ds)
+        self._times.extend((self._clock(),) * (len(self._queue) - before))
+
+    def pop(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Pop oldest data item off of ``TimedFIFOQueue``, dropping
+            items before it when the CoDel policy says to.
+
+        :returns: ``MayBe`` of popped data item if ``TimedFIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.pop_or(_novalue)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def pop_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop oldest data item off of ``TimedFIFOQueue``, as ``pop``
+            does, returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``TimedFIFOQueue`` is empty.
+        :returns: Popped data item, ``default`` if ``TimedFIFOQueue`` was empty.
+
+        """
+        if (codel := self._codel) is None:
+            if (d := self._queue.try_pop()) is _novalue:
+                return default
+            self._times.pop_or(0.0)
+            return cast(D, d)
+        if (d := codel._pop(self._take, self._clock())) is _novalue:
+            return default
+        return cast(D, d)
+
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``TimedFIFOQueue``, all
+            of them if ``k`` not given. The CoDel policy is not applied.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.pop_many(k)
+        self._times.pop_many(len(items))
+        return items
+
+    def pop_expired(self, now: float, ttl: float) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop expired
+
+            Pop, in one go, the items at the front pushed ``ttl``
+            or more seconds before ``now``.
+
+        :param now: Current time, from ``clock``.
+        :param ttl: Time to live in seconds.
+        :returns: A tuple of the expired data, oldest to newest.
+        :raises ValueError: When ``ttl`` is negative.
+
+        """
+        if ttl < 0:
+            msg = f'TimedFIFOQueue.pop_expired expects a non-negative ttl, got {ttl}'
+            raise ValueError(msg)
+        if not (k := _expired_count(self._times, now - ttl)):
+            return ()
+        self._times.pop_many(k)
+        return self._queue.pop_many(k)
+
+    def oldest_age(self, now: float | None = None) -> MayBe[float]:
+        """
+        .. admonition:: Oldest age
+
+            How long the oldest item has been waiting, in O(1).
+
+        :param now: Current time, from ``clock`` if not given.
+        :returns: ``MayBe`` of the age in seconds, empty ``MayBe``
+                  if ``TimedFIFOQueue`` empty.
+
+        """
+        if not self._times:
+            return MayBe()
+        pushed = self._times.peak_next_out().get()
+        return MayBe((self._clock() if now is None else now) - pushed)
+
+    def _take(self) -> tuple[D, float, int] | None:
+        if (d := self._queue.try_pop()) is _novalue:
+            return None
+        return cast(D, d), self._times.pop_or(0.0), len(self._queue)
+
+
+class TimedDEQueue[D]:
+    """
+    .. admonition:: TimedDEQueue
+
+        ``DEQueue`` recording the time each item was pushed.
+
+        - push times kept unboxed, 8 bytes per item
+        - O(1) ages of the items at either end
+        - expired items trimmed off either end
+        - optional ``CoDel`` drop policy applied by ``popl``, ``popr``,
+          ``popl_or`` and ``popr_or``
+        - times come from ``clock``, ``time.monotonic`` by default
+        - not thread safe
+
+        .. note::
+
+            Items pushed onto both ends leave the oldest somewhere
+            in the middle. Trims stop at the first unexpired item.
+
+    """
+
+    __slots__ = ('_clock', '_codel', '_queue', '_times')
+
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        clock: Callable[[], float] = monotonic,
+        codel: CoDel | None = None,
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``TimedDEQueue`` with 0 or 1 iterables to
+            populate the queue left to right, all pushed now.
+
+        :param ds: Takes 0 or 1 iterable parameters.
+        :param clock: Nondecreasing source of the time in seconds.
+        :param codel: Optional CoDel policy for the single item pops.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When passed a non-iterable parameter.
+
+        """
+        self._queue: DEQueue[D] = DEQueue(*ds)
+        self._times: TypedDEQueue[float] = TypedDEQueue('d')
+        self._clock = clock
+        self._codel = codel
+        self._times.pushr(*(clock(),) * len(self._queue))
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``TimedDEQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._queue) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``TimedDEQueue``.
+
+        """
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[D]:
+        """
+        .. admonition:: Iteration
+
+            Iterate over current state, left to right.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``TimedDEQueue`` mutated during iteration.
+
+        """
+        return iter(self._queue)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'TimedDEQueue(d₁, d₂, … dₙ)', push
+            times not shown.
+
+        """
+        return 'Timed' + repr(self._queue)
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        """
+        .. admonition:: Clock
+
+            Source of the push times, and of ``now`` when not given.
+
+        """
+        return self._clock
+
+    @property
+    def codel(self) -> CoDel | None:
+        """
+        .. admonition:: CoDel
+
+            The CoDel policy applied by the single item pops, ``None``
+            if none.
+
+        """
+        return self._codel
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``TimedDEQueue``, left to right.
+
+        :returns: A tuple of the data.
+
+        """
+        return self._queue.snapshot()
+
+    def push_times(self) -> tuple[float, ...]:
+        """
+        .. admonition:: Push times
+
+            Copy the push times, left to right.
+
+        :returns: A tuple of the times the items were pushed.
+
+        """
+        return self._times.snapshot()
+
+    def pushl(self, *ds: D) -> None:
+        """
+        .. admonition:: Push left
+
+            Push data onto left side of ``TimedDEQueue``, stamped
+            with the current time.
+
+        :param ds: Data to be pushed onto ``TimedDEQueue`` from the left.
+
+        """
+        self._queue.pushl(*ds)
+        self._times.pushl(*(self._clock(),) * len(ds))
+
+    def pushr(self, *ds: D) -> None:
+        """
+        .. admonition:: Push right
+
+            Push data onto right side of ``TimedDEQueue``, stamped
+            with the current time.
+
+        :param ds: Data to be pushed onto ``TimedDEQueue`` from the right.
+
+        """
+        self._queue.pushr(*ds)
+        self._times.pushr(*(self._clock(),) * len(ds))
+
+    def extendl(self, ds: Iterable[D]) -> None:
+        """
+        .. admonition:: Extend left
+
+            Push data items from an iterable onto left side of
+            ``TimedDEQueue``, all stamped with the current time.
+
+        :param ds: Iterable of items to be pushed.
+
+        """
+        before = len(self._queue)
+        self._queue.extendl(ds)
+        self._times.extendl((self._clock(),) * (len(self._queue) - before))
+
+    def extendr(self, ds: Iterable[D]) -> None:
+        """
+        .. admonition:: Extend right
+
+            Push data items from an iterable onto right side of
+            ``TimedDEQueue``, all stamped with the current time.
+
+        :param ds: Iterable of items to be pushed.
+
+        """
+        before = len(self._queue)
+        self._queue.extendr(ds)
+        self._times.extendr((self._clock(),) * (len(self._queue) - before))
+
+    def popl(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop left
+
+            Pop data off of left side of ``TimedDEQueue``, dropping
+            items before it when the CoDel policy says to.
+
+        :returns: ``MayBe`` of popped data item if ``TimedDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.popl_or(_novalue)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def popr(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop right
+
+            Pop data off of right side of ``TimedDEQueue``, dropping
+            items before it when the CoDel policy says to.
+
+        :returns: ``MayBe`` of popped data item if ``TimedDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if (d := self.popr_or(_novalue)) is _novalue:
+            return MayBe()
+        return MayBe(cast(D, d))
+
+    def popl_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop left or default
+
+            Pop data off of left side of ``TimedDEQueue``, as ``popl``
+            does, returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``TimedDEQueue`` is empty.
+        :returns: Popped data item, ``default`` if ``TimedDEQueue`` was empty.
+
+        """
+        if (codel := self._codel) is None:
+            if (d := self._queue.try_popl()) is _novalue:
+                return default
+            self._times.popl_or(0.0)
+            return cast(D, d)
+        if (d := codel._pop(self._takel, self._clock())) is _novalue:
+            return default
+        return cast(D, d)
+
+    def popr_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop right or default
+
+            Pop data off of right side of ``TimedDEQueue``, as ``popr``
+            does, returning the raw item instead of a ``MayBe``.
+
+        :param default: Value to return if ``TimedDEQueue`` is empty.
+        :returns: Popped data item, ``default`` if ``TimedDEQueue`` was empty.
+
+        """
+        if (codel := self._codel) is None:
+            if (d := self._queue.try_popr()) is _novalue:
+                return default
+            self._times.popr_or(0.0)
+            return cast(D, d)
+        if (d := codel._pop(self._taker, self._clock())) is _novalue:
+            return default
+        return cast(D, d)
+
+    def popl_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many left
+
+            Pop up to ``k`` data items off of left side of
+            ``TimedDEQueue``, all of them if ``k`` not given.
+            The CoDel policy is not applied.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.popl_many(k)
+        self._times.popl_many(len(items))
+        return items
+
+    def popr_many(self, k: int | None = None) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop many right
+
+            Pop up to ``k`` data items off of right side of
+            ``TimedDEQueue``, all of them if ``k`` not given.
+            The CoDel policy is not applied.
+
+        :param k: Maximum number of items to pop.
+        :returns: A tuple of the popped data, right to left.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._queue.popr_many(k)
+        self._times.popr_many(len(items))
+        return items
+
+    def pop_expiredl(self, now: float, ttl: float) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop expired left
+
+            Pop the items at the left end pushed ``ttl`` or more
+            seconds before ``now``, up to the first one that was not.
+
+        :param now: Current time, from ``clock``.
+        :param ttl: Time to live in seconds.
+        :returns: A tuple of the expired data, left to right.
+        :raises ValueError: When ``ttl`` is negative.
+
+        """
+        k = self._expired(self._times, now, ttl, 'pop_expiredl')
+        self._times.popl_many(k)
+        return self._queue.popl_many(k)
+
+    def pop_expiredr(self, now: float, ttl: float) -> tuple[D, ...]:
+        """
+        .. admonition:: Pop expired right
+
+            Pop the items at the right end pushed ``ttl`` or more
+            seconds before ``now``, up to the first one that was not.
+
+        :param now: Current time, from ``clock``.
+        :param ttl: Time to live in seconds.
+        :returns: A tuple of the expired data, right to left.
+        :raises ValueError: When ``ttl`` is negative.
+
+        """
+        k = self._expired(reversed(self._times), now, ttl, 'pop_expiredr')
+        self._times.popr_many(k)
+        return self._queue.popr_many(k)
+
+    def agel(self, now: float | None = None) -> MayBe[float]:
+        """
+        .. admonition:: Age left
+
+            How long the leftmost item has been waiting, in O(1).
+
+        :param now: Current time, from ``clock`` if not given.
+        :returns: ``MayBe`` of the age in seconds, empty ``MayBe``
+                  if ``TimedDEQueue`` empty.
+
+        """
+        if not self._times:
+            return MayBe()
+        pushed = self._times.peakl().get()
+        return MayBe((self._clock() if now is None else now) - pushed)
+
+    def ager(self, now: float | None = None) -> MayBe[float]:
+        """
+        .. admonition:: Age right
+
+            How long the rightmost item has been waiting, in O(1).
+
+        :param now: Current time, from ``clock`` if not given.
+        :returns: ``MayBe`` of the age in seconds, empty ``MayBe``
+                  if ``TimedDEQueue`` empty.
+
+        """
+        if not self._times:
+            return MayBe()
+        pushed = self._times.peakr().get()
+        return MayBe((self._clock() if now is None else now) - pushed)
+
+    @staticmethod
+    def _expired(times: Iterable[float], now: float, ttl: float, name: str) -> int:
+        # Number of push times, from one end, not after now - ttl.
+        if ttl < 0:
+            msg = f'TimedDEQueue.{name} expects a non-negative ttl, got {ttl}'
+            raise ValueError(msg)
+        cutoff, k = now - ttl, 0
+        for pushed in times:
+            if pushed > cutoff:
+                break
+            k += 1
+        return k
+
+    def _takel(self) -> tuple[D, float, int] | None:
+        if (d := self._queue.try_popl()) is _novalue:
+            return None
+        return cast(D, d), self._times.popl_or(0.0), len(self._queue)
+
+    def _taker(self) -> tuple[D, float, int] | None:
+        if (d := self._queue.try_popr()) is _novalue:
+            return None
+        return cast(D, d), self._times.popr_or(0.0), len(self._queue)
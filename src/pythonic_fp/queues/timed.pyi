@@ -0,0 +1,71 @@
+from collections.abc import Callable, Iterable, Iterator
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['CoDel', 'TimedDEQueue', 'TimedFIFOQueue']
+
+class CoDel:
+    def __init__(self, target: float = 0.005, interval: float = 0.1) -> None: ...
+    @property
+    def target(self) -> float: ...
+    @property
+    def interval(self) -> float: ...
+    @property
+    def dropped(self) -> int: ...
+    @property
+    def dropping(self) -> bool: ...
+
+class TimedFIFOQueue[D]:
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        clock: Callable[[], float] = ...,
+        codel: CoDel | None = None,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def clock(self) -> Callable[[], float]: ...
+    @property
+    def codel(self) -> CoDel | None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push_times(self) -> tuple[float, ...]: ...
+    def push(self, *ds: D) -> None: ...
+    def extend(self, ds: Iterable[D]) -> None: ...
+    def pop(self) -> MayBe[D]: ...
+    def pop_or[T](self, default: T) -> D | T: ...
+    def pop_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def pop_expired(self, now: float, ttl: float) -> tuple[D, ...]: ...
+    def oldest_age(self, now: float | None = None) -> MayBe[float]: ...
+
+class TimedDEQueue[D]:
+    def __init__(
+        self,
+        *ds: Iterable[D],
+        clock: Callable[[], float] = ...,
+        codel: CoDel | None = None,
+    ) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[D]: ...
+    @property
+    def clock(self) -> Callable[[], float]: ...
+    @property
+    def codel(self) -> CoDel | None: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push_times(self) -> tuple[float, ...]: ...
+    def pushl(self, *ds: D) -> None: ...
+    def pushr(self, *ds: D) -> None: ...
+    def extendl(self, ds: Iterable[D]) -> None: ...
+    def extendr(self, ds: Iterable[D]) -> None: ...
+    def popl(self) -> MayBe[D]: ...
+    def popr(self) -> MayBe[D]: ...
+    def popl_or[T](self, default: T) -> D | T: ...
+    def popr_or[T](self, default: T) -> D | T: ...
+    def popl_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def popr_many(self, k: int | None = None) -> tuple[D, ...]: ...
+    def pop_expiredl(self, now: float, ttl: float) -> tuple[D, ...]: ...
+    def pop_expiredr(self, now: float, ttl: float) -> tuple[D, ...]: ...
+    def agel(self, now: float | None = None) -> MayBe[float]: ...
+    def ager(self, now: float | None = None) -> MayBe[float]: ...
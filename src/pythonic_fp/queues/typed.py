@@ -0,0 +1,1376 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Typed numeric queues
+
+    Queues of machine numbers stored unboxed in a circular
+    ``array.array``, usually created with the ``typed`` methods of
+    ``FIFOQueue``, ``LIFOQueue`` and ``DEQueue``.
+
+    - a ``'d'`` queue uses 8 bytes per item, a ``FIFOQueue`` of floats
+      uses a pointer plus a boxed float, roughly 4 times more
+    - pushed values are converted as by ``array.array``, raising
+      ``TypeError`` or ``OverflowError`` before anything is pushed
+    - ``segments`` returns ``memoryview`` slices of the storage
+      without copying, the queue also supports the buffer protocol
+
+    .. code:: python
+
+        import numpy as np
+        from pythonic_fp.queues.fifo import FIFOQueue
+
+        samples = FIFOQueue.typed('d', [0.5, 1.5, 2.5])
+        np.frombuffer(samples).mean()
+
+    .. note::
+
+        Views stay valid but stop tracking the queue once its storage
+        is reallocated to make room for more items.
+
+"""
+
+import sys
+from array import array
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from functools import reduce
+from itertools import chain
+from pickle import PickleBuffer
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Final,
+    Self,
+    SupportsIndex,
+    cast,
+    overload,
+)
+
+from pythonic_fp.fptools.maybe import MayBe
+
+from pythonic_fp.queues._numpy import _array_to_ndarray, _ndarray_to_array
+from pythonic_fp.queues._serial import (
+    _KIND_TYPED_DE,
+    _KIND_TYPED_FIFO,
+    _KIND_TYPED_LIFO,
+    _decode,
+    _encode,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+__all__ = ['TypedDEQueue', 'TypedFIFOQueue', 'TypedLIFOQueue']
+
+# Numeric array.array typecodes, the unicode ones excluded.
+_TYPECODES: Final = frozenset('bBhHiIlLqQfd')
+
+# Byte order marks used by to_bytes.
+_BYTEORDER: Final = {'little': b'<', 'big': b'>'}
+
+
+class _TypedQueue[N: (int, float)]:
+    # Circular buffer of _cnt items starting at index _front of _buf.
+    # Storage is never resized in place, reallocation builds a new array,
+    # so memoryviews handed out never block pushes.
+
+    __slots__ = ('_buf', '_cnt', '_front', '_mutations')
+
+    _kind: ClassVar[bytes]
+
+    def __init__(self, typecode: str, ds: tuple[Iterable[float], ...]) -> None:
+        name = type(self).__name__
+        if typecode not in _TYPECODES:
+            msg = f'{name} expects a numeric array typecode, got {typecode!r}'
+            raise ValueError(msg)
+        if (size := len(ds)) > 1:
+            msg = f'{name} expects at most 1 iterable argument, got {size}'
+            raise ValueError(msg)
+        self._buf: array[Any] = array(typecode, ds[0]) if size else array(typecode)
+        self._front = 0
+        self._cnt = len(self._buf)
+        self._mutations = 0
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            Truthy when non-empty, falsy when empty.
+
+        """
+        return self._cnt > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the queue.
+
+        """
+        return self._cnt
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        .. admonition:: Buffer protocol
+
+            Expose the items, in the order they were stored, as one
+            contiguous buffer. Storage is first rotated in place if the
+            items wrap around its end.
+
+        """
+        if self._front + self._cnt > len(self._buf):
+            self._resize(len(self._buf))
+        return memoryview(self._buf)[self._front : self._front + self._cnt]
+
+    @property
+    def typecode(self) -> str:
+        """
+        .. admonition:: Typecode
+
+            The ``array.array`` typecode of the stored items.
+
+        """
+        return self._buf.typecode
+
+    @property
+    def itemsize(self) -> int:
+        """
+        .. admonition:: Item size
+
+            Number of bytes used to store each item.
+
+        """
+        return self._buf.itemsize
+
+    @property
+    def capacity(self) -> int:
+        """
+        .. admonition:: Capacity
+
+            Number of items the queue can hold before its
+            storage has to be reallocated.
+
+        """
+        return len(self._buf)
+
+    def segments(self) -> tuple[memoryview, memoryview]:
+        """
+        .. admonition:: Segments
+
+            The items, in the order they were stored, as the two
+            contiguous runs of storage they occupy. No data is copied.
+
+        :returns: Two ``memoryview`` slices, the second empty
+                  unless the items wrap around the end of storage.
+
+        """
+        view = memoryview(self._buf)
+        end = self._front + self._cnt
+        if end <= (cap := len(self._buf)):
+            return view[self._front : end], view[0:0]
+        return view[self._front :], view[: end - cap]
+
+    def reserve(self, n: int) -> None:
+        """
+        .. admonition:: Reserve
+
+            Make room for at least ``n`` more items up front.
+
+        :param n: Number of items to make room for.
+        :raises ValueError: When ``n`` is negative.
+
+        """
+        if n < 0:
+            msg = f'{type(self).__name__}.reserve expects a non-negative count, got {n}'
+            raise ValueError(msg)
+        if (need := self._cnt + n) > len(self._buf):
+            self._resize(need)
+
+    def shrink_to_fit(self) -> None:
+        """
+        .. admonition:: Shrink to fit
+
+            Release unused storage.
+
+        """
+        self._resize(self._cnt)
+
+    def extend_from_array(self, arr: 'NDArray[Any]') -> None:
+        """
+        .. admonition:: Extend from array
+
+            Push the items of a one dimensional NumPy array, in order,
+            as ``extend`` would, with block copies. Items are cast to
+            the typecode with NumPy's ``same_kind`` rule.
+
+        :param arr: One dimensional array of items.
+        :raises ValueError: When ``arr`` is not one dimensional.
+        :raises TypeError: When ``arr`` cannot be cast, nothing is pushed.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        name = f'{type(self).__name__}.extend_from_array'
+        self._write_rear(_ndarray_to_array(name, arr, self.typecode))
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """
+        .. admonition:: Pickle support
+
+            Items are pickled as one block of raw bytes. With pickle
+            protocol 5 the block is a ``PickleBuffer``, which can be
+            handed out-of-band to ``buffer_callback`` without a copy.
+
+        """
+        if int(protocol) >= 5:
+            data: object = PickleBuffer(memoryview(self))
+        else:
+            data = self._items().tobytes()
+        return _typed_from_buffer, (type(self), self.typecode, data)
+
+    def to_bytes(self) -> bytes:
+        """
+        .. admonition:: To bytes
+
+            Checkpoint the queue in a versioned binary format: a header,
+            the typecode, the byte order and the raw items. Read back
+            with ``from_bytes``, nothing is unpickled.
+
+        :returns: The checkpoint.
+
+        """
+        header = self.typecode.encode('ascii') + _BYTEORDER[sys.byteorder]
+        return _encode(self._kind, header + self._items().tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> Self:
+        """
+        .. admonition:: From bytes
+
+            Restore a queue checkpointed with ``to_bytes``, byte swapping
+            the items if written on a machine of the other byte order.
+
+        :param data: The checkpoint.
+        :returns: New queue instance.
+        :raises ValueError: When ``data`` is not a checkpoint of this kind
+                            of queue or its format version is not supported.
+
+        """
+        payload = _decode(cls.__name__, cls._kind, data)
+        typecode, order = chr(payload[0]) if payload else '', bytes(payload[1:2])
+        if typecode not in _TYPECODES or order not in _BYTEORDER.values():
+            msg = f'{cls.__name__}.from_bytes given a malformed payload'
+            raise ValueError(msg)
+        queue = _typed_from_buffer(cls, typecode, payload[2:])
+        if order != _BYTEORDER[sys.byteorder]:
+            queue._buf.byteswap()
+        return queue
+
+    def _items(self) -> 'array[Any]':
+        # Copy of the items in storage order.
+        return self._read(self._front, self._cnt)
+
+    def _resize(self, cap: int) -> None:
+        # Reallocate storage for cap items, the items moved to its start.
+        buf = self._items()
+        buf.frombytes(bytes((cap - self._cnt) * buf.itemsize))
+        self._buf, self._front = buf, 0
+
+    def _convert(self, ds: Iterable[N]) -> 'array[Any]':
+        # Convert all items before any are pushed.
+        return array(self._buf.typecode, ds)
+
+    def _write_rear(self, items: 'array[Any]') -> None:
+        if not (n := len(items)):
+            return
+        if self._cnt + n > (cap := len(self._buf)):
+            self._resize(max(self._cnt + n, 2 * cap, 8))
+            cap = len(self._buf)
+        buf = self._buf
+        rear = (self._front + self._cnt) % cap
+        k = min(n, cap - rear)
+        buf[rear : rear + k] = items[:k]
+        if k < n:
+            buf[: n - k] = items[k:]
+        self._cnt += n
+        self._mutations += 1
+
+    def _write_front(self, items: 'array[Any]') -> None:
+        if not (n := len(items)):
+            return
+        if self._cnt + n > (cap := len(self._buf)):
+            self._resize(max(self._cnt + n, 2 * cap, 8))
+            cap = len(self._buf)
+        buf = self._buf
+        start = (self._front - n) % cap
+        k = min(n, cap - start)
+        buf[start : start + k] = items[:k]
+        if k < n:
+            buf[: n - k] = items[k:]
+        self._front = start
+        self._cnt += n
+        self._mutations += 1
+
+    def _read(self, start: int, k: int) -> 'array[Any]':
+        # Copy k items starting at storage index start.
+        buf = self._buf
+        cap = len(buf)
+        if (end := start + k) <= cap:
+            return buf[start:end]
+        items = buf[start:]
+        items.extend(buf[: end - cap])
+        return items
+
+    def _drop_front(self, k: int) -> None:
+        if k:
+            self._front = (self._front + k) % len(self._buf)
+            self._cnt -= k
+            self._mutations += 1
+
+    def _drop_rear(self, k: int) -> None:
+        if k:
+            self._cnt -= k
+            self._mutations += 1
+
+    def _peek_front(self, k: int) -> 'array[Any]':
+        return self._read(self._front, k)
+
+    def _peek_rear(self, k: int) -> 'array[Any]':
+        # The last k items, in storage order.
+        if not k:
+            return array(self._buf.typecode)
+        return self._read((self._front + self._cnt - k) % len(self._buf), k)
+
+    def _take_front(self, k: int) -> 'array[Any]':
+        items = self._peek_front(k)
+        self._drop_front(k)
+        return items
+
+    def _take_rear(self, k: int) -> 'array[Any]':
+        items = self._peek_rear(k)
+        self._drop_rear(k)
+        return items
+
+    def _pop_front(self) -> N:
+        d = cast(N, self._buf[self._front])
+        self._front = (self._front + 1) % len(self._buf)
+        self._cnt -= 1
+        self._mutations += 1
+        return d
+
+    def _pop_rear(self) -> N:
+        self._cnt -= 1
+        self._mutations += 1
+        return cast(N, self._buf[(self._front + self._cnt) % len(self._buf)])
+
+    def _check_count(self, method: str, k: int | None) -> int:
+        if k is None:
+            return self._cnt
+        if k < 0:
+            msg = (
+                f'{type(self).__name__}.{method} expects a non-negative count, got {k}'
+            )
+            raise ValueError(msg)
+        return min(k, self._cnt)
+
+    def _iter(self, reverse: bool) -> Iterator[N]:
+        mutations = self._mutations
+        first, second = self.segments()
+        if reverse:
+            items = chain(reversed(second), reversed(first))
+        else:
+            items = chain(first, second)
+        for d in cast(Iterator[N], items):
+            yield d
+            if self._mutations != mutations:
+                msg = f'{type(self).__name__} mutated during iteration'
+                raise RuntimeError(msg)
+
+    def _repr(self) -> str:
+        if self._cnt == 0:
+            return f'{type(self).__name__}({self.typecode!r})'
+        return f'{type(self).__name__}({self.typecode!r}, {self._items().tolist()!r})'
+
+
+class TypedFIFOQueue[N: (int, float)](_TypedQueue[N]):
+    """
+    .. admonition:: TypedFIFOQueue
+
+        First-In-First-Out (FIFO) Queue of numbers stored unboxed.
+
+        - O(1) pops
+        - O(1) amortized pushes
+        - O(1) length determination
+        - in a Boolean context, truthy if not empty, falsy if empty
+        - supports the buffer protocol, items oldest to newest
+        - neither indexable nor sliceable by design
+
+    """
+
+    __slots__ = ()
+
+    _kind = _KIND_TYPED_FIFO
+
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``TypedFIFOQueue`` with 0 or 1 iterables to
+            populate the queue in natural FIFO order.
+
+        :param typecode: Numeric ``array.array`` typecode of the items.
+        :param ds: Takes 0 or 1 iterable parameters.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When an item cannot be stored with ``typecode``.
+        :raises OverflowError: When an item is out of range for ``typecode``.
+
+        """
+        super().__init__(typecode, ds)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``TypedFIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, TypedFIFOQueue):
+            return False
+        return self._items() == other._items()
+
+    def __iter__(self) -> Iterator[N]:
+        """
+        .. admonition:: Iteration
+
+            Iterate in place over current state in natural FIFO order.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``TypedFIFOQueue`` mutated during iteration.
+
+        """
+        return self._iter(False)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string "TypedFIFOQueue('t', [d₁, d₂, … dₙ])" where
+
+            - 't' is the typecode
+            - d₁, d₂, … dₙ are the contents, oldest to newest
+
+        :returns: A string to reproduce the ``TypedFIFOQueue``.
+
+        """
+        return self._repr()
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '<< d₁ < d₂ < … < dₙ <<' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '<< ' + ' < '.join(map(str, self)) + ' <<'
+
+    def copy(self) -> 'TypedFIFOQueue[N]':
+        """
+        .. admonition:: Copy
+
+            Copy the ``TypedFIFOQueue``, storage compacted.
+
+        :returns: New ``TypedFIFOQueue`` instance containing the same items.
+
+        """
+        return TypedFIFOQueue(self.typecode, self._items())
+
+    def snapshot(self) -> tuple[N, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``TypedFIFOQueue`` in natural FIFO order.
+
+        :returns: A tuple of the data, oldest to newest.
+
+        """
+        return tuple(self._items())
+
+    def push(self, *ds: N) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto rear of ``TypedFIFOQueue``.
+
+        :param ds: Items to be pushed onto ``TypedFIFOQueue``.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def extend(self, ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Extend
+
+            Push all items of ``ds`` onto rear of ``TypedFIFOQueue``.
+
+        :param ds: Iterable of items to push, oldest first.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def pop(self) -> MayBe[N]:
+        """
+        .. admonition:: Pop
+
+            Pop data off of front of ``TypedFIFOQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``TypedFIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._cnt:
+            return MayBe(self._pop_front())
+        return MayBe()
+
+    def pop_or[T](self, default: T) -> N | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop data off of front of ``TypedFIFOQueue``.
+
+        :param default: Value returned when ``TypedFIFOQueue`` empty.
+        :returns: Popped data item, or ``default`` if ``TypedFIFOQueue`` empty.
+
+        """
+        if self._cnt:
+            return self._pop_front()
+        return default
+
+    def pop_many(self, k: int | None = None) -> 'array[Any]':
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``TypedFIFOQueue``,
+            all of them if ``k`` not given. Items are not boxed.
+
+        :param k: Maximum number of items to pop.
+        :returns: An ``array.array`` of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        return self._take_front(self._check_count('pop_many', k))
+
+    def drain_to_array(
+        self, k: int | None = None, dtype: 'DTypeLike | None' = None
+    ) -> 'NDArray[Any]':
+        """
+        .. admonition:: Drain to array
+
+            Pop up to ``k`` data items off front of ``TypedFIFOQueue``
+            into a NumPy array, all of them if ``k`` not given. Copied
+            in at most two blocks, nothing popped if the conversion
+            to ``dtype`` fails.
+
+        :param k: Maximum number of items to pop.
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the popped data, oldest to newest.
+        :raises ValueError: When ``k`` is negative.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        k = self._check_count('drain_to_array', k)
+        out = _array_to_ndarray(self._peek_front(k), dtype)
+        self._drop_front(k)
+        return out
+
+    def to_numpy(self, dtype: 'DTypeLike | None' = None) -> 'NDArray[Any]':
+        """
+        .. admonition:: To NumPy
+
+            Copy current state of ``TypedFIFOQueue`` into a NumPy array in
+            natural FIFO order, storage copied in at most two blocks.
+
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the data, oldest to newest.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        return _array_to_ndarray(self._items(), dtype)
+
+    def peak_last_in(self) -> MayBe[N]:
+        """
+        .. admonition:: Peak last in
+
+            Peak at last data item pushed onto ``TypedFIFOQueue``.
+
+        :returns: ``MayBe`` of last item pushed, empty ``MayBe``
+                  if ``TypedFIFOQueue`` empty.
+
+        """
+        if self._cnt:
+            return MayBe(
+                cast(N, self._buf[(self._front + self._cnt - 1) % len(self._buf)])
+            )
+        return MayBe()
+
+    def peak_next_out(self) -> MayBe[N]:
+        """
+        .. admonition:: Peak next out
+
+            Peak at next data item to be popped off ``TypedFIFOQueue``.
+
+        :returns: ``MayBe`` of next item out, empty ``MayBe``
+                  if ``TypedFIFOQueue`` empty.
+
+        """
+        if self._cnt:
+            return MayBe(cast(N, self._buf[self._front]))
+        return MayBe()
+
+    @overload
+    def fold[T](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, N], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, N], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``TypedFIFOQueue`` in natural FIFO order.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``TypedFIFOQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            return MayBe(cast(T, reduce(cast(Callable[[N, N], N], f), self)))  # T = N
+        return MayBe(reduce(f, self, start))
+
+    def map(self, f: Callable[[N], N]) -> 'TypedFIFOQueue[N]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``TypedFIFOQueue``, retaining the
+            FIFO order and typecode.
+
+        :param f: Function to map over ``TypedFIFOQueue``.
+        :returns: New ``TypedFIFOQueue`` instance.
+
+        """
+        return TypedFIFOQueue(self.typecode, map(f, self))
+
+
+class TypedLIFOQueue[N: (int, float)](_TypedQueue[N]):
+    """
+    .. admonition:: TypedLIFOQueue
+
+        Last-In-First-Out (LIFO) Queue of numbers stored unboxed.
+
+        - O(1) pops
+        - O(1) amortized pushes
+        - O(1) length determination
+        - in a Boolean context, truthy if not empty, falsy if empty
+        - supports the buffer protocol, items oldest to newest
+        - neither indexable nor sliceable by design
+
+    """
+
+    __slots__ = ()
+
+    _kind = _KIND_TYPED_LIFO
+
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``TypedLIFOQueue`` with 0 or 1 iterables,
+            the last item ending up on top.
+
+        :param typecode: Numeric ``array.array`` typecode of the items.
+        :param ds: Takes 0 or 1 iterable parameters.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When an item cannot be stored with ``typecode``.
+        :raises OverflowError: When an item is out of range for ``typecode``.
+
+        """
+        super().__init__(typecode, ds)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``TypedLIFOQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, TypedLIFOQueue):
+            return False
+        return self._items() == other._items()
+
+    def __iter__(self) -> Iterator[N]:
+        """
+        .. admonition:: Iteration
+
+            Iterate in place over current state in natural LIFO order.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``TypedLIFOQueue`` mutated during iteration.
+
+        """
+        return self._iter(True)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string "TypedLIFOQueue('t', [d₁, d₂, … dₙ])" where
+
+            - 't' is the typecode
+            - d₁, d₂, … dₙ are the contents, oldest to newest
+
+        :returns: A string to reproduce the ``TypedLIFOQueue``.
+
+        """
+        return self._repr()
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '|| dₙ > … > d₂ > d₁ ><' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '|| ' + ' > '.join(map(str, self)) + ' ><'
+
+    def copy(self) -> 'TypedLIFOQueue[N]':
+        """
+        .. admonition:: Copy
+
+            Copy the ``TypedLIFOQueue``, storage compacted.
+
+        :returns: New ``TypedLIFOQueue`` instance containing the same items.
+
+        """
+        return TypedLIFOQueue(self.typecode, self._items())
+
+    def snapshot(self) -> tuple[N, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``TypedLIFOQueue`` in natural LIFO order.
+
+        :returns: A tuple of the data, newest to oldest.
+
+        """
+        items = self._items()
+        items.reverse()
+        return tuple(items)
+
+    def push(self, *ds: N) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto top of ``TypedLIFOQueue``.
+
+        :param ds: Items to be pushed onto ``TypedLIFOQueue``.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def extend(self, ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Extend
+
+            Push all items of ``ds`` onto top of ``TypedLIFOQueue``.
+
+        :param ds: Iterable of items to push, the last ending up on top.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def pop(self) -> MayBe[N]:
+        """
+        .. admonition:: Pop
+
+            Pop data off of top of ``TypedLIFOQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``TypedLIFOQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._cnt:
+            return MayBe(self._pop_rear())
+        return MayBe()
+
+    def pop_or[T](self, default: T) -> N | T:
+        """
+        .. admonition:: Pop or default
+
+            Pop data off of top of ``TypedLIFOQueue``.
+
+        :param default: Value returned when ``TypedLIFOQueue`` empty.
+        :returns: Popped data item, or ``default`` if ``TypedLIFOQueue`` empty.
+
+        """
+        if self._cnt:
+            return self._pop_rear()
+        return default
+
+    def pop_many(self, k: int | None = None) -> 'array[Any]':
+        """
+        .. admonition:: Pop many
+
+            Pop up to ``k`` data items off of ``TypedLIFOQueue``,
+            all of them if ``k`` not given. Items are not boxed.
+
+        :param k: Maximum number of items to pop.
+        :returns: An ``array.array`` of the popped data, newest to oldest.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._take_rear(self._check_count('pop_many', k))
+        items.reverse()
+        return items
+
+    def drain_to_array(
+        self, k: int | None = None, dtype: 'DTypeLike | None' = None
+    ) -> 'NDArray[Any]':
+        """
+        .. admonition:: Drain to array
+
+            Pop up to ``k`` data items off top of ``TypedLIFOQueue``
+            into a NumPy array, all of them if ``k`` not given. Copied
+            in at most two blocks, nothing popped if the conversion
+            to ``dtype`` fails.
+
+        :param k: Maximum number of items to pop.
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the popped data, newest to oldest.
+        :raises ValueError: When ``k`` is negative.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        k = self._check_count('drain_to_array', k)
+        out = _array_to_ndarray(self._peek_rear(k), dtype, reverse=True)
+        self._drop_rear(k)
+        return out
+
+    def to_numpy(self, dtype: 'DTypeLike | None' = None) -> 'NDArray[Any]':
+        """
+        .. admonition:: To NumPy
+
+            Copy current state of ``TypedLIFOQueue`` into a NumPy array in
+            natural LIFO order, storage copied in at most two blocks.
+
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the data, newest to oldest.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        return _array_to_ndarray(self._items(), dtype, reverse=True)
+
+    def peak(self) -> MayBe[N]:
+        """
+        .. admonition:: Peak
+
+            Peak at top of ``TypedLIFOQueue``.
+
+        :returns: ``MayBe`` of top item, empty ``MayBe``
+                  if ``TypedLIFOQueue`` empty.
+
+        """
+        if self._cnt:
+            return MayBe(
+                cast(N, self._buf[(self._front + self._cnt - 1) % len(self._buf)])
+            )
+        return MayBe()
+
+    @overload
+    def fold[T](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, N], T], start: T) -> MayBe[T]: ...
+
+    def fold[T](self, f: Callable[[T, N], T], start: T | None = None) -> MayBe[T]:
+        """
+        .. admonition:: Fold
+
+            Reduces ``TypedLIFOQueue`` in natural LIFO order.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``TypedLIFOQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            return MayBe(cast(T, reduce(cast(Callable[[N, N], N], f), self)))  # T = N
+        return MayBe(reduce(f, self, start))
+
+    def map(self, f: Callable[[N], N]) -> 'TypedLIFOQueue[N]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``TypedLIFOQueue``, newest to oldest,
+            retaining the LIFO order and typecode.
+
+        :param f: Function to map over ``TypedLIFOQueue``.
+        :returns: New ``TypedLIFOQueue`` instance.
+
+        """
+        items = self._convert(map(f, self))
+        items.reverse()
+        return TypedLIFOQueue(self.typecode, items)
+
+
+class TypedDEQueue[N: (int, float)](_TypedQueue[N]):
+    """
+    .. admonition:: TypedDEQueue
+
+        Double-Ended (DE) Queue of numbers stored unboxed.
+
+        - O(1) pops each end
+        - O(1) amortized pushes each end
+        - O(1) length determination
+        - in a Boolean context, truthy if not empty, falsy if empty
+        - supports the buffer protocol, items left to right
+        - neither indexable nor sliceable by design
+
+    """
+
+    __slots__ = ()
+
+    _kind = _KIND_TYPED_DE
+
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Initializer
+
+            Initialize ``TypedDEQueue`` with 0 or 1 iterables,
+            the items left to right.
+
+        :param typecode: Numeric ``array.array`` typecode of the items.
+        :param ds: Takes 0 or 1 iterable parameters.
+        :raises ValueError: When ``typecode`` is not a numeric typecode.
+        :raises ValueError: When more than one parameter is provided.
+        :raises TypeError: When an item cannot be stored with ``typecode``.
+        :raises OverflowError: When an item is out of range for ``typecode``.
+
+        """
+        super().__init__(typecode, ds)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        .. admonition:: Equality comparison
+
+            If ``other`` is a ``TypedDEQueue`` and the corresponding
+            elements of ``self`` and ``other`` compare as equal,
+            then return ``True``. Otherwise return ``False``.
+
+        :returns: ``self == other``
+
+        """
+        if not isinstance(other, TypedDEQueue):
+            return False
+        return self._items() == other._items()
+
+    def __iter__(self) -> Iterator[N]:
+        """
+        .. admonition:: Iteration
+
+            Iterate in place over current state left to right.
+
+        :returns: An iterator of the data.
+        :raises RuntimeError: When ``TypedDEQueue`` mutated during iteration.
+
+        """
+        return self._iter(False)
+
+    def __reversed__(self) -> Iterator[N]:
+        """
+        .. admonition:: Reverse iteration
+
+            Iterate in place over current state right to left.
+
+        :returns: A reversed iterator of the data.
+        :raises RuntimeError: When ``TypedDEQueue`` mutated during iteration.
+
+        """
+        return self._iter(True)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string "TypedDEQueue('t', [d₁, d₂, … dₙ])" where
+
+            - 't' is the typecode
+            - d₁, d₂, … dₙ are the contents, left to right
+
+        :returns: A string to reproduce the ``TypedDEQueue``.
+
+        """
+        return self._repr()
+
+    def __str__(self) -> str:
+        """
+        .. admonition:: User string
+
+            Construct string '>< d₁ | d₂ | … | dₙ ><' where
+
+            - d₁, d₂, ..., dₙ are the contents displayed with ``str()``
+
+        :returns: A string meaningful to an end user.
+
+        """
+        return '>< ' + ' | '.join(map(str, self)) + ' ><'
+
+    def copy(self) -> 'TypedDEQueue[N]':
+        """
+        .. admonition:: Copy
+
+            Copy the ``TypedDEQueue``, storage compacted.
+
+        :returns: New ``TypedDEQueue`` instance containing the same items.
+
+        """
+        return TypedDEQueue(self.typecode, self._items())
+
+    def snapshot(self) -> tuple[N, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current state of ``TypedDEQueue``.
+
+        :returns: A tuple of the data, left to right.
+
+        """
+        return tuple(self._items())
+
+    def pushl(self, *ds: N) -> None:
+        """
+        .. admonition:: Push left
+
+            Push data items onto left side of ``TypedDEQueue``,
+            one at a time, the last ending up leftmost.
+
+        :param ds: Items to be pushed onto ``TypedDEQueue``.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        items = self._convert(ds)
+        items.reverse()
+        self._write_front(items)
+
+    def pushr(self, *ds: N) -> None:
+        """
+        .. admonition:: Push right
+
+            Push data items onto right side of ``TypedDEQueue``.
+
+        :param ds: Items to be pushed onto ``TypedDEQueue``.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def extendl(self, ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Extend left
+
+            Push all items of ``ds`` onto left side of ``TypedDEQueue``,
+            one at a time, the last ending up leftmost.
+
+        :param ds: Iterable of items to push.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        items = self._convert(ds)
+        items.reverse()
+        self._write_front(items)
+
+    def extendr(self, ds: Iterable[N]) -> None:
+        """
+        .. admonition:: Extend right
+
+            Push all items of ``ds`` onto right side of ``TypedDEQueue``.
+
+        :param ds: Iterable of items to push.
+        :raises TypeError: When an item cannot be stored, none are pushed.
+        :raises OverflowError: When an item is out of range, none are pushed.
+
+        """
+        self._write_rear(self._convert(ds))
+
+    def popl(self) -> MayBe[N]:
+        """
+        .. admonition:: Pop left
+
+            Pop data off of left side of ``TypedDEQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``TypedDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._cnt:
+            return MayBe(self._pop_front())
+        return MayBe()
+
+    def popr(self) -> MayBe[N]:
+        """
+        .. admonition:: Pop right
+
+            Pop data off of right side of ``TypedDEQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``TypedDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        if self._cnt:
+            return MayBe(self._pop_rear())
+        return MayBe()
+
+    def popl_or[T](self, default: T) -> N | T:
+        """
+        .. admonition:: Pop left or default
+
+            Pop data off of left side of ``TypedDEQueue``.
+
+        :param default: Value returned when ``TypedDEQueue`` empty.
+        :returns: Popped data item, or ``default`` if ``TypedDEQueue`` empty.
+
+        """
+        if self._cnt:
+            return self._pop_front()
+        return default
+
+    def popr_or[T](self, default: T) -> N | T:
+        """
+        .. admonition:: Pop right or default
+
+            Pop data off of right side of ``TypedDEQueue``.
+
+        :param default: Value returned when ``TypedDEQueue`` empty.
+        :returns: Popped data item, or ``default`` if ``TypedDEQueue`` empty.
+
+        """
+        if self._cnt:
+            return self._pop_rear()
+        return default
+
+    def popl_many(self, k: int | None = None) -> 'array[Any]':
+        """
+        .. admonition:: Pop left many
+
+            Pop up to ``k`` data items off of left side of
+            ``TypedDEQueue``, all of them if ``k`` not given.
+
+        :param k: Maximum number of items to pop.
+        :returns: An ``array.array`` of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        return self._take_front(self._check_count('popl_many', k))
+
+    def popr_many(self, k: int | None = None) -> 'array[Any]':
+        """
+        .. admonition:: Pop right many
+
+            Pop up to ``k`` data items off of right side of
+            ``TypedDEQueue``, all of them if ``k`` not given.
+
+        :param k: Maximum number of items to pop.
+        :returns: An ``array.array`` of the popped data, right to left.
+        :raises ValueError: When ``k`` is negative.
+
+        """
+        items = self._take_rear(self._check_count('popr_many', k))
+        items.reverse()
+        return items
+
+    def drain_to_array(
+        self, k: int | None = None, dtype: 'DTypeLike | None' = None
+    ) -> 'NDArray[Any]':
+        """
+        .. admonition:: Drain to array
+
+            Pop up to ``k`` data items off left side of ``TypedDEQueue``
+            into a NumPy array, all of them if ``k`` not given. Copied
+            in at most two blocks, nothing popped if the conversion
+            to ``dtype`` fails.
+
+        :param k: Maximum number of items to pop.
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the popped data, left to right.
+        :raises ValueError: When ``k`` is negative.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        k = self._check_count('drain_to_array', k)
+        out = _array_to_ndarray(self._peek_front(k), dtype)
+        self._drop_front(k)
+        return out
+
+    def to_numpy(self, dtype: 'DTypeLike | None' = None) -> 'NDArray[Any]':
+        """
+        .. admonition:: To NumPy
+
+            Copy current state of ``TypedDEQueue`` into a NumPy array in
+            left to right order, storage copied in at most two blocks.
+
+        :param dtype: Optional NumPy dtype, the typecode's if not given.
+        :returns: A NumPy array of the data, left to right.
+        :raises ImportError: When NumPy is not installed.
+
+        """
+        return _array_to_ndarray(self._items(), dtype)
+
+    def peakl(self) -> MayBe[N]:
+        """
+        .. admonition:: Peak left
+
+            Peak at leftmost item on ``TypedDEQueue``.
+
+        :returns: ``MayBe`` of leftmost item, empty ``MayBe``
+                  if ``TypedDEQueue`` empty.
+
+        """
+        if self._cnt:
+            return MayBe(cast(N, self._buf[self._front]))
+        return MayBe()
+
+    def peakr(self) -> MayBe[N]:
+        """
+        .. admonition:: Peak right
+
+            Peak at rightmost item on ``TypedDEQueue``.
+
+        :returns: ``MayBe`` of rightmost item, empty ``MayBe``
+                  if ``TypedDEQueue`` empty.
+
+        """
+        if self._cnt:
+            return MayBe(
+                cast(N, self._buf[(self._front + self._cnt - 1) % len(self._buf)])
+            )
+        return MayBe()
+
+    @overload
+    def foldl[L](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, N], L], start: L) -> MayBe[L]: ...
+
+    def foldl[L](self, f: Callable[[L, N], L], start: L | None = None) -> MayBe[L]:
+        """
+        .. admonition:: Fold left
+
+            Reduces ``TypedDEQueue`` left to right.
+
+        :param f: Reducing function, first argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``TypedDEQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            return MayBe(cast(L, reduce(cast(Callable[[N, N], N], f), self)))  # L = N
+        return MayBe(reduce(f, self, start))
+
+    @overload
+    def foldr[R](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def foldr[R](self, f: Callable[[N, R], R], start: R) -> MayBe[R]: ...
+
+    def foldr[R](self, f: Callable[[N, R], R], start: R | None = None) -> MayBe[R]:
+        """
+        .. admonition:: Fold right
+
+            Reduces ``TypedDEQueue`` right to left.
+
+        :param f: Reducing function, second argument is for accumulator.
+        :param start: Optional starting value.
+        :returns: ``MayBe`` of reduced value with ``f``, empty ``MayBe``
+                  if ``TypedDEQueue`` empty and no starting value given.
+
+        """
+        if start is None:
+            if not self:
+                return MayBe()
+            g = cast(Callable[[N, N], N], f)
+            return MayBe(
+                cast(R, reduce(lambda acc, d: g(d, acc), reversed(self)))
+            )  # R = N
+        return MayBe(reduce(lambda acc, d: f(d, acc), reversed(self), start))
+
+    def map(self, f: Callable[[N], N]) -> 'TypedDEQueue[N]':
+        """
+        .. admonition:: Map
+
+            Map ``f`` over the ``TypedDEQueue`` left to right,
+            retaining its order and typecode.
+
+        :param f: Function to map over ``TypedDEQueue``.
+        :returns: New ``TypedDEQueue`` instance.
+
+        """
+        return TypedDEQueue(self.typecode, map(f, self))
+
+
+def _typed_from_buffer[Q: _TypedQueue[Any]](
+    cls: type[Q], typecode: str, data: Buffer
+) -> Q:
+    # Rebuild a typed queue from raw item bytes, also used to unpickle.
+    raw = memoryview(data).cast('B')
+    items = array(typecode)
+    if len(raw) % items.itemsize:
+        msg = f'{cls.__name__} given {len(raw)} bytes, not a whole number of items'
+        raise ValueError(msg)
+    items.frombytes(raw)
+    queue = cls.__new__(cls)
+    queue._buf, queue._front, queue._cnt, queue._mutations = items, 0, len(items), 0
+    return queue
@@ -0,0 +1,127 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Final, overload
+
+from numpy.typing import DTypeLike, NDArray
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['TypedDEQueue', 'TypedFIFOQueue', 'TypedLIFOQueue']
+
+_TYPECODES: Final[frozenset[str]]
+
+class TypedFIFOQueue[N: (int, float)]:
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[N]: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
+    @property
+    def typecode(self) -> str: ...
+    @property
+    def itemsize(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    def segments(self) -> tuple[memoryview, memoryview]: ...
+    def reserve(self, n: int) -> None: ...
+    def shrink_to_fit(self) -> None: ...
+    def extend_from_array(self, arr: NDArray[Any]) -> None: ...
+    def copy(self) -> TypedFIFOQueue[N]: ...
+    def snapshot(self) -> tuple[N, ...]: ...
+    def push(self, *ds: N) -> None: ...
+    def extend(self, ds: Iterable[N]) -> None: ...
+    def pop(self) -> MayBe[N]: ...
+    def pop_or[T](self, default: T) -> N | T: ...
+    def pop_many(self, k: int | None = None) -> array[Any]: ...
+    def drain_to_array(
+        self, k: int | None = None, dtype: DTypeLike | None = None
+    ) -> NDArray[Any]: ...
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]: ...
+    def peak_last_in(self) -> MayBe[N]: ...
+    def peak_next_out(self) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, N], T], start: T) -> MayBe[T]: ...
+    def map(self, f: Callable[[N], N]) -> TypedFIFOQueue[N]: ...
+
+class TypedLIFOQueue[N: (int, float)]:
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[N]: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
+    @property
+    def typecode(self) -> str: ...
+    @property
+    def itemsize(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    def segments(self) -> tuple[memoryview, memoryview]: ...
+    def reserve(self, n: int) -> None: ...
+    def shrink_to_fit(self) -> None: ...
+    def extend_from_array(self, arr: NDArray[Any]) -> None: ...
+    def copy(self) -> TypedLIFOQueue[N]: ...
+    def snapshot(self) -> tuple[N, ...]: ...
+    def push(self, *ds: N) -> None: ...
+    def extend(self, ds: Iterable[N]) -> None: ...
+    def pop(self) -> MayBe[N]: ...
+    def pop_or[T](self, default: T) -> N | T: ...
+    def pop_many(self, k: int | None = None) -> array[Any]: ...
+    def drain_to_array(
+        self, k: int | None = None, dtype: DTypeLike | None = None
+    ) -> NDArray[Any]: ...
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]: ...
+    def peak(self) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def fold[T](self, f: Callable[[T, N], T], start: T) -> MayBe[T]: ...
+    def map(self, f: Callable[[N], N]) -> TypedLIFOQueue[N]: ...
+
+class TypedDEQueue[N: (int, float)]:
+    def __init__(self, typecode: str, *ds: Iterable[N]) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __iter__(self) -> Iterator[N]: ...
+    def __reversed__(self) -> Iterator[N]: ...
+    def __buffer__(self, flags: int) -> memoryview: ...
+    @property
+    def typecode(self) -> str: ...
+    @property
+    def itemsize(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    def segments(self) -> tuple[memoryview, memoryview]: ...
+    def reserve(self, n: int) -> None: ...
+    def shrink_to_fit(self) -> None: ...
+    def extend_from_array(self, arr: NDArray[Any]) -> None: ...
+    def copy(self) -> TypedDEQueue[N]: ...
+    def snapshot(self) -> tuple[N, ...]: ...
+    def pushl(self, *ds: N) -> None: ...
+    def pushr(self, *ds: N) -> None: ...
+    def extendl(self, ds: Iterable[N]) -> None: ...
+    def extendr(self, ds: Iterable[N]) -> None: ...
+    def popl(self) -> MayBe[N]: ...
+    def popr(self) -> MayBe[N]: ...
+    def popl_or[T](self, default: T) -> N | T: ...
+    def popr_or[T](self, default: T) -> N | T: ...
+    def popl_many(self, k: int | None = None) -> array[Any]: ...
+    def popr_many(self, k: int | None = None) -> array[Any]: ...
+    def drain_to_array(
+        self, k: int | None = None, dtype: DTypeLike | None = None
+    ) -> NDArray[Any]: ...
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]: ...
+    def peakl(self) -> MayBe[N]: ...
+    def peakr(self) -> MayBe[N]: ...
+    @overload
+    def foldl[L](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def foldl[L](self, f: Callable[[L, N], L], start: L) -> MayBe[L]: ...
+    @overload
+    def foldr[R](self, f: Callable[[N, N], N]) -> MayBe[N]: ...
+    @overload
+    def foldr[R](self, f: Callable[[N, R], R], start: R) -> MayBe[R]: ...
+    def map(self, f: Callable[[N], N]) -> TypedDEQueue[N]: ...
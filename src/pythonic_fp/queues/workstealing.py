@@ -0,0 +1,421 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+.. admonition:: Work stealing
+
+    A ``DEQueue`` shared between its owner and thieves, and a thread
+    pool executor keeping one such deque per worker.
+
+    - the owner pushes and pops at the right end, newest work first
+    - thieves steal from the left end, oldest work first
+    - tasks submitted by a worker go onto its own deque, so fan-out
+      does not pass through one central queue
+    - tasks submitted from other threads wait in an inbox, taken
+      oldest first
+
+    .. code:: python
+
+        from pythonic_fp.queues.workstealing import WorkStealingExecutor
+
+        with WorkStealingExecutor(8) as pool:
+            results = list(pool.map(crunch, chunks))
+
+"""
+
+import atexit
+import os
+import random
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from typing import Any, cast
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+from pythonic_fp.queues.de import DEQueue
+
+__all__ = ['WorkStealingDEQueue', 'WorkStealingExecutor']
+
+_novalue = NoValue()
+
+# Pools with workers possibly still running. At interpreter exit they
+# are closed and joined, so work submitted to them still runs.
+_live_pools: 'weakref.WeakSet[_Pool]' = weakref.WeakSet()
+_live_lock = threading.Lock()
+
+
+def _python_exit() -> None:
+    with _live_lock:
+        pools = list(_live_pools)
+    for pool in pools:
+        pool.close()
+    for pool in pools:
+        pool.join()
+
+
+atexit.register(_python_exit)
+
+
+class WorkStealingDEQueue[D]:
+    """
+    .. admonition:: WorkStealingDEQueue
+
+        Thread safe Double-Ended (DE) Queue for work stealing, an
+        owner working at the right end and thieves at the left.
+
+        - one lock per deque, only contended while being stolen from
+        - O(1) owner pushes and pops, O(1) steals
+        - ``steal_half`` takes the older half of the work in one go
+        - in a Boolean context, truthy if not empty, falsy if empty
+
+    """
+
+    __slots__ = ('_dq', '_lock')
+
+    def __init__(self) -> None:
+        """
+        .. admonition:: Initializer
+
+            Create an empty ``WorkStealingDEQueue``.
+
+        """
+        self._dq: DEQueue[D] = DEQueue()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        """
+        .. admonition:: Truthiness
+
+            ``WorkStealingDEQueue`` truthy when non-empty, falsy when empty.
+
+        """
+        return len(self._dq) > 0
+
+    def __len__(self) -> int:
+        """
+        .. admonition:: Get length
+
+            Return the number of data elements in the ``WorkStealingDEQueue``,
+            a moment's estimate while other threads use it.
+
+        """
+        return len(self._dq)
+
+    def __repr__(self) -> str:
+        """
+        .. admonition:: String representation
+
+            Construct string 'WorkStealingDEQueue()'.
+
+        """
+        return 'WorkStealingDEQueue()'
+
+    def snapshot(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Snapshot
+
+            Copy current contents, oldest to newest, under the lock.
+
+        :returns: A tuple of the data.
+
+        """
+        with self._lock:
+            return self._dq.snapshot()
+
+    def push(self, *ds: D) -> None:
+        """
+        .. admonition:: Push
+
+            Push data items onto the owner's end of ``WorkStealingDEQueue``.
+            Usually done by the owner, safe from any thread.
+
+        :param ds: Items to be pushed.
+
+        """
+        with self._lock:
+            self._dq.pushr(*ds)
+
+    def pop(self) -> MayBe[D]:
+        """
+        .. admonition:: Pop
+
+            Owner pops the newest data item off of ``WorkStealingDEQueue``.
+
+        :returns: ``MayBe`` of popped data item if ``WorkStealingDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            return self._dq.popr()
+
+    def pop_or[T](self, default: T) -> D | T:
+        """
+        .. admonition:: Pop or default
+
+            Owner pops the newest data item off of ``WorkStealingDEQueue``.
+
+        :param default: Value returned when ``WorkStealingDEQueue`` empty.
+        :returns: Popped data item, or ``default`` if empty.
+
+        """
+        with self._lock:
+            return self._dq.popr_or(default)
+
+    def steal(self) -> MayBe[D]:
+        """
+        .. admonition:: Steal
+
+            Thief takes the oldest data item off of ``WorkStealingDEQueue``.
+
+        :returns: ``MayBe`` of stolen data item if ``WorkStealingDEQueue``
+                  was not empty, empty ``MayBe`` otherwise.
+
+        """
+        with self._lock:
+            return self._dq.popl()
+
+    def steal_half(self) -> tuple[D, ...]:
+        """
+        .. admonition:: Steal half
+
+            Thief takes the older half of the data items off of
+            ``WorkStealingDEQueue``, rounding up, under a single lock
+            acquisition.
+
+        :returns: A tuple of the stolen data, oldest to newest.
+
+        """
+        with self._lock:
+            return self._dq.popl_many((len(self._dq) + 1) // 2)
+
+
+class WorkStealingExecutor(Executor):
+    """
+    .. admonition:: WorkStealingExecutor
+
+        Thread pool ``concurrent.futures.Executor`` with a
+        ``WorkStealingDEQueue`` per worker.
+
+        - a worker runs its own newest task first
+        - an idle worker steals half the oldest tasks of another
+        - tasks submitted from a worker go onto its own deque, others
+          into an inbox the workers take from oldest first
+        - idle workers sleep until a task is submitted
+        - like ``ThreadPoolExecutor``, submitted work still runs at
+          interpreter exit, or after a forgotten executor is collected
+
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, thread_name_prefix: str = ''
+    ) -> None:
+        """
+        .. admonition:: Initializer
+
+            Start the ``WorkStealingExecutor``'s worker threads.
+
+        :param max_workers: Number of worker threads, the CPU count if not given.
+        :param thread_name_prefix: Prefix of the worker thread names.
+        :raises ValueError: When ``max_workers`` is not positive.
+
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            workers = max_workers
+            msg = f'WorkStealingExecutor expects positive max_workers, got {workers}'
+            raise ValueError(msg)
+        prefix = thread_name_prefix or f'WorkStealingExecutor-{id(self):x}'
+        self._pool = pool = _Pool(max_workers, prefix)
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        weakref.finalize(self, pool.close)
+        with _live_lock:
+            _live_pools.add(pool)
+        for thread in pool.threads:
+            thread.start()
+
+    def submit[T](
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> Future[T]:
+        """
+        .. admonition:: Submit
+
+            Schedule ``fn(*args, **kwargs)`` to be run by a worker.
+
+        :param fn: Callable to run.
+        :returns: A ``Future`` of its result.
+        :raises RuntimeError: When the executor has been shut down,
+                              unless submitted by one of its workers.
+
+        """
+        pool = self._pool
+        idx = getattr(pool.local, 'idx', None)
+        with self._shutdown_lock:
+            if self._shutdown and idx is None:
+                msg = 'cannot schedule new futures after shutdown'
+                raise RuntimeError(msg)
+        future: Future[T] = Future()
+        item = _WorkItem(future, fn, args, kwargs)
+        if idx is None:
+            pool.inbox.push(item)
+        else:
+            pool.deques[idx].push(item)
+        pool.signal()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        .. admonition:: Shutdown
+
+            Stop accepting tasks from outside the pool, the workers
+            exiting once no work is left. Running tasks may still
+            submit more.
+
+        :param wait: Wait for the workers to finish.
+        :param cancel_futures: Cancel tasks not yet started.
+
+        """
+        with self._shutdown_lock:
+            self._shutdown = True
+        pool = self._pool
+        if cancel_futures:
+            for dq in (pool.inbox, *pool.deques):
+                while items := dq.steal_half():
+                    for item in items:
+                        item.future.cancel()
+        pool.close()
+        if wait:
+            pool.join()
+
+
+class _Pool:
+    # State shared by a WorkStealingExecutor and its worker threads. The
+    # workers only reference the pool, so a forgotten executor can still
+    # be collected, its finalizer then closing the pool.
+
+    __slots__ = (
+        '__weakref__',
+        'closed',
+        'deques',
+        'idle',
+        'inbox',
+        'local',
+        'threads',
+        'wakeup',
+    )
+
+    def __init__(self, workers: int, prefix: str) -> None:
+        self.deques: tuple[WorkStealingDEQueue[_WorkItem], ...] = tuple(
+            WorkStealingDEQueue() for _ in range(workers)
+        )
+        self.inbox: WorkStealingDEQueue[_WorkItem] = WorkStealingDEQueue()
+        self.local = threading.local()
+        self.closed = False
+        self.idle = 0
+        self.wakeup = threading.Condition()
+        self.threads = tuple(
+            threading.Thread(
+                target=self.work, args=(idx,), name=f'{prefix}_{idx}', daemon=True
+            )
+            for idx in range(workers)
+        )
+
+    def signal(self) -> None:
+        # Wake one sleeping worker, if any, to look for work.
+        if self.idle:
+            with self.wakeup:
+                self.wakeup.notify()
+
+    def close(self) -> None:
+        # Workers exit once no work is left.
+        with self.wakeup:
+            self.closed = True
+            self.wakeup.notify_all()
+
+    def join(self) -> None:
+        if threading.current_thread() not in self.threads:
+            for thread in self.threads:
+                thread.join()
+
+    def find(self, idx: int) -> '_WorkItem | NoValue':
+        # Own newest work first, then the inbox's oldest, then the
+        # older half of another worker's.
+        if (item := self.deques[idx].pop_or(_novalue)) is not _novalue:
+            return item
+        if oldest := self.inbox.steal():
+            return oldest.get()
+        workers = len(self.deques)
+        start = random.randrange(workers)
+        for step in range(workers):
+            victim = (start + step) % workers
+            if victim == idx:
+                continue
+            if stolen := self.deques[victim].steal_half():
+                if len(stolen) > 1:
+                    # Leave the rest where other idle workers can steal it.
+                    self.deques[idx].push(*stolen[1:])
+                    self.signal()
+                return stolen[0]
+        return _novalue
+
+    def work(self, idx: int) -> None:
+        self.local.idx = idx
+        while True:
+            if (item := self.find(idx)) is not _novalue:
+                cast(_WorkItem, item).run()
+                continue
+            with self.wakeup:
+                self.idle += 1
+                try:
+                    # Recheck once registered idle, work pushed before
+                    # then is found now, after then a notify follows.
+                    if (item := self.find(idx)) is _novalue:
+                        if self.closed:
+                            return
+                        self.wakeup.wait()
+                finally:
+                    self.idle -= 1
+            if item is not _novalue:
+                cast(_WorkItem, item).run()
+
+
+class _WorkItem:
+    __slots__ = ('args', 'fn', 'future', 'kwargs')
+
+    def __init__(
+        self,
+        future: Future[Any],
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        # As in concurrent.futures, whatever fn raises goes to the future.
+        except BaseException as exc:  # noqa: BLE001
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(result)
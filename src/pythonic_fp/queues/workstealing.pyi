@@ -0,0 +1,27 @@
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+from pythonic_fp.fptools.maybe import MayBe
+
+__all__ = ['WorkStealingDEQueue', 'WorkStealingExecutor']
+
+class WorkStealingDEQueue[D]:
+    def __init__(self) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def snapshot(self) -> tuple[D, ...]: ...
+    def push(self, *ds: D) -> None: ...
+    def pop(self) -> MayBe[D]: ...
+    def pop_or[T](self, default: T) -> D | T: ...
+    def steal(self) -> MayBe[D]: ...
+    def steal_half(self) -> tuple[D, ...]: ...
+
+class WorkStealingExecutor(Executor):
+    def __init__(
+        self, max_workers: int | None = None, thread_name_prefix: str = ''
+    ) -> None: ...
+    def submit[T](
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> Future[T]: ...
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None: ...
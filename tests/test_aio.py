@@ -0,0 +1,136 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from pythonic_fp.queues.aio import AsyncDEQueue as ADE
+from pythonic_fp.queues.aio import AsyncFIFOQueue as AFQ
+from pythonic_fp.queues.aio import AsyncLIFOQueue as ALQ
+from pythonic_fp.fptools.maybe import MayBe
+
+
+class TestAsyncQueues:
+    def test_nowait(self) -> None:
+        afq: AFQ[int] = AFQ([1, 2])
+        assert afq.push_nowait(3)
+        assert afq.pop_nowait() == MayBe(1)
+        assert afq.peak_next_out() == MayBe(2)
+        assert afq.peak_last_in() == MayBe(3)
+        assert afq.fold(lambda x, y: x + y) == MayBe(5)
+        assert afq.snapshot() == (2, 3)
+
+        alq: ALQ[int] = ALQ([1, 2, 3], maxsize=3)
+        assert not alq.push_nowait(4)
+        assert alq.pop_nowait() == MayBe(3)
+        assert alq.push_nowait(4)
+        assert alq.fold(lambda s, d: s + str(d), '') == MayBe('421')
+        assert alq.fold(lambda s, d: s - d) == MayBe(1)
+
+        ade: ADE[int] = ADE()
+        assert ade.pushl_nowait(2, 1)
+        assert ade.pushr_nowait(3)
+        assert ade.snapshot() == (1, 2, 3)
+        assert ade.popr_nowait() == MayBe(3)
+        assert ade.popl_nowait() == MayBe(1)
+        assert ade.popl_nowait() == MayBe(2)
+        assert ade.popr_nowait() == MayBe()
+
+    def test_awaitable_pop(self) -> None:
+        async def run() -> None:
+            afq: AFQ[int] = AFQ()
+            assert await afq.pop(timeout=0.01) == MayBe()
+
+            async def producer() -> None:
+                await asyncio.sleep(0.01)
+                await afq.push(1, 2)
+
+            task = asyncio.create_task(producer())
+            assert await afq.pop(timeout=5.0) == MayBe(1)
+            assert await afq.pop() == MayBe(2)
+            await task
+
+            ade: ADE[str] = ADE()
+            getters = [asyncio.create_task(ade.popr()) for _ in range(3)]
+            await asyncio.sleep(0)
+            getters[1].cancel()
+            ade.pushr_nowait('a', 'b')
+            assert await getters[0] == MayBe('b')
+            assert await getters[2] == MayBe('a')
+            assert getters[1].cancelled()
+
+        asyncio.run(run())
+
+    def test_bounded_push(self) -> None:
+        async def run() -> None:
+            alq: ALQ[int] = ALQ(maxsize=2)
+            assert await alq.push(1, 2)
+            assert not await alq.push(3, timeout=0.01)
+
+            async def consumer() -> None:
+                await asyncio.sleep(0.01)
+                alq.pop_nowait()
+
+            task = asyncio.create_task(consumer())
+            assert await alq.push(3, timeout=5.0)
+            await task
+            assert alq.snapshot() == (3, 1)
+            try:
+                await alq.push(1, 2, 3)
+                assert False
+            except ValueError:
+                assert len(alq) == 2
+
+        asyncio.run(run())
+
+    def test_async_for_and_shutdown(self) -> None:
+        async def run() -> None:
+            afq: AFQ[int] = AFQ(maxsize=4)
+            received: list[int] = []
+
+            async def consumer() -> None:
+                async for item in afq:
+                    received.append(item)
+
+            consumers = [asyncio.create_task(consumer()) for _ in range(3)]
+            for ii in range(100):
+                await afq.push(ii)
+            afq.shutdown()
+            await asyncio.gather(*consumers)
+            assert sorted(received) == list(range(100))
+            assert afq.shut_down
+            try:
+                afq.push_nowait(42)
+                assert False
+            except asyncio.QueueShutDown:
+                assert not afq
+
+        asyncio.run(run())
+
+    def test_mixed_size_blocked_pushers(self) -> None:
+        async def run() -> None:
+            afq: AFQ[int] = AFQ(range(4), maxsize=4)
+            big = asyncio.create_task(afq.push(10, 11, 12, timeout=5.0))
+            await asyncio.sleep(0)
+            small = asyncio.create_task(afq.push(20, timeout=5.0))
+            await asyncio.sleep(0)
+            # Room for one item, only the small pusher fits.
+            for _ in range(3):
+                assert afq.pop_nowait()
+                await asyncio.sleep(0)
+                assert not big.done()
+            assert small.done() and small.result()
+            assert afq.pop_nowait() == MayBe(3)
+            assert await big
+            assert afq.snapshot() == (20, 10, 11, 12)
+
+        asyncio.run(run())
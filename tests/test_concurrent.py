@@ -0,0 +1,200 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from pythonic_fp.queues.concurrent import ConcurrentDEQueue as CDE
+from pythonic_fp.queues.concurrent import ConcurrentFIFOQueue as CFQ
+from pythonic_fp.queues.concurrent import ConcurrentLIFOQueue as CLQ
+from pythonic_fp.queues.done import Done
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
+
+
+class TestConcurrentQueues:
+    def test_same_api(self) -> None:
+        cfq: CFQ[int] = CFQ([1, 2, 3])
+        cfq.push(4)
+        assert len(cfq) == 4
+        assert cfq.pop() == MayBe(1)
+        assert cfq.peak_next_out() == MayBe(2)
+        assert cfq.peak_last_in() == MayBe(4)
+        assert cfq.fold(lambda x, y: x + y) == MayBe(9)
+        assert cfq.map(lambda x: x * 10) == CFQ([20, 30, 40])
+        assert list(cfq) == [2, 3, 4]
+        assert cfq.pop_many() == (2, 3, 4)
+        assert cfq.pop() == MayBe()
+        assert not cfq
+
+        clq: CLQ[int] = CLQ([1, 2, 3])
+        assert clq.pop() == MayBe(3)
+        assert clq.peak() == MayBe(2)
+        assert clq.fold(lambda s, d: s + str(d), '') == MayBe('21')
+        assert clq.copy() == clq
+        assert repr(clq) == 'ConcurrentLIFOQueue(1, 2)'
+
+        cde: CDE[int] = CDE()
+        cde.pushl(1)
+        cde.pushr(2)
+        cde.extendl([0, -1])
+        assert cde.snapshot() == (-1, 0, 1, 2)
+        assert list(reversed(cde)) == [2, 1, 0, -1]
+        assert cde.popl() == MayBe(-1)
+        assert cde.popr() == MayBe(2)
+        assert cde.foldr(lambda d, acc: acc + d, 0) == MayBe(1)
+
+    def test_core_api_parity(self) -> None:
+        def capped_sum(acc: int, d: int) -> int | Done[int]:
+            return Done(acc) if acc + d > 5 else acc + d
+
+        cfq: CFQ[int] = CFQ()
+        assert cfq.extend(range(1, 6))
+        assert cfq.peak_next_out_or(0) == 1 and cfq.peak_last_in_or(0) == 5
+        assert cfq.fold_until(capped_sum, 0) == MayBe(3)
+        assert cfq.find(lambda d: d > 2) == MayBe(3)
+        assert cfq.any(lambda d: d > 4) and not cfq.all(lambda d: d > 4)
+        assert cfq.count(lambda d: d % 2 == 1) == 3
+        assert cfq.index_of(4) == MayBe(3) and cfq.index_of(9) == MayBe()
+        assert cfq.remove_if(lambda d: d == 3) == 1
+        assert cfq.retain(lambda d: d < 5) == 1
+        assert cfq.pop_or(-1) == 1 and cfq.try_pop() == 2
+        assert cfq.pop_or(-1) == 4 and cfq.pop_or(-1) == -1
+        assert cfq.try_pop() is NoValue() and cfq.peak_next_out_or(0) == 0
+
+        clq: CLQ[int] = CLQ([1, 2, 3], maxsize=3)
+        assert clq.extend([]) and clq.peak_or(0) == 3
+        assert clq.fold_until(capped_sum) == MayBe(5)
+        assert clq.index_of(3) == MayBe(0)
+        assert clq.pop_or(-1) == 3 and clq.try_pop() == 2
+
+        cde: CDE[int] = CDE([1, 2, 3, 4])
+        assert cde.extendl([0]) and cde.extendr([5])
+        assert cde.peakl_or(-1) == 0 and cde.peakr_or(-1) == 5
+        assert cde.foldl_until(capped_sum, 0) == MayBe(3)
+        assert cde.foldr_until(lambda d, acc: capped_sum(acc, d), 0) == MayBe(5)
+        assert cde.popl_or(-1) == 0 and cde.popr_or(-1) == 5
+        assert cde.try_popl() == 1 and cde.try_popr() == 4
+        assert cde.retain(lambda d: d > 2) == 1 and cde.snapshot() == (3,)
+
+    def test_retain_wakes_pushers(self) -> None:
+        cfq: CFQ[int] = CFQ(range(4), maxsize=4)
+
+        def filterer() -> None:
+            time.sleep(0.02)
+            cfq.remove_if(lambda d: d % 2 == 0)
+
+        thread = threading.Thread(target=filterer)
+        thread.start()
+        assert cfq.push(8, 9, timeout=5.0)
+        thread.join()
+        assert cfq.snapshot() == (1, 3, 8, 9)
+        assert cfq.pop_or(-1, block=True, timeout=0.01) == 1
+
+    def test_blocking_pop(self) -> None:
+        cfq: CFQ[int] = CFQ()
+        start = time.monotonic()
+        assert cfq.pop(block=True, timeout=0.05) == MayBe()
+        assert time.monotonic() - start >= 0.04
+
+        def producer() -> None:
+            time.sleep(0.02)
+            cfq.push(42)
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        assert cfq.pop(block=True, timeout=5.0) == MayBe(42)
+        thread.join()
+
+    def test_bounded_push(self) -> None:
+        cde: CDE[int] = CDE(maxsize=2)
+        assert cde.pushr(1, 2)
+        assert not cde.pushr(3, block=False)
+        assert not cde.pushr(3, timeout=0.01)
+        try:
+            cde.pushr(1, 2, 3)
+            assert False
+        except ValueError:
+            assert len(cde) == 2
+
+        def consumer() -> None:
+            time.sleep(0.02)
+            cde.popl()
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        assert cde.pushr(3, timeout=5.0)
+        thread.join()
+        assert cde.snapshot() == (2, 3)
+
+    def test_producers_consumers(self) -> None:
+        clq: CLQ[int] = CLQ(maxsize=8)
+        results: list[int] = []
+        results_lock = threading.Lock()
+        num_producers, per_producer = 4, 500
+
+        def producer(base: int) -> None:
+            for ii in range(per_producer):
+                clq.push(base + ii)
+
+        def consumer() -> None:
+            while True:
+                batch = clq.pop_many(4, block=True, timeout=0.5)
+                if not batch:
+                    return
+                with results_lock:
+                    results.extend(batch)
+
+        producers = [
+            threading.Thread(target=producer, args=(n * per_producer,))
+            for n in range(num_producers)
+        ]
+        consumers = [threading.Thread(target=consumer) for _ in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers + consumers:
+            thread.join()
+
+        assert sorted(results) == list(range(num_producers * per_producer))
+        assert not clq
+
+    def test_mixed_size_blocked_pushers(self) -> None:
+        cfq: CFQ[int] = CFQ(range(4), maxsize=4)
+        pushed: dict[str, bool] = {}
+
+        def pusher(name: str, *ds: int) -> None:
+            pushed[name] = cfq.push(*ds, timeout=5.0)
+
+        big = threading.Thread(target=pusher, args=('big', 10, 11, 12))
+        big.start()
+        time.sleep(0.05)
+        small = threading.Thread(target=pusher, args=('small', 20))
+        small.start()
+        time.sleep(0.05)
+        # Room for one item, only the small pusher fits.
+        assert cfq.pop() == MayBe(0)
+        small.join(timeout=2.0)
+        assert pushed == {'small': True}
+        assert cfq.pop_many(3) == (1, 2, 3)
+        big.join()
+        assert pushed['big']
+        assert cfq.snapshot() == (20, 10, 11, 12)
+
+    def test_initial_items_exceed_maxsize(self) -> None:
+        try:
+            CDE(range(3), maxsize=2)
+        except ValueError:
+            pass
+        else:
+            assert False
+        assert len(CDE(range(2), maxsize=2)) == 2
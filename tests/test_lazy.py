@@ -0,0 +1,58 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pythonic_fp.queues.de import de_queue as de
+from pythonic_fp.queues.fifo import FIFOQueue as FQ
+from pythonic_fp.queues.fifo import fifo_queue as fq
+from pythonic_fp.queues.lifo import lifo_queue as lq
+from pythonic_fp.fptools.maybe import MayBe
+
+
+class TestLazyView:
+    def test_fused_pipeline(self) -> None:
+        seen: list[int] = []
+
+        def square(x: int) -> int:
+            seen.append(x)
+            return x * x
+
+        fq1: FQ[int] = FQ(range(100))
+        view = fq1.lazy().map(square).filter(lambda x: x % 2 == 0).take(3)
+        assert seen == []
+        assert view.fold(lambda acc, x: acc + x, 0) == MayBe(0 + 4 + 16)
+        assert seen == [0, 1, 2, 3, 4]
+        assert view.to_tuple() == (0, 4, 16)
+        assert list(view) == [0, 4, 16]
+        assert view.to_fifo() == fq(0, 4, 16)
+        assert len(fq1) == 100
+
+        assert fq1.lazy().drop(98).map(str).fold(lambda a, b: a + b) == MayBe('9899')
+        assert fq1.lazy().filter(lambda x: x < 0).fold(lambda a, b: a + b) == MayBe()
+
+    def test_natural_order(self) -> None:
+        lq1 = lq(1, 2, 3)
+        assert lq1.lazy().to_tuple() == (3, 2, 1)
+        assert lq1.lazy().to_lifo() == lq(3, 2, 1)
+        assert lq1.lazy().map(lambda x: -x).to_de() == de(-3, -2, -1)
+
+        de1 = de(1, 2, 3)
+        view = de1.lazy().take(2)
+        de1.pushl(0)
+        assert view.to_tuple() == (0, 1)
+        try:
+            for _ in de1.lazy():
+                de1.popr()
+            assert False
+        except RuntimeError:
+            assert len(de1) == 3
@@ -0,0 +1,128 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.metrics import (
+    InstrumentedDEQueue,
+    InstrumentedFIFOQueue,
+    LatencyHistogram,
+)
+from pythonic_fp.queues.overflow import Overflow
+
+
+class TestLatencyHistogram:
+    def test_buckets(self) -> None:
+        hist = LatencyHistogram((1.0, 0.1))
+        assert hist.bounds == (0.1, 1.0) and hist.count == 0
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(seconds)
+        stats = hist.snapshot()
+        assert stats['buckets'] == {0.1: 2, 1.0: 3, float('inf'): 4}
+        assert stats['count'] == hist.count == 4
+        assert abs(stats['sum'] - 2.65) < 1e-9
+        hist.reset()
+        assert hist.count == 0 and hist.sum == 0.0
+
+    def test_bad_bounds(self) -> None:
+        for bounds in ((), (0.0, 1.0), (1.0, 1.0)):
+            try:
+                LatencyHistogram(bounds)
+            except ValueError:
+                pass
+            else:
+                assert False
+
+
+class TestInstrumentedFIFOQueue:
+    def test_counts(self) -> None:
+        iq: InstrumentedFIFOQueue[int] = InstrumentedFIFOQueue()
+        assert not iq and iq.metrics.latency is None
+        iq.push(1, 2, 3)
+        iq.extend(x for x in range(4, 101))
+        assert len(iq) == 100 and iq.snapshot()[:3] == (1, 2, 3)
+        assert iq.pop() == MayBe(1) and iq.pop_or(-1) == 2
+        assert len(iq.pop_many(48)) == 48
+        metrics = iq.metrics
+        assert metrics.pushes == 100 and metrics.pops == 50
+        assert metrics.peak_length == 100 and metrics.dropped == 0
+        assert metrics.resizes > 0
+        stats = metrics.snapshot()
+        assert stats['length'] == 50 and stats['capacity'] == iq.queue.capacity
+        assert 'latency' not in stats
+        metrics.reset()
+        assert metrics.pushes == metrics.pops == 0 and metrics.peak_length == 50
+
+    def test_bounded_drops(self) -> None:
+        queue: FIFOQueue[int] = FIFOQueue(maxlen=4, overflow=Overflow.DROP_OLDEST)
+        assert queue.overflow is Overflow.DROP_OLDEST
+        iq = InstrumentedFIFOQueue(queue, latency=LatencyHistogram())
+        iq.push(*range(6))
+        iq.extend(range(6, 8))
+        assert iq.snapshot() == (4, 5, 6, 7)
+        assert iq.metrics.dropped == 4 and iq.metrics.resizes == 0
+        assert iq.pop_many() == (4, 5, 6, 7)
+        latency = iq.metrics.latency
+        assert latency is not None and latency.count == 4
+
+    def test_latency(self) -> None:
+        iq = InstrumentedFIFOQueue(FIFOQueue([1, 2]), latency=LatencyHistogram())
+        iq.push(3)
+        assert iq.try_pop() == 1
+        assert iq.pop_many() == (2, 3)
+        stats: dict[str, Any] = iq.metrics.snapshot()['latency']
+        assert stats['count'] == 3 and stats['buckets'][float('inf')] == 3
+        assert stats['sum'] >= 0.0
+
+    def test_callbacks(self) -> None:
+        iq: InstrumentedFIFOQueue[str] = InstrumentedFIFOQueue()
+        seen: list[dict[str, Any]] = []
+        iq.metrics.add_callback(seen.append)
+        iq.push('a')
+        assert iq.metrics.publish() == seen[0] and seen[0]['pushes'] == 1
+        iq.metrics.remove_callback(seen.append)
+        iq.metrics.publish()
+        assert len(seen) == 1
+
+
+class TestInstrumentedDEQueue:
+    def test_both_ends(self) -> None:
+        iq = InstrumentedDEQueue(DEQueue[int](), latency=LatencyHistogram())
+        iq.pushr(1, 2, 3)
+        iq.pushl(0)
+        iq.extendr([4, 5])
+        iq.extendl(x for x in (-1,))
+        assert iq.snapshot() == (-1, 0, 1, 2, 3, 4, 5)
+        assert iq.popl() == MayBe(-1) and iq.popr() == MayBe(5)
+        assert iq.popl_or(None) == 0 and iq.popr_or(None) == 4
+        assert iq.popl_many(1) == (1,) and iq.popr_many() == (3, 2)
+        assert iq.popr() == MayBe() and iq.popl_many() == ()
+        metrics = iq.metrics
+        assert metrics.pushes == metrics.pops == 7
+        assert metrics.peak_length == 7
+        latency = metrics.latency
+        assert latency is not None and latency.count == 7
+
+    def test_bounded_drops(self) -> None:
+        queue: DEQueue[int] = DEQueue(maxlen=3, overflow=Overflow.DROP_NEWEST)
+        iq = InstrumentedDEQueue(queue, latency=LatencyHistogram())
+        assert not iq.pushr(1, 2, 3, 4)
+        assert not iq.pushl(0)
+        assert iq.snapshot() == (1, 2, 3)
+        assert iq.metrics.dropped == 2
+        assert iq.popr_many() == (3, 2, 1)
+        latency = iq.metrics.latency
+        assert latency is not None and latency.count == 3
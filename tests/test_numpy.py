@@ -0,0 +1,80 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+
+
+class TestNumPyInterop:
+    def test_object_queues(self) -> None:
+        fq: FIFOQueue[int] = FIFOQueue(maxlen=4)
+        assert fq.extend_from_array(np.arange(3))
+        assert fq.extend_from_array(np.arange(3, 6))
+        assert fq.snapshot() == (2, 3, 4, 5)
+        assert all(type(d) is int for d in fq)
+        assert np.array_equal(fq.to_numpy(), [2, 3, 4, 5])
+        out = fq.drain_to_array(3, dtype=np.float64)
+        assert out.dtype == np.float64 and out.tolist() == [2.0, 3.0, 4.0]
+        assert fq.snapshot() == (5,)
+
+        lq: LIFOQueue[int] = LIFOQueue(range(5))
+        assert lq.to_numpy().tolist() == [4, 3, 2, 1, 0]
+        assert lq.drain_to_array(2).tolist() == [4, 3]
+        assert lq.drain_to_array().tolist() == [2, 1, 0]
+        assert not lq
+
+        dq: DEQueue[object] = DEQueue([1, 'two', 3])
+        try:
+            dq.drain_to_array(dtype=np.int64)
+            assert False
+        except ValueError:
+            assert len(dq) == 3
+        try:
+            dq.extend_from_array(np.zeros((2, 2)))
+            assert False
+        except ValueError:
+            assert len(dq) == 3
+
+    def test_typed_queues(self) -> None:
+        tq = FIFOQueue.typed('q')
+        tq.reserve(8)
+        tq.extend_from_array(np.arange(6))
+        assert tq.drain_to_array(5).tolist() == [0, 1, 2, 3, 4]
+        tq.extend_from_array(np.arange(6, 12))
+        assert tq.capacity == 8 and tq.segments()[1].nbytes > 0
+        out = tq.to_numpy()
+        assert out.dtype == np.int64 and out.tolist() == list(range(5, 12))
+        assert np.frombuffer(tq, dtype=np.int64).tolist() == list(range(5, 12))
+        try:
+            tq.extend_from_array(np.ones(2))
+            assert False
+        except TypeError:
+            assert len(tq) == 7
+        assert tq.drain_to_array(dtype=np.float32).dtype == np.float32
+        assert not tq
+        assert tq.drain_to_array().tolist() == []
+
+        tl = LIFOQueue.typed('d', [1.0, 2.0, 3.0])
+        assert tl.to_numpy().tolist() == [3.0, 2.0, 1.0]
+        assert tl.drain_to_array(2).tolist() == [3.0, 2.0]
+
+        td = DEQueue.typed('i', [1, 2, 3])
+        td.extend_from_array(np.array([4, 5], dtype=np.int16))
+        assert td.drain_to_array(2).tolist() == [1, 2]
+        assert td.snapshot() == (3, 4, 5)
@@ -0,0 +1,166 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+from pathlib import Path
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.persistent import Fsync, PersistentFIFOQueue
+
+
+class TestPersistent:
+    def test_push_pop(self, tmp_path: Path) -> None:
+        with PersistentFIFOQueue[int](tmp_path, segment_size=4096, cache=4) as pq:
+            assert not pq
+            assert pq.pop() == MayBe()
+            assert pq.pop_or(-1) == -1
+            assert pq.peak_next_out() == MayBe()
+            assert pq.peak_last_in() == MayBe()
+            pq.push(*range(2000))
+            assert len(pq) == 2000
+            assert len(list(tmp_path.glob('*.seg'))) > 1
+            assert pq.peak_next_out() == MayBe(0)
+            assert pq.peak_last_in() == MayBe(1999)
+            assert [pq.pop_or(-1) for _ in range(500)] == list(range(500))
+            assert pq.snapshot() == tuple(range(500, 2000))
+            assert pq.fold(lambda acc, d: acc + d, 0) == MayBe(sum(range(500, 2000)))
+            assert pq.fold(max) == MayBe(1999)
+        assert pq.closed
+
+    def test_reopen(self, tmp_path: Path) -> None:
+        with PersistentFIFOQueue[str](tmp_path, segment_size=4096) as pq:
+            pq.push(*(str(n) for n in range(1000)))
+            for _ in range(600):
+                pq.pop()
+        with PersistentFIFOQueue[str](tmp_path, segment_size=4096) as pq:
+            assert len(pq) == 400
+            assert pq.peak_next_out() == MayBe('600')
+            assert pq.peak_last_in() == MayBe('999')
+            assert pq.snapshot() == tuple(str(n) for n in range(600, 1000))
+            pq.push('tail')
+        with PersistentFIFOQueue[str](tmp_path, segment_size=4096) as pq:
+            assert len(pq) == 401
+            assert pq.peak_last_in() == MayBe('tail')
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        with PersistentFIFOQueue[int](tmp_path, segment_size=4096) as pq:
+            pq.push(*range(2000))
+            segments = len(list(tmp_path.glob('*.seg')))
+            while pq:
+                pq.pop()
+            pq.sync()
+            assert len(list(tmp_path.glob('*.seg'))) == 1 < segments
+            pq.push(42)
+        with PersistentFIFOQueue[int](tmp_path, segment_size=4096) as pq:
+            assert pq.snapshot() == (42,)
+
+    def test_large_items(self, tmp_path: Path) -> None:
+        blob = bytes(range(256)) * 100
+        with PersistentFIFOQueue[bytes](tmp_path, segment_size=4096) as pq:
+            pq.push(b'small', blob, b'after')
+        with PersistentFIFOQueue[bytes](tmp_path, segment_size=4096) as pq:
+            assert pq.snapshot() == (b'small', blob, b'after')
+
+    def test_maps_bounded(self, tmp_path: Path) -> None:
+        blob = bytes(3000)
+        with PersistentFIFOQueue[bytes](
+            tmp_path, segment_size=4096, fsync=Fsync.NEVER
+        ) as pq:
+            for _ in range(500):
+                pq.push(blob)
+                assert len(pq._maps) <= 2
+            assert len(pq.snapshot()) == 500 and len(pq._maps) <= 2
+            for _ in range(250):
+                pq.pop()
+                assert len(pq._maps) <= 3
+        with PersistentFIFOQueue[bytes](tmp_path, segment_size=4096) as pq:
+            assert len(pq) == 250 and len(pq._maps) <= 2
+            pq.push(b'last')
+            assert pq.peak_last_in() == MayBe(b'last')
+
+    def test_empty_payloads(self, tmp_path: Path) -> None:
+        def dumps(d: str) -> bytes:
+            return d.encode()
+
+        def loads(b: bytes) -> str:
+            return b.decode()
+
+        with PersistentFIFOQueue[str](tmp_path, dumps=dumps, loads=loads) as pq:
+            pq.push('a', '', 'b', 'c')
+            assert pq.snapshot() == ('a', '', 'b', 'c')
+            assert pq.pop() == MayBe('a') and pq.pop() == MayBe('')
+        with PersistentFIFOQueue[str](tmp_path, dumps=dumps, loads=loads) as pq:
+            assert pq.snapshot() == ('b', 'c')
+
+    def test_at_least_once(self, tmp_path: Path) -> None:
+        pq = PersistentFIFOQueue[int](tmp_path, fsync=Fsync.BATCH, batch=100)
+        pq.push(*range(10))
+        pq.sync()
+        for _ in range(5):
+            pq.pop()
+        pq._head_map.close()  # abandon without committing, as a crash would
+        with PersistentFIFOQueue[int](tmp_path) as pq:
+            assert pq.snapshot() == tuple(range(10))
+
+        pq = PersistentFIFOQueue[int](tmp_path, fsync=Fsync.ALWAYS)
+        for _ in range(5):
+            pq.pop()
+        pq._head_map.close()
+        with PersistentFIFOQueue[int](tmp_path) as pq:
+            assert pq.snapshot() == tuple(range(5, 10))
+
+    def test_torn_write(self, tmp_path: Path) -> None:
+        with PersistentFIFOQueue[str](tmp_path) as pq:
+            pq.push('a', 'b', 'c')
+        segment = next(tmp_path.glob('*.seg'))
+        data = bytearray(segment.read_bytes())
+        off = 0
+        for _ in range(2):
+            off += 8 + struct.unpack_from('<I', data, off)[0] - 1
+        data[off + 9] ^= 0xFF
+        segment.write_bytes(data)
+        with PersistentFIFOQueue[str](tmp_path) as pq:
+            assert pq.snapshot() == ('a', 'b')
+            assert pq.peak_last_in() == MayBe('b')
+            pq.push('d')
+        with PersistentFIFOQueue[str](tmp_path) as pq:
+            assert pq.snapshot() == ('a', 'b', 'd')
+
+    def test_mutation_during_iteration(self, tmp_path: Path) -> None:
+        with PersistentFIFOQueue[int](tmp_path) as pq:
+            pq.push(1, 2, 3)
+            try:
+                for d in pq:
+                    pq.push(d)
+            except RuntimeError:
+                pass
+            else:
+                assert False
+
+    def test_bad_arguments(self, tmp_path: Path) -> None:
+        for kwargs in ({'segment_size': 100}, {'batch': 0}, {'cache': 0}):
+            try:
+                PersistentFIFOQueue[int](tmp_path, **kwargs)
+            except ValueError:
+                pass
+            else:
+                assert False
+        pq = PersistentFIFOQueue[int](tmp_path)
+        pq.close()
+        pq.close()
+        try:
+            pq.push(1)
+        except ValueError:
+            pass
+        else:
+            assert False
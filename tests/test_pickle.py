@@ -0,0 +1,138 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+from pythonic_fp.queues.overflow import Overflow
+from pythonic_fp.queues.typed import TypedDEQueue, TypedFIFOQueue, TypedLIFOQueue
+
+
+class TestPickle:
+    def test_core_queues(self) -> None:
+        fq: FIFOQueue[int] = FIFOQueue(range(6), maxlen=8, overflow=Overflow.REJECT)
+        fq.pop()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            fq2 = pickle.loads(pickle.dumps(fq, protocol=protocol))
+            assert fq2 == fq
+            assert fq2.maxlen == 8 and fq2.capacity == 8
+            assert fq2.push(6, 7, 8, 9) is False
+            assert fq2.snapshot() == (1, 2, 3, 4, 5)
+
+        lq: LIFOQueue[str] = LIFOQueue('abc', growth=3.0, shrink=0.25)
+        lq2 = pickle.loads(pickle.dumps(lq))
+        assert lq2 == lq and lq2.pop().get() == 'c'
+
+        dq: DEQueue[list[int]] = DEQueue([[1], [2]])
+        dq.pushl([0])
+        assert pickle.loads(pickle.dumps(dq)) == dq
+        dq2 = copy.copy(dq)
+        dq2.pushr([3])
+        assert len(dq) == 3 and dq2.peakl().get() is dq.peakl().get()
+        dq3 = copy.deepcopy(dq)
+        assert dq3 == dq and dq3.peakl().get() is not dq.peakl().get()
+
+        assert pickle.loads(pickle.dumps(FIFOQueue())) == FIFOQueue()
+
+    def test_legacy_pickles(self) -> None:
+        # Pickled by release 5.1.4, which pickled the __slots__ by default.
+        fq_514 = (
+            b'\x80\x04\x95\xdc\x00\x00\x00\x00\x00\x00\x00\x8c\x17pythonic_fp'
+            b'.queues.fifo\x94\x8c\tFIFOQueue\x94\x93\x94)\x81\x94N}\x94\x8c'
+            b'\x03_ca\x94\x8c\x1epythonic_fp.circulararray.auto\x94\x8c\x02CA'
+            b'\x94\x93\x94)\x81\x94N}\x94(\x8c\x03_xs\x94]\x94(\x8c%pythonic_'
+            b'fp.gadgets.sentinels.novalue\x94\x8c\x07NoValue\x94\x93\x94)'
+            b'\x81\x94h\x10K\x02K\x03K\x04e\x8c\x04_cnt\x94K\x03\x8c\x04_cap'
+            b'\x94K\x05\x8c\x06_front\x94K\x02\x8c\x05_rear\x94K\x04u\x86\x94'
+            b'bs\x86\x94b.'
+        )
+        lq_514 = (
+            b'\x80\x04\x95\xdc\x00\x00\x00\x00\x00\x00\x00\x8c\x17pythonic_fp'
+            b'.queues.lifo\x94\x8c\tLIFOQueue\x94\x93\x94)\x81\x94N}\x94\x8c'
+            b'\x03_ca\x94\x8c\x1epythonic_fp.circulararray.auto\x94\x8c\x02CA'
+            b'\x94\x93\x94)\x81\x94N}\x94(\x8c\x03_xs\x94]\x94(\x8c%pythonic_'
+            b'fp.gadgets.sentinels.novalue\x94\x8c\x07NoValue\x94\x93\x94)'
+            b'\x81\x94K\x01K\x02K\x03h\x10e\x8c\x04_cnt\x94K\x03\x8c\x04_cap'
+            b'\x94K\x05\x8c\x06_front\x94K\x01\x8c\x05_rear\x94K\x03u\x86\x94'
+            b'bs\x86\x94b.'
+        )
+        dq_514 = (
+            b'\x80\x04\x95\xd8\x00\x00\x00\x00\x00\x00\x00\x8c\x15pythonic_fp'
+            b'.queues.de\x94\x8c\x07DEQueue\x94\x93\x94)\x81\x94N}\x94\x8c'
+            b'\x03_ca\x94\x8c\x1epythonic_fp.circulararray.auto\x94\x8c\x02CA'
+            b'\x94\x93\x94)\x81\x94N}\x94(\x8c\x03_xs\x94]\x94(K\x00K\x01K'
+            b'\x02K\x03\x8c%pythonic_fp.gadgets.sentinels.novalue\x94\x8c\x07'
+            b'NoValue\x94\x93\x94)\x81\x94e\x8c\x04_cnt\x94K\x04\x8c\x04_cap'
+            b'\x94K\x05\x8c\x06_front\x94K\x00\x8c\x05_rear\x94K\x03u\x86\x94'
+            b'bs\x86\x94b.'
+        )
+        fq = pickle.loads(fq_514)
+        assert fq == FIFOQueue([2, 3, 4]) and fq.maxlen is None
+        assert fq.push(5) and fq.pop().get() == 2
+        lq = pickle.loads(lq_514)
+        assert lq == LIFOQueue([1, 2, 3]) and lq.pop().get() == 3
+        dq = pickle.loads(dq_514)
+        assert dq == DEQueue([0, 1, 2, 3]) and dq.overflow is Overflow.DROP_OLDEST
+        dq.pushl(-1)
+        assert dq.snapshot() == (-1, 0, 1, 2, 3)
+
+    def test_core_checkpoints(self) -> None:
+        fq: FIFOQueue[int] = FIFOQueue(range(5), maxlen=10)
+        data = fq.to_bytes()
+        assert data[:4] == b'PFQ\x01'
+        fq2 = FIFOQueue.from_bytes(data)
+        assert fq2 == fq and fq2.maxlen == 10
+        assert LIFOQueue.from_bytes(LIFOQueue([1, 2]).to_bytes()).peak().get() == 2
+        assert DEQueue.from_bytes(bytearray(DEQueue('ab').to_bytes())) == DEQueue('ab')
+        for bad in (b'', b'junk', data[:4] + b'L' + data[5:], b'PFQ\x09F' + data[5:]):
+            try:
+                FIFOQueue.from_bytes(bad)
+                assert False
+            except ValueError:
+                assert True
+
+    def test_typed_queues(self) -> None:
+        tq = TypedDEQueue('d', [1.5, 2.5])
+        tq.pushl(0.5)
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(tq, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1 and len(data) < 100
+        assert buffers[0].raw().nbytes == 24
+        tq2 = pickle.loads(data, buffers=buffers)
+        assert tq2 == tq and type(tq2) is TypedDEQueue and tq2.typecode == 'd'
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(tq, protocol=protocol)) == tq
+        tl: TypedLIFOQueue[int] = TypedLIFOQueue('q', range(3))
+        assert pickle.loads(pickle.dumps(tl)).peak().get() == 2
+
+    def test_typed_checkpoints(self) -> None:
+        tq: TypedFIFOQueue[int] = TypedFIFOQueue('h', [1, -2, 3])
+        data = tq.to_bytes()
+        assert len(data) == 5 + 2 + 3 * 2
+        assert TypedFIFOQueue.from_bytes(data) == tq
+        swapped = bytearray(data)
+        swapped[6:7] = b'>' if swapped[6:7] == b'<' else b'<'
+        for ii in range(7, len(swapped), 2):
+            swapped[ii], swapped[ii + 1] = swapped[ii + 1], swapped[ii]
+        assert TypedFIFOQueue.from_bytes(swapped) == tq
+        for bad in (data[:-1], data[:5] + b'u<', data):
+            try:
+                TypedLIFOQueue.from_bytes(
+                    bad
+                ) if bad is data else TypedFIFOQueue.from_bytes(bad)
+                assert False
+            except ValueError:
+                assert True
@@ -0,0 +1,85 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from pythonic_fp.queues.priority import PriorityQueue as PQ
+from pythonic_fp.queues.priority import priority_queue as pq
+from pythonic_fp.fptools.maybe import MayBe
+
+
+class TestPriorityQueue:
+    def test_push_pop(self) -> None:
+        data = list(range(200))
+        random.shuffle(data)
+        pq1: PQ[int] = PQ(data[:100])
+        pq1.push(*data[100:])
+        assert len(pq1) == 200
+        assert pq1.peak() == MayBe(0)
+        assert [pq1.pop().get() for _ in range(200)] == list(range(200))
+        assert pq1.pop() == MayBe()
+        assert pq1.peak() == MayBe()
+        assert not pq1
+
+    def test_key_and_stability(self) -> None:
+        tasks = [(2, 'b1'), (1, 'a1'), (2, 'b2'), (0, 'z'), (1, 'a2'), (2, 'b3')]
+        pq1: PQ[tuple[int, str]] = PQ(tasks, key=lambda t: t[0])
+        pq1.push((1, 'a3'))
+        assert [t[1] for t in pq1] == ['z', 'a1', 'a2', 'a3', 'b1', 'b2', 'b3']
+        assert repr(pq(3, 1, 2)) == 'PriorityQueue(1, 2, 3)'
+        assert str(pq(2, 1)) == '<( 1 < 2 )<'
+
+        pq2: PQ[str] = pq('ccc', 'a', 'bb', 'dd', key=len)
+        assert pq2.fold(lambda s, w: s + w) == MayBe('abbddccc')
+        assert pq2.fold(lambda n, w: n + len(w), 0) == MayBe(8)
+        assert PQ[int]().fold(lambda x, y: x + y) == MayBe()
+
+    def test_reprioritize(self) -> None:
+        pq1: PQ[str] = PQ()
+        pq1.push('m', 'q')
+        ha = pq1.push_with_handle('a')
+        hz = pq1.push_with_handle('z')
+        assert pq1.snapshot() == ('a', 'm', 'q', 'z')
+        assert pq1.reprioritize(hz, '0')
+        assert pq1.reprioritize(ha, '~')
+        assert len(pq1) == 4
+        assert pq1.snapshot() == ('z', 'm', 'q', 'a')
+        for ii in range(10):
+            assert pq1.reprioritize(hz, str(ii))
+        assert len(pq1) == 4
+        assert pq1.pop() == MayBe('z')
+        assert not hz
+        assert not pq1.reprioritize(hz, '0')
+        assert ha
+        try:
+            PQ[str]().reprioritize(ha, 'a')
+            assert False
+        except ValueError:
+            assert pq1.snapshot() == ('m', 'q', 'a')
+
+    def test_copy_map_eq(self) -> None:
+        pq1: PQ[int] = PQ(range(10), key=lambda x: -x)
+        handle = pq1.push_with_handle(5)
+        pq1.reprioritize(handle, -100)
+        pq2 = pq1.copy()
+        assert pq2 == pq1
+        assert pq2 is not pq1
+        pq2.push(20)
+        assert pq2.pop() == MayBe(5)
+        assert pq2.pop() == MayBe(20)
+        assert pq1.peak() == MayBe(5)
+
+        pq3 = pq1.map(lambda x: str(x))
+        assert pq3.snapshot() == ('5', '9', '8', '7', '6', '5', '4', '3', '2', '1', '0')
+        assert pq1 != pq3
+        assert pq1 != list(pq1)
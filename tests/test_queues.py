@@ -21,7 +21,10 @@ from pythonic_fp.queues.fifo import FIFOQueue as FQ
 from pythonic_fp.queues.fifo import fifo_queue as fq
 from pythonic_fp.queues.lifo import LIFOQueue as LQ
 from pythonic_fp.queues.lifo import lifo_queue as lq
+from pythonic_fp.queues.done import Done
+from pythonic_fp.queues.overflow import Overflow, QueueFullError
 from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.gadgets.sentinels.novalue import NoValue
 
 
 class TestQueueTypes:
@@ -500,6 +503,15 @@ class TestQueueTypes:
         lq3 = lq2.map(f2)
         assert lq3 == lq('63', '42')
 
+    def test_lifo_copy_keeps_order(self) -> None:
+        lq0 = LQ(['63', '42'])
+        lq1 = lq0.copy()
+        assert lq1 == lq0
+        assert lq1 is not lq0
+        assert lq1.pop() == MayBe('42')
+        assert lq1.pop() == MayBe('63')
+        assert lq0.snapshot() == ('42', '63')
+
     def test_folding(self) -> None:
         def f1(ii: int, jj: int) -> int:
             return ii + jj
@@ -556,3 +568,369 @@ class TestQueueTypes:
 
         cnt_up = fq1.fold(f2l, '0').map(lambda ss: ss + '6789')
         assert cnt_up == MayBe('0123456789')
+
+    def test_live_iterators(self) -> None:
+        fq1 = fq(1, 2, 3)
+        it_fq = iter(fq1)
+        assert next(it_fq) == 1
+        fq1.push(4)
+        try:
+            next(it_fq)
+            assert False
+        except RuntimeError:
+            assert True
+        assert fq1.snapshot() == (1, 2, 3, 4)
+        for item in fq1.snapshot():
+            fq1.push(item)
+        assert len(fq1) == 8
+
+        lq1 = lq(1, 2, 3)
+        assert list(lq1) == [3, 2, 1]
+        assert lq1.snapshot() == (3, 2, 1)
+        try:
+            for item in lq1:
+                lq1.pop()
+            assert False
+        except RuntimeError:
+            assert len(lq1) == 2
+
+        de1 = de(1, 2, 3)
+        assert list(reversed(de1)) == [3, 2, 1]
+        assert de1.snapshot() == (1, 2, 3)
+        it_de = reversed(de1)
+        assert next(it_de) == 3
+        de1.popl()
+        try:
+            next(it_de)
+            assert False
+        except RuntimeError:
+            assert True
+        it_de = iter(de1)
+        assert next(it_de) == 2
+        assert de1.popl() == MayBe(2)
+        try:
+            next(it_de)
+            assert False
+        except RuntimeError:
+            assert de1.snapshot() == (3,)
+
+    def test_pop_many(self) -> None:
+        fq1 = fq(*range(10))
+        assert fq1.pop_many(0) == ()
+        assert fq1.pop_many(3) == (0, 1, 2)
+        assert fq1.pop() == MayBe(3)
+        assert fq1.pop_many(100) == (4, 5, 6, 7, 8, 9)
+        assert not fq1
+        assert fq1.pop_many() == ()
+        fq1.push(1, 2)
+        assert fq1.pop_many() == (1, 2)
+        try:
+            fq1.pop_many(-1)
+            assert False
+        except ValueError:
+            assert True
+
+        lq1 = lq(*range(6))
+        assert lq1.pop_many(2) == (5, 4)
+        assert lq1.pop_many() == (3, 2, 1, 0)
+        assert lq1.pop() == MayBe()
+        lq1.push(42)
+        assert lq1.peak() == MayBe(42)
+
+        de1 = de(*range(8))
+        assert de1.popl_many(2) == (0, 1)
+        assert de1.popr_many(2) == (7, 6)
+        assert de1.popr_many(1) == (5,)
+        assert de1.popl_many() == (2, 3, 4)
+        de1.pushl(1, 2, 3)
+        assert de1.popr_many() == (1, 2, 3)
+        assert de1.popl_many(5) == de1.popr_many() == ()
+
+    def test_extend(self) -> None:
+        fq1: FQ[int] = FQ()
+        fq1.extend(ii for ii in range(5))
+        fq1.extend(range(5, 8))
+        assert fq1 == fq(*range(8))
+        fq1.extend(fq1)
+        assert fq1.snapshot() == 2 * tuple(range(8))
+        try:
+            fq1.extend(iter(fq1))
+            assert False
+        except RuntimeError:
+            assert len(fq1) == 17
+
+        lq1: LQ[int] = LQ()
+        lq1.extend([1, 2, 3])
+        lq1.extend(map(lambda ii: 2 * ii, range(2, 4)))
+        assert lq1 == lq(1, 2, 3, 4, 6)
+        assert lq1.pop() == MayBe(6)
+        lq1.extend(())
+        assert len(lq1) == 4
+
+        de1: DE[int] = DE()
+        de1.extendr(range(3))
+        de1.extendl(ii for ii in range(-1, -4, -1))
+        assert de1 == de(-3, -2, -1, 0, 1, 2)
+        de2 = de1.copy()
+        de2.pushl(-4)
+        de1.extendl([-4])
+        assert de1 == de2
+        de1.extendr(de1)
+        assert de1.popr_many(7) == (2, 1, 0, -1, -2, -3, -4)
+
+    def test_bounded(self) -> None:
+        fq1: FQ[int] = FQ(range(5), maxlen=3)
+        assert fq1.maxlen == 3
+        assert fq1.snapshot() == (2, 3, 4)
+        assert fq1.push(5)
+        assert fq1.snapshot() == (3, 4, 5)
+        assert not fq1.push(6, 7, 8, 9)
+        assert fq1.snapshot() == (7, 8, 9)
+        assert fq1.push(10, 11, 12)
+        assert fq1.snapshot() == (10, 11, 12)
+        assert fq1.pop() == MayBe(10)
+        assert fq1.copy().maxlen == 3
+        assert fq1.map(lambda ii: ii + 1) == fq(12, 13)
+        assert FQ(maxlen=2).maxlen == 2
+        assert FQ().maxlen is None
+
+        lq1: LQ[int] = LQ(maxlen=3, overflow=Overflow.DROP_NEWEST)
+        assert not lq1.push(1, 2, 3, 4)
+        assert lq1.snapshot() == (3, 2, 1)
+        assert not lq1.extend([5])
+        assert lq1.pop() == MayBe(3)
+        assert lq1.push(5)
+        assert lq1.snapshot() == (5, 2, 1)
+
+        de1: DE[int] = DE(maxlen=3, overflow=Overflow.REJECT)
+        assert de1.pushr(1, 2)
+        assert not de1.pushl(3, 4)
+        assert de1.pushl(0)
+        assert not de1.extendr([3])
+        assert de1 == de(0, 1, 2)
+
+        de2: DE[int] = DE([1, 2, 3], maxlen=3)
+        assert de2.pushl(0)
+        assert de2.snapshot() == (0, 1, 2)
+        assert de2.pushr(3)
+        assert de2.snapshot() == (1, 2, 3)
+        assert not de2.extendl(range(4, 8))
+        assert de2.snapshot() == (7, 6, 5)
+
+        fq2: FQ[int] = FQ(maxlen=2, overflow=Overflow.RAISE)
+        fq2.push(1)
+        try:
+            fq2.push(2, 3)
+            assert False
+        except QueueFullError:
+            assert fq2.snapshot() == (1,)
+
+        try:
+            FQ(maxlen=0)
+            assert False
+        except ValueError:
+            assert True
+
+    def test_capacity(self) -> None:
+        fq1: FQ[int] = FQ()
+        fq1.reserve(1000)
+        cap = fq1.capacity
+        assert cap >= 1000
+        fq1.extend(range(1000))
+        assert fq1.capacity == cap
+        fq1.pop_many(990)
+        fq1.shrink_to_fit()
+        assert 10 <= fq1.capacity < 20
+        assert fq1.snapshot() == tuple(range(990, 1000))
+        try:
+            fq1.reserve(-1)
+            assert False
+        except ValueError:
+            assert len(fq1) == 10
+
+        lq1: LQ[int] = LQ(growth=1.5)
+        lq1.push(*range(8))
+        cap = lq1.capacity
+        lq1.push(8)
+        assert lq1.capacity == max(9, int(1.5 * cap))
+        lq1.extend(range(9, 100))
+        assert lq1.pop_many() == tuple(range(99, -1, -1))
+
+        de1: DE[int] = DE(range(1000), shrink=0.25)
+        assert de1.capacity >= 1000
+        while len(de1) > 100:
+            de1.popl()
+            de1.popr()
+        assert de1.capacity < 400
+        assert de1.snapshot() == tuple(range(450, 550))
+        de1.popl_many()
+        assert de1.capacity <= 4
+
+        de2: DE[int] = DE(maxlen=50)
+        de2.reserve(100)
+        de2.shrink_to_fit()
+        assert de2.capacity == 50
+
+        fq2: FQ[int] = FQ(range(100), maxlen=100, shrink=0.25)
+        lq2: LQ[int] = LQ(range(100), maxlen=100, shrink=0.25)
+        de3: DE[int] = DE(range(100), maxlen=100, shrink=0.25)
+        fq2.pop_many(90)
+        lq2.pop_many(90)
+        de3.popl_many(90)
+        assert fq2.capacity == lq2.capacity == de3.capacity == 100
+        fq2.extend(range(90))
+        lq2.extend(range(90))
+        de3.extendr(range(90))
+        assert fq2.capacity == lq2.capacity == de3.capacity == 100
+        for growth, shrink in ((1.0, None), (2.0, 0.5), (4.0, 0.0)):
+            try:
+                DE(growth=growth, shrink=shrink)
+                assert False
+            except ValueError:
+                assert True
+
+    def test_raw_pops(self) -> None:
+        fq1: FQ[int | None] = fq(1, None)
+        assert fq1.peak_next_out_or(-1) == 1
+        assert fq1.peak_last_in_or(-1) is None
+        assert fq1.pop_or(-1) == 1
+        assert fq1.try_pop() is None
+        assert fq1.pop_or(-1) == -1
+        assert fq1.try_pop() is NoValue()
+        assert fq1.peak_next_out_or(-1) == -1
+
+        lq1: LQ[str] = lq('a', 'b')
+        assert lq1.peak_or('') == 'b'
+        assert lq1.try_pop() == 'b'
+        assert lq1.pop_or('') == 'a'
+        assert lq1.peak_or('') == ''
+        assert lq1.try_pop() is NoValue()
+
+        de1: DE[int] = de(1, 2, 3)
+        assert de1.peakl_or(0) == 1
+        assert de1.peakr_or(0) == 3
+        assert de1.try_popl() == 1
+        assert de1.popr_or(0) == 3
+        assert de1.try_popr() == 2
+        assert de1.popl_or(0) == 0
+        assert de1.try_popl() is NoValue()
+        assert de1.peakr_or(0) == 0
+
+    def test_clone_and_construct(self) -> None:
+        fq1: FQ[int] = FQ(range(6))
+        fq1.pop_many(4)
+        fq1.push(6, 7, 8)
+        fq2 = fq1.copy()
+        assert fq2 == fq1 == fq(4, 5, 6, 7, 8)
+        assert fq2.capacity == fq1.capacity
+        fq2.push(9)
+        assert fq1.snapshot() == (4, 5, 6, 7, 8)
+        assert FQ(fq1) == fq1
+        assert fq1.map(str).snapshot() == ('4', '5', '6', '7', '8')
+
+        lq1: LQ[int] = lq(1, 2, 3)
+        assert LQ(lq1).snapshot() == (1, 2, 3)
+        assert LQ(lq1) == LQ(list(lq1))
+        calls: list[int] = []
+        lq2 = lq1.map(lambda x: calls.append(x) or 10 * x)
+        assert calls == [3, 2, 1]
+        assert lq2 == lq(10, 20, 30)
+
+        de1: DE[int] = DE(range(5), maxlen=5)
+        de1.pushl(-1)
+        de2 = de1.copy()
+        assert de2.snapshot() == (-1, 0, 1, 2, 3)
+        assert de2.maxlen == 5
+        assert de2.capacity == 5
+        de3 = de1.map(lambda x: -x)
+        assert de3.snapshot() == (1, 0, -1, -2, -3)
+        assert de3.pushr(-4)
+        assert de3.snapshot() == (0, -1, -2, -3, -4)
+        assert DE(de1, maxlen=3).snapshot() == (1, 2, 3)
+
+    def test_inplace(self) -> None:
+        fq1: FQ[int] = FQ(range(4))
+        fq1.pop_many(3)
+        fq1.push(*range(4, 10))
+        cap = fq1.capacity
+        fq1.map_inplace(lambda x: x * 10)
+        assert fq1.snapshot() == (30, 40, 50, 60, 70, 80, 90)
+        assert fq1.retain(lambda x: x % 20 == 0) == 4
+        assert fq1.snapshot() == (40, 60, 80)
+        assert fq1.capacity == cap
+        fq1.push(40, 60, 10)
+        assert fq1.dedupe() == 2
+        assert fq1 == fq(40, 60, 80, 10)
+
+        lq1: LQ[int] = lq(1, 2, 3, 2, 1, 4)
+        seen: list[int] = []
+        lq1.map_inplace(lambda x: seen.append(x) or x)
+        assert seen == [4, 1, 2, 3, 2, 1]
+        assert lq1.dedupe() == 2
+        assert lq1 == lq(3, 2, 1, 4)
+        assert lq1.remove_if(lambda x: x > 2) == 2
+        assert lq1.pop() == MayBe(1)
+        assert lq1.pop() == MayBe(2)
+        assert not lq1
+
+        de1: DE[int] = de(*range(10))
+
+        def pred(x: int) -> bool:
+            if x == 6:
+                raise ValueError('six')
+            return x % 2 == 0
+
+        try:
+            de1.retain(pred)
+            assert False
+        except ValueError:
+            assert de1 == de(0, 2, 4, 6, 7, 8, 9)
+        assert de1.remove_if(lambda x: True) == 7
+        assert not de1
+        assert de1.dedupe() == 0
+
+    def test_early_exit(self) -> None:
+        visited: list[int] = []
+
+        def capped_sum(acc: int, d: int) -> int | Done[int]:
+            visited.append(d)
+            return Done(acc) if acc + d > 10 else acc + d
+
+        fq1: FQ[int] = FQ(range(1, 100))
+        assert fq1.fold_until(capped_sum, 0) == MayBe(10)
+        assert visited == [1, 2, 3, 4, 5]
+        assert fq1.fold_until(lambda acc, d: acc + d) == MayBe(sum(range(1, 100)))
+        assert FQ[int]().fold_until(capped_sum) == MayBe()
+        assert fq1.find(lambda d: d % 7 == 0) == MayBe(7)
+        assert fq1.find(lambda d: d > 100) == MayBe()
+        assert fq1.any(lambda d: d == 50)
+        assert not fq1.all(lambda d: d < 50)
+        assert fq1.count(lambda d: d % 10 == 0) == 9
+        assert fq1.index_of(1) == MayBe(0)
+        assert fq1.index_of(100) == MayBe()
+
+        lq1: LQ[int] = lq(1, 2, 3, 2)
+        assert lq1.fold_until(
+            lambda acc, d: Done(acc) if d == 3 else acc + d, 0
+        ) == MayBe(2)
+        assert lq1.index_of(2) == MayBe(0)
+        assert lq1.index_of(1) == MayBe(3)
+        assert lq1.find(lambda d: d > 1) == MayBe(2)
+
+        de1: DE[str] = de('a', 'b', 'c', 'd')
+        assert de1.foldl_until(
+            lambda acc, d: Done(acc) if d == 'c' else acc + d
+        ) == MayBe('ab')
+        assert de1.foldr_until(
+            lambda d, acc: Done(acc) if d == 'b' else acc + d
+        ) == MayBe('dc')
+        assert de1.foldr_until(lambda d, acc: acc + d, '') == MayBe('dcba')
+        assert de1.all(lambda d: len(d) == 1)
+        assert DE[str]().all(lambda d: False)
+        assert not DE[str]().any(lambda d: True)
+        assert de1.index_of('d') == MayBe(3)
+        try:
+            de1.foldl_until(lambda acc, d: de1.pushr(d) and acc, '')
+            assert False
+        except RuntimeError:
+            assert len(de1) == 5
@@ -0,0 +1,143 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.sharded import ShardedFIFOQueue
+
+
+def push_from_threads(
+    sq: ShardedFIFOQueue[tuple[int, int]], threads: int, n: int
+) -> None:
+    def produce(t: int) -> None:
+        for ii in range(n):
+            sq.push((t, ii))
+
+    pool = [threading.Thread(target=produce, args=(t,)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+class TestSharded:
+    def test_empty(self) -> None:
+        sq: ShardedFIFOQueue[int] = ShardedFIFOQueue(4)
+        assert sq.lanes == 4 and not sq.ordered
+        assert not sq and len(sq) == 0
+        assert sq.pop() == MayBe() and sq.pop_or(-1) == -1
+        assert sq.pop(block=True, timeout=0.01) == MayBe()
+        assert sq.pop_many() == () and sq.snapshot() == ()
+        assert ShardedFIFOQueue[int]().lanes >= 1
+
+    def test_per_thread_order(self) -> None:
+        sq: ShardedFIFOQueue[tuple[int, int]] = ShardedFIFOQueue(3)
+        push_from_threads(sq, 8, 500)
+        assert len(sq) == 4000
+        got = [sq.pop_or((-1, -1)) for _ in range(1000)]
+        got += sq.pop_many(1000)
+        got += sq.pop_many()
+        assert not sq and len(got) == 4000
+        for t in range(8):
+            assert [ii for tt, ii in got if tt == t] == list(range(500))
+
+    def test_per_key_order(self) -> None:
+        sq: ShardedFIFOQueue[int] = ShardedFIFOQueue(4, key=lambda d: d % 7)
+        sq.push(*range(70))
+        sq.push(70)
+        assert len(sq) == 71
+        got = sq.pop_many(30) + sq.pop_many()
+        assert sorted(got) == list(range(71))
+        for k in range(7):
+            assert [d for d in got if d % 7 == k] == list(range(k, 71, 7))
+
+    def test_ordered(self) -> None:
+        sq: ShardedFIFOQueue[tuple[int, int]] = ShardedFIFOQueue(4, ordered=True)
+        for t in range(6):
+            thread = threading.Thread(target=lambda t=t: sq.push((t, 0), (t, 1)))
+            thread.start()
+            thread.join()
+        expected = tuple((t, ii) for t in range(6) for ii in range(2))
+        assert sq.snapshot() == expected
+        assert tuple(sq) == expected
+        assert sq.pop() == MayBe((0, 0))
+        assert sq.pop_many(3) == expected[1:4]
+        assert sq.pop_many() == expected[4:]
+
+        push_from_threads(sq, 8, 300)
+        got = sq.pop_many()
+        assert len(got) == 2400
+        for t in range(8):
+            assert [ii for tt, ii in got if tt == t] == list(range(300))
+
+    def test_concurrent_consumers(self) -> None:
+        sq: ShardedFIFOQueue[tuple[int, int]] = ShardedFIFOQueue(4)
+        push_from_threads(sq, 4, 1000)
+        popped: list[list[tuple[int, int]]] = [[] for _ in range(4)]
+
+        def consume(c: int) -> None:
+            while (d := sq.pop_or(None)) is not None:
+                popped[c].append(d)
+
+        pool = [threading.Thread(target=consume, args=(c,)) for c in range(4)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        assert sorted(d for ds in popped for d in ds) == sorted(
+            (t, ii) for t in range(4) for ii in range(1000)
+        )
+        assert not sq
+
+    def test_len_during_concurrent_pops(self) -> None:
+        sq: ShardedFIFOQueue[int] = ShardedFIFOQueue(4)
+        done = threading.Event()
+        lengths: list[int] = []
+
+        def watch() -> None:
+            try:
+                while not done.is_set():
+                    lengths.append(len(sq))
+            except ValueError:
+                # len() rejects a negative __len__
+                lengths.append(-1)
+
+        def churn() -> None:
+            for ii in range(5000):
+                sq.push(ii)
+                sq.pop()
+
+        watcher = threading.Thread(target=watch)
+        watcher.start()
+        pool = [threading.Thread(target=churn) for _ in range(4)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        done.set()
+        watcher.join()
+        assert lengths and min(lengths) >= 0
+        assert len(sq) == len(sq.snapshot())
+
+    def test_bad_arguments(self) -> None:
+        for call in (
+            lambda: ShardedFIFOQueue[int](0),
+            lambda: ShardedFIFOQueue[int](2).pop_many(-1),
+        ):
+            try:
+                call()
+            except ValueError:
+                pass
+            else:
+                assert False
@@ -0,0 +1,121 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing as mp
+import pickle
+from multiprocessing.queues import Queue
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.shared import SharedFIFOQueue, SharedSPSCFIFOQueue
+
+
+type _Shared = SharedFIFOQueue[int] | SharedSPSCFIFOQueue[int]
+
+
+def produce(sq: _Shared, lo: int, hi: int) -> None:
+    for n in range(lo, hi):
+        sq.push(n)
+    sq.close()
+
+
+def consume(sq: _Shared, out: Queue[int]) -> None:
+    total = 0
+    while (n := sq.pop_or(None, block=True, timeout=10)) != -1:
+        assert n is not None
+        total += n
+    out.put(total)
+    sq.close()
+
+
+class TestShared:
+    def test_typed(self) -> None:
+        with SharedFIFOQueue[int](5, typecode='q') as sq:
+            assert sq.typecode == 'q' and sq.capacity == 5
+            assert not sq and sq.pop() == MayBe() and sq.pop_or(-1) == -1
+            assert sq.push(1, 2, 3, block=False)
+            assert not sq.push(4, 5, 6, block=False)
+            assert len(sq) == 3
+            assert sq.pop_many(2) == (1, 2)
+            assert sq.push(4, 5, 6, block=False)
+            assert sq.peak_next_out() == MayBe(3)
+            assert sq.pop_many() == (3, 4, 5, 6)
+            assert sq.pop_many(0) == ()
+
+    def test_bytes(self) -> None:
+        with SharedFIFOQueue[bytes](32, dumps=bytes, loads=bytes) as sq:
+            assert sq.typecode is None
+            for _ in range(10):
+                assert sq.push(b'abcdefghij', b'', block=False)
+                assert not sq.push(b'x' * 20, block=False)
+                assert sq.pop() == MayBe(b'abcdefghij')
+                assert sq.pop_many() == (b'',)
+        with SharedSPSCFIFOQueue[object](256) as sq:
+            sq.push({'a': [1, 2]}, None, 'three')
+            assert sq.pop_many() == ({'a': [1, 2]}, None, 'three')
+
+    def test_bad_arguments(self) -> None:
+        for args in ((0,), (8, 'u'), (8, 'x')):
+            try:
+                SharedFIFOQueue[int](args[0], typecode=args[1] if args[1:] else None)
+            except ValueError:
+                pass
+            else:
+                assert False
+        with SharedSPSCFIFOQueue[bytes](8, dumps=bytes, loads=bytes) as sq:
+            for call in (lambda: sq.push(b'123456789'), lambda: sq.pop_many(-1)):
+                try:
+                    call()
+                except ValueError:
+                    pass
+                else:
+                    assert False
+
+    def test_attach(self) -> None:
+        sq = SharedSPSCFIFOQueue[float](4, typecode='d')
+        sq.push(1.5)
+        other = pickle.loads(pickle.dumps(sq))
+        assert other.name == sq.name
+        assert other.pop() == MayBe(1.5)
+        other.push(2.5)
+        other.close()
+        assert sq.pop() == MayBe(2.5)
+        sq.close()
+        sq.close()
+
+    def test_processes(self) -> None:
+        for typecode in ('q', None):
+            out: Queue[int] = mp.Queue()
+            with SharedFIFOQueue[int](64, typecode=typecode) as sq:
+                producers = [
+                    mp.Process(target=produce, args=(sq, k * 1000, (k + 1) * 1000))
+                    for k in range(3)
+                ]
+                consumers = [
+                    mp.Process(target=consume, args=(sq, out)) for _ in range(2)
+                ]
+                for proc in producers + consumers:
+                    proc.start()
+                for proc in producers:
+                    proc.join()
+                sq.push(-1, -1)
+                for proc in consumers:
+                    proc.join()
+                assert out.get() + out.get() == sum(range(3000))
+                assert not sq
+
+            with SharedSPSCFIFOQueue[int](64, typecode=typecode) as spsc:
+                producer = mp.Process(target=produce, args=(spsc, 0, 2000))
+                producer.start()
+                got = [spsc.pop_or(-2, block=True, timeout=10) for _ in range(2000)]
+                producer.join()
+                assert got == list(range(2000))
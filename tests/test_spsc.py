@@ -0,0 +1,85 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import Any, cast
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.spsc import SPSCFIFOQueue
+
+
+class TestSPSC:
+    def test_ring(self) -> None:
+        sq: SPSCFIFOQueue[int] = SPSCFIFOQueue(4)
+        assert sq.capacity == 4 and not sq and len(sq) == 0
+        assert sq.pop() == MayBe() and sq.pop_or(-1) == -1
+        assert sq.peak_next_out() == MayBe()
+        assert sq.pop_many() == ()
+        for base in range(0, 40, 3):
+            assert sq.push(base, base + 1, base + 2, block=False)
+            assert not sq.push(0, 0, block=False)
+            assert len(sq) == 3
+            assert sq.peak_next_out() == MayBe(base)
+            assert sq.pop() == MayBe(base)
+            assert sq.pop_many(1) == (base + 1,)
+            assert sq.pop_many() == (base + 2,)
+        assert sq.push(1, 2, 3, 4, timeout=0.0)
+        assert not sq.push(5, timeout=0.01)
+        assert sq.pop_many() == (1, 2, 3, 4)
+        assert sq.pop(block=True, timeout=0.01) == MayBe()
+
+    def test_releases_items(self) -> None:
+        sq: SPSCFIFOQueue[object] = SPSCFIFOQueue(3)
+        sq.push(object(), object())
+        sq.pop()
+        sq.pop_many()
+        assert sq._ring == [None, None, None]
+
+    def test_bad_arguments(self) -> None:
+        for call in (
+            lambda: SPSCFIFOQueue[int](0),
+            lambda: SPSCFIFOQueue[int](2).push(1, 2, 3),
+            lambda: SPSCFIFOQueue[int](2).pop_many(-1),
+        ):
+            try:
+                call()
+            except ValueError:
+                pass
+            else:
+                assert False
+
+    def test_threads(self) -> None:
+        sq: SPSCFIFOQueue[int] = SPSCFIFOQueue(16)
+        n = 20_000
+
+        def produce() -> None:
+            for lo in range(0, n, 5):
+                sq.push(*range(lo, lo + 5))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        got: list[int] = []
+        while len(got) < n:
+            got.extend(sq.pop_many(7, block=True, timeout=10))
+            if len(got) < n:
+                got.append(sq.pop_or(-1, block=True, timeout=10))
+        producer.join()
+        assert got == list(range(n))
+        assert not sq
+
+    def test_len_never_negative(self) -> None:
+        sq: SPSCFIFOQueue[int] = SPSCFIFOQueue(4)
+        # Indices as a third thread may see them, the consumer having
+        # moved the head past the tail it read a moment earlier.
+        cast(Any, sq)._tail, cast(Any, sq)._head = 3, 5
+        assert len(sq) == 0
@@ -0,0 +1,52 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, cast
+from pythonic_fp.circulararray.auto import CA
+from pythonic_fp.queues._storage import _ca_adopt, _ca_clone, _ca_items
+
+
+class TestCALayout:
+    # The queues' storage helpers read and write these private CA slots.
+    def test_slots(self) -> None:
+        assert set(cast(Any, CA).__slots__) >= {
+            '_xs',
+            '_cnt',
+            '_cap',
+            '_front',
+            '_rear',
+        }
+
+    def test_wrapped_ring(self) -> None:
+        ca: CA[int] = CA(range(3))
+        ca.resize(5)
+        ca.popl()
+        ca.popl()
+        ca.pushr(3, 4, 5)
+        c = cast(Any, ca)
+        assert c._cnt == len(ca) == 4 and c._cap == len(c._xs) == ca.capacity()
+        assert c._xs[c._front] == 2 and c._xs[c._rear] == 5
+        assert (c._front + c._cnt - 1) % c._cap == c._rear
+        assert _ca_items(ca) == list(ca) == [2, 3, 4, 5]
+        clone = _ca_clone(ca)
+        assert list(clone) == [2, 3, 4, 5] and clone.capacity() == ca.capacity()
+
+    def test_adopt(self) -> None:
+        items = [1, 2, 3]
+        ca = _ca_adopt(items, 8)
+        assert list(ca) == [1, 2, 3] and ca.capacity() == 8
+        ca.pushr(4)
+        ca.pushl(0)
+        assert list(ca) == [0, 1, 2, 3, 4]
+        assert cast(Any, ca)._xs is items
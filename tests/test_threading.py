@@ -0,0 +1,135 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+from collections.abc import Callable
+from pythonic_fp.queues.concurrent import (
+    ConcurrentDEQueue,
+    ConcurrentFIFOQueue,
+    ConcurrentLIFOQueue,
+)
+
+# Stress tests, meaningful on free-threaded builds. With the GIL, a
+# tiny switch interval still forces threads to interleave.
+
+PRODUCERS = 4
+CONSUMERS = 4
+ITEMS = 2_000
+
+
+def run_threads(targets: list[Callable[[], None]]) -> None:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=target) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def hand_off(push: Callable[[int], object], pop: Callable[[], int | None]) -> list[int]:
+    # Every producer pushes ITEMS distinct ints, consumers pop until
+    # each has seen its share of the end markers.
+    popped: list[list[int]] = [[] for _ in range(CONSUMERS)]
+
+    def produce(p: int) -> Callable[[], None]:
+        def run() -> None:
+            for n in range(p * ITEMS, (p + 1) * ITEMS):
+                push(n)
+
+        return run
+
+    def consume(c: int) -> Callable[[], None]:
+        def run() -> None:
+            while (n := pop()) != -1:
+                assert n is not None
+                popped[c].append(n)
+
+        return run
+
+    producers = [produce(p) for p in range(PRODUCERS)]
+    consumers = [consume(c) for c in range(CONSUMERS)]
+
+    def finish() -> None:
+        run_threads(producers)
+        for _ in range(CONSUMERS):
+            push(-1)
+
+    run_threads([finish] + consumers)
+    return sorted(n for ns in popped for n in ns)
+
+
+class TestThreading:
+    def test_fifo(self) -> None:
+        cq: ConcurrentFIFOQueue[int] = ConcurrentFIFOQueue(maxsize=64)
+        got = hand_off(cq.push, lambda: cq.pop(block=True, timeout=10).get())
+        assert got == list(range(PRODUCERS * ITEMS))
+        assert not cq
+
+    def test_lifo(self) -> None:
+        cq: ConcurrentLIFOQueue[int] = ConcurrentLIFOQueue()
+        done = threading.Event()
+
+        def pop() -> int | None:
+            # End markers would come off a stack first, wait for done instead.
+            while not (popped := cq.pop()):
+                if done.is_set() and not cq:
+                    return -1
+            return popped.get()
+
+        def push(n: int) -> None:
+            if n == -1:
+                done.set()
+            else:
+                cq.push(n)
+
+        got = hand_off(push, pop)
+        assert got == list(range(PRODUCERS * ITEMS))
+        assert not cq
+
+    def test_de(self) -> None:
+        cq: ConcurrentDEQueue[int] = ConcurrentDEQueue(maxsize=64)
+        flip = iter(range(sys.maxsize))
+
+        def push(n: int) -> bool:
+            # End markers go on the right, behind every item.
+            if n == -1 or next(flip) % 2:
+                return cq.pushr(n)
+            return cq.pushl(n)
+
+        got = hand_off(push, lambda: cq.popl(block=True, timeout=10).get())
+        assert got == list(range(PRODUCERS * ITEMS))
+        assert not cq
+
+    def test_bulk(self) -> None:
+        cq: ConcurrentFIFOQueue[int] = ConcurrentFIFOQueue()
+        popped: list[int] = []
+
+        def produce(p: int) -> Callable[[], None]:
+            def run() -> None:
+                for lo in range(p * ITEMS, (p + 1) * ITEMS, 10):
+                    cq.push(*range(lo, lo + 10))
+
+            return run
+
+        def consume() -> None:
+            while len(popped) < PRODUCERS * ITEMS:
+                popped.extend(cq.pop_many(25, block=True, timeout=0.01))
+
+        run_threads([produce(p) for p in range(PRODUCERS)] + [consume])
+        assert sorted(popped) == list(range(PRODUCERS * ITEMS))
@@ -0,0 +1,133 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.timed import CoDel, TimedDEQueue, TimedFIFOQueue
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimedFIFOQueue:
+    def test_ages(self) -> None:
+        clock = Clock()
+        tq: TimedFIFOQueue[int] = TimedFIFOQueue(clock=clock)
+        assert tq.oldest_age() == MayBe() and tq.pop() == MayBe()
+        tq.push(1, 2)
+        clock.now = 1.0
+        tq.extend(x for x in (3, 4))
+        clock.now = 2.5
+        assert tq.push_times() == (0.0, 0.0, 1.0, 1.0)
+        assert tq.oldest_age() == MayBe(2.5) and tq.oldest_age(3.0) == MayBe(3.0)
+        assert tq.pop() == MayBe(1) and tq.pop_or(-1) == 2
+        assert tq.oldest_age() == MayBe(1.5)
+        assert tq.pop_many() == (3, 4) and tq.push_times() == ()
+
+    def test_pop_expired(self) -> None:
+        clock = Clock()
+        tq: TimedFIFOQueue[int] = TimedFIFOQueue(range(3), clock=clock)
+        assert tq.push_times() == (0.0, 0.0, 0.0)
+        # Wrap the push times around the end of their storage.
+        assert tq.pop_many(2) == (0, 1)
+        for ii in range(3, 40):
+            clock.now = float(ii)
+            tq.push(ii)
+        assert tq.pop_expired(10.0, 20.0) == ()
+        assert tq.pop_expired(30.0, 25.0) == (2, 3, 4, 5)
+        assert tq.pop_expired(38.0, 0.0) == tuple(range(6, 39))
+        assert tq.snapshot() == (39,) and tq.push_times() == (39.0,)
+        tq.push(40)
+        assert tq.pop_expired(100.0, 1.0) == (39, 40) and not tq
+        try:
+            tq.pop_expired(0.0, -1.0)
+        except ValueError:
+            pass
+        else:
+            assert False
+
+    def test_codel(self) -> None:
+        clock = Clock()
+        codel = CoDel(0.005, 0.1)
+        tq: TimedFIFOQueue[int] = TimedFIFOQueue(clock=clock, codel=codel)
+        assert tq.codel is codel
+        popped = []
+        # Items arrive twice as fast as they are popped, for 20 seconds.
+        for ii in range(20_000):
+            clock.now += 0.001
+            tq.push(ii)
+            if ii % 2 == 0:
+                popped.extend(tq.pop())
+        assert len(popped) == 10_000 and popped == sorted(popped)
+        assert codel.dropped > 9000 and len(tq) < 100
+        assert len(tq) + len(popped) + codel.dropped == 20_000
+        assert tq.oldest_age().get() < 0.1
+        # Once the backlog is gone, dropping stops.
+        clock.now += 1.0
+        tq.pop_many()
+        tq.push(-1)
+        assert tq.pop() == MayBe(-1) and not codel.dropping
+
+    def test_codel_spares_last_item(self) -> None:
+        clock = Clock()
+        tq: TimedFIFOQueue[str] = TimedFIFOQueue(['a'], clock=clock, codel=CoDel())
+        clock.now = 10.0
+        assert tq.pop() == MayBe('a')
+
+    def test_bad_codel(self) -> None:
+        for target, interval in ((0.0, 0.1), (0.005, -1.0)):
+            try:
+                CoDel(target, interval)
+            except ValueError:
+                pass
+            else:
+                assert False
+
+
+class TestTimedDEQueue:
+    def test_ends(self) -> None:
+        clock = Clock()
+        tq: TimedDEQueue[int] = TimedDEQueue([1, 2], clock=clock)
+        clock.now = 1.0
+        tq.pushr(3)
+        tq.extendr([4])
+        clock.now = 2.0
+        tq.pushl(0)
+        tq.extendl(x for x in (-1,))
+        assert tq.snapshot() == (-1, 0, 1, 2, 3, 4)
+        assert tq.push_times() == (2.0, 2.0, 0.0, 0.0, 1.0, 1.0)
+        assert tq.agel(3.0) == MayBe(1.0) and tq.ager(3.0) == MayBe(2.0)
+        assert tq.pop_expiredl(3.0, 1.5) == ()
+        assert tq.pop_expiredr(3.0, 1.5) == (4, 3, 2, 1)
+        assert tq.popl_or(None) == -1
+        assert tq.pop_expiredl(3.5, 1.5) == (0,) and not tq
+        assert tq.agel() == MayBe() and tq.ager() == MayBe()
+        assert tq.popr() == MayBe() and tq.popr_or(None) is None
+
+    def test_codel(self) -> None:
+        clock = Clock()
+        codel = CoDel(0.005, 0.1)
+        tq: TimedDEQueue[int] = TimedDEQueue(clock=clock, codel=codel)
+        for ii in range(20_000):
+            clock.now += 0.001
+            tq.pushr(ii)
+            if ii % 2 == 0:
+                tq.popl()
+        assert codel.dropped > 9000
+        assert tq.agel().get() < 0.1
+        assert tq.popr_many(2) == (19_999, 19_998)
@@ -0,0 +1,122 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+from pythonic_fp.queues.de import DEQueue
+from pythonic_fp.queues.fifo import FIFOQueue
+from pythonic_fp.queues.lifo import LIFOQueue
+from pythonic_fp.queues.typed import TypedDEQueue, TypedFIFOQueue, TypedLIFOQueue
+from pythonic_fp.fptools.maybe import MayBe
+
+
+class TestTypedQueues:
+    def test_fifo(self) -> None:
+        tq = FIFOQueue.typed('d', [1, 2, 3])
+        assert isinstance(tq, TypedFIFOQueue)
+        assert tq.typecode == 'd' and tq.itemsize == 8
+        assert tq.pop() == MayBe(1.0)
+        tq.push(4.0, 5.0)
+        assert tq.snapshot() == (2.0, 3.0, 4.0, 5.0)
+        assert tq.peak_next_out() == MayBe(2.0)
+        assert tq.peak_last_in() == MayBe(5.0)
+        assert tq.fold(lambda acc, d: acc + d) == MayBe(14.0)
+        assert tq.map(lambda d: 2 * d) == TypedFIFOQueue('d', [4, 6, 8, 10])
+        assert repr(tq) == "TypedFIFOQueue('d', [2.0, 3.0, 4.0, 5.0])"
+        assert str(tq) == '<< 2.0 < 3.0 < 4.0 < 5.0 <<'
+        assert tq.pop_many(2) == array('d', [2.0, 3.0])
+        assert tq.pop_many() == array('d', [4.0, 5.0])
+        assert not tq
+        assert tq.pop() == MayBe()
+        assert tq.pop_or(-1) == -1
+        assert repr(tq) == "TypedFIFOQueue('d')"
+
+    def test_wrap_around(self) -> None:
+        tq: TypedFIFOQueue[int] = TypedFIFOQueue('q')
+        tq.reserve(8)
+        assert tq.capacity == 8
+        tq.extend(range(6))
+        assert tq.pop_many(5) == array('q', range(5))
+        tq.extend(range(6, 12))
+        assert tq.capacity == 8
+        first, second = tq.segments()
+        assert first.tolist() == [5, 6, 7] and second.tolist() == [8, 9, 10, 11]
+        assert list(tq) == list(range(5, 12))
+        assert memoryview(tq).tolist() == list(range(5, 12))
+        assert bytes(tq) == array('q', range(5, 12)).tobytes()
+        assert tq.segments()[1].tolist() == []
+        tq.push(12, 13)
+        assert tq.capacity == 16
+        assert tq.snapshot() == tuple(range(5, 14))
+        tq.shrink_to_fit()
+        assert tq.capacity == 9
+        copy = tq.copy()
+        copy.pop()
+        assert tq.snapshot() == tuple(range(5, 14))
+
+    def test_conversion_errors(self) -> None:
+        tq = FIFOQueue.typed('b', [1, 2])
+        try:
+            tq.push(3, 1000)
+            assert False
+        except OverflowError:
+            assert tq.snapshot() == (1, 2)
+        try:
+            tq.extend([3, 'four'])  # type: ignore[list-item]
+            assert False
+        except TypeError:
+            assert tq.snapshot() == (1, 2)
+        try:
+            FIFOQueue.typed('u')
+            assert False
+        except ValueError:
+            assert True
+        try:
+            for d in tq:
+                tq.push(d)
+            assert False
+        except RuntimeError:
+            assert len(tq) == 3
+
+    def test_lifo(self) -> None:
+        tq = LIFOQueue.typed('i', range(5))
+        assert isinstance(tq, TypedLIFOQueue)
+        assert tq.peak() == MayBe(4)
+        assert tq.snapshot() == (4, 3, 2, 1, 0)
+        assert tq.pop_many(2) == array('i', [4, 3])
+        tq.push(7)
+        assert tq.pop() == MayBe(7)
+        assert str(tq) == '|| 2 > 1 > 0 ><'
+        assert tq.map(lambda d: d + 1) == TypedLIFOQueue('i', [1, 2, 3])
+        assert tq.fold(lambda acc, d: acc * 10 + d) == MayBe(210)
+        assert memoryview(tq).tolist() == [0, 1, 2]
+
+    def test_de(self) -> None:
+        tq = DEQueue.typed('q')
+        assert isinstance(tq, TypedDEQueue)
+        tq.pushl(1, 2, 3)
+        tq.pushr(4, 5)
+        tq.extendl([6, 7])
+        tq.extendr([8])
+        assert tq.snapshot() == (7, 6, 3, 2, 1, 4, 5, 8)
+        assert list(reversed(tq)) == [8, 5, 4, 1, 2, 3, 6, 7]
+        assert tq.peakl() == MayBe(7) and tq.peakr() == MayBe(8)
+        assert tq.foldl(lambda acc, d: acc + str(d), '') == MayBe('76321458')
+        assert tq.foldr(lambda d, acc: acc + str(d), '') == MayBe('85412367')
+        assert tq.popl() == MayBe(7) and tq.popr() == MayBe(8)
+        assert tq.popl_many(2) == array('q', [6, 3])
+        assert tq.popr_many(2) == array('q', [5, 4])
+        assert tq.popl_or(0) == 2 and tq.popr_or(0) == 1
+        assert tq.popl_or(0) == 0 and tq.popr() == MayBe()
+        assert tq == TypedDEQueue('q')
+        assert tq != TypedFIFOQueue('q')
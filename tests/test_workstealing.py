@@ -0,0 +1,164 @@
+# Copyright 2023-2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import subprocess
+import sys
+import threading
+import weakref
+from concurrent.futures import Future
+from pythonic_fp.fptools.maybe import MayBe
+from pythonic_fp.queues.workstealing import WorkStealingDEQueue, WorkStealingExecutor
+
+
+class TestWorkStealingDEQueue:
+    def test_ends(self) -> None:
+        wq: WorkStealingDEQueue[int] = WorkStealingDEQueue()
+        assert not wq and len(wq) == 0
+        assert wq.pop() == MayBe() and wq.steal() == MayBe()
+        assert wq.pop_or(-1) == -1 and wq.steal_half() == ()
+        wq.push(1, 2, 3, 4, 5)
+        assert wq and len(wq) == 5
+        assert wq.snapshot() == (1, 2, 3, 4, 5)
+        assert wq.pop() == MayBe(5)
+        assert wq.steal() == MayBe(1)
+        assert wq.steal_half() == (2, 3)
+        wq.push(6, 7, 8)
+        assert wq.steal_half() == (4, 6)
+        assert wq.pop_or(-1) == 8
+        assert wq.steal_half() == (7,)
+        assert not wq
+
+    def test_owner_and_thieves(self) -> None:
+        wq: WorkStealingDEQueue[int] = WorkStealingDEQueue()
+        n, thieves = 20_000, 3
+        done = threading.Event()
+        stolen: list[list[int]] = [[] for _ in range(thieves)]
+
+        def steal(t: int) -> None:
+            while not done.is_set() or wq:
+                stolen[t].extend(wq.steal_half())
+
+        pool = [threading.Thread(target=steal, args=(t,)) for t in range(thieves)]
+        for thread in pool:
+            thread.start()
+        owned: list[int] = []
+        for ii in range(n):
+            wq.push(ii)
+            if ii % 3 == 0:
+                owned.extend(wq.pop())
+        done.set()
+        for thread in pool:
+            thread.join()
+        got = owned + [d for ds in stolen for d in ds]
+        assert sorted(got) == list(range(n))
+        for ds in stolen:
+            assert ds == sorted(ds)
+
+
+class TestWorkStealingExecutor:
+    def test_map_and_exceptions(self) -> None:
+        with WorkStealingExecutor(4) as pool:
+            xs = range(-50, 50)
+            assert list(pool.map(abs, xs)) == [abs(x) for x in xs]
+            future = pool.submit(divmod, 1, 0)
+            assert isinstance(future.exception(), ZeroDivisionError)
+            assert pool.submit(sum, range(10), start=5).result() == 50
+
+    def test_external_submits_fifo(self) -> None:
+        pool = WorkStealingExecutor(1)
+        gate = threading.Event()
+        order: list[int] = []
+        pool.submit(gate.wait)
+        for ii in range(10):
+            pool.submit(order.append, ii)
+        gate.set()
+        pool.shutdown()
+        assert order == list(range(10))
+
+    def test_fan_out_from_workers(self) -> None:
+        count: list[int] = []
+        with WorkStealingExecutor(4) as pool:
+
+            def spawn(depth: int) -> None:
+                count.append(depth)
+                if depth:
+                    pool.submit(spawn, depth - 1)
+                    pool.submit(spawn, depth - 1)
+
+            pool.submit(spawn, 10)
+        assert len(count) == 2**11 - 1
+
+    def test_shutdown(self) -> None:
+        pool = WorkStealingExecutor(1)
+        gate, running = threading.Event(), threading.Event()
+
+        def hold() -> bool:
+            running.set()
+            return gate.wait()
+
+        started: Future[bool] = pool.submit(hold)
+        running.wait()
+        futures = [pool.submit(int) for _ in range(10)]
+        pool.shutdown(wait=False, cancel_futures=True)
+        gate.set()
+        assert started.result()
+        assert all(f.cancelled() for f in futures)
+        try:
+            pool.submit(int)
+        except RuntimeError:
+            pass
+        else:
+            assert False
+
+    def test_forgotten_executor(self) -> None:
+        pool = WorkStealingExecutor(2, thread_name_prefix='forgotten')
+        threads = [t for t in threading.enumerate() if t.name.startswith('forgotten')]
+        assert len(threads) == 2
+        gate = threading.Event()
+        futures = [pool.submit(gate.wait) for _ in range(4)]
+        ref = weakref.ref(pool)
+        del pool
+        gc.collect()
+        assert ref() is None
+        gate.set()
+        for thread in threads:
+            thread.join(timeout=5.0)
+            assert not thread.is_alive()
+        assert all(f.result() for f in futures)
+
+    def test_work_runs_at_exit(self) -> None:
+        script = (
+            'import time\n'
+            'from pythonic_fp.queues.workstealing import WorkStealingExecutor\n'
+            'pool = WorkStealingExecutor(1)\n'
+            'pool.submit(time.sleep, 0.2)\n'
+            "pool.submit(print, 'ran', flush=True)\n"
+        )
+        done = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=30,
+        )
+        assert done.returncode == 0 and done.stdout == 'ran\n'
+
+    def test_bad_max_workers(self) -> None:
+        try:
+            WorkStealingExecutor(0)
+        except ValueError:
+            pass
+        else:
+            assert False